@@ -6,3 +6,4 @@ from . import constants
 from . import utils
 from . import geography
 from . import gravity
+from . import propagation
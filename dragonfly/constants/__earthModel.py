@@ -12,7 +12,7 @@ _EllipsoidParameters = namedtuple("_EllipsoidParameters", (
     "name",
     "semiMajorAxis",
     "flattening",
-    "j2",
+    "zonals",       # zonal harmonics (J2, J3, ...) of the gravity field
 ))
 
 # ------------------------  EARTH MODELS  ------------------------
@@ -25,16 +25,21 @@ _ELLIPSOIDS = [
         name="WGS84",
         semiMajorAxis=6378137.0,
         flattening=1/298.257223563,
-        j2=1.08263E-3,
+        # J3 to J6 from the JGM-3 model
+        zonals=(1.08263E-3, -2.53215306E-6, -1.61098761E-6, -2.2357866E-7,
+                5.4316985E-7),
     ),
     _EllipsoidParameters(
         name="SPHERICAL",
         semiMajorAxis=6378137.0,
         flattening=0.0,
-        j2=0.0,
+        zonals=(0.0, 0.0, 0.0, 0.0, 0.0),
     )
 ]
 
+# lookup of the ellipsoid parameters by name
+_ELLIPSOIDS_BY_NAME = {ellipsoid.name: ellipsoid for ellipsoid in _ELLIPSOIDS}
+
 # -------------------------------------------------------------------
 #                       EARTH MODEL
 # -------------------------------------------------------------------
@@ -78,7 +83,7 @@ class EarthModel():
             msg = f"the model value {value} is not an appropriate string"
             raise AttributeError(msg) from exc
 
-        if value in [ellipsoid.name for ellipsoid in _ELLIPSOIDS]:
+        if value in _ELLIPSOIDS_BY_NAME:
             self._model = value.upper()
         else:
             msg = (f"the model {value.upper()}"
@@ -95,9 +100,7 @@ class EarthModel():
         Returns:
             float: semi major axis value of the ellispoid in meters
         """
-        model = next(item for item in _ELLIPSOIDS
-                     if item.name == self.model)
-        return model.semiMajorAxis
+        return _ELLIPSOIDS_BY_NAME[self.model].semiMajorAxis
 
     @property
     def f(self) -> float:
@@ -106,9 +109,7 @@ class EarthModel():
         Returns:
             float: flattening of the ellispoid
         """
-        model = next(item for item in _ELLIPSOIDS
-                     if item.name == self.model)
-        return model.flattening
+        return _ELLIPSOIDS_BY_NAME[self.model].flattening
 
     @property
     def b(self) -> float:
@@ -135,8 +136,25 @@ class EarthModel():
         Returns:
             float: Second gravitationla constant
         """
-        model = next(item for item in _ELLIPSOIDS
-                     if item.name == self.model)
-        return model.j2
+        return _ELLIPSOIDS_BY_NAME[self.model].zonals[0]
+
+    @property
+    def zonals(self) -> tuple:
+        """Zonal harmonics of the gravity field (J2, J3, ..., Jn) with
+        Jn = zonals[n - 2]
+
+        Returns:
+            tuple: zonal harmonics from the degree 2
+        """
+        return _ELLIPSOIDS_BY_NAME[self.model].zonals
+
+    @property
+    def maxDegree(self) -> int:
+        """Highest degree of the zonal harmonics of the gravity field
+
+        Returns:
+            int: highest degree of the zonal harmonics
+        """
+        return len(self.zonals) + 1
 
     # pylint: enable=invalid-name
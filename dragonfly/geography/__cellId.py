@@ -0,0 +1,266 @@
+"""
+# ======================================================================= #
+# ==================== HIERARCHICAL GEODETIC TILING ===================== #
+# ======================================================================= #
+
+Quadtree cells on the geodetic latitude / longitude plane. The root level
+(level 0) has two faces: the western (longitude in [-pi, 0[) and the
+eastern (longitude in [0, pi[) hemispheres. At each level, a cell is split
+in 4 children. The cell ID (int64) is the Morton code (latitude bits in
+the odd positions) of the cell in its face, prefixed by the face bit and a
+sentinel bit giving the level:
+
+    cellId = 1 << (2 * level + 1) | face << (2 * level) | morton
+
+so that the parent of a cell is cellId >> 2 and that the IDs of a level
+are sorted along a Z-order curve (cells close in space share a prefix).
+"""
+
+# EXPORT
+__all__ = [
+    "getCellId",
+    "getCellLevel",
+    "getCellParent",
+    "getCellChildren",
+    "getCellNeighbours",
+    "getCellBounds",
+]
+
+# IMPORT
+import numpy as np
+import dragonfly
+
+
+# PARAMETERS
+_MAX_LEVEL = 30     # 2 * level + 2 bits in a signed int64
+
+
+# -------------------------------------------------------------------------
+#                                 TOOLS
+# -------------------------------------------------------------------------
+
+def _validateLevel(level: int) -> int:
+    """PRIVATE FUNCTION - check the level of a cell"""
+    level = dragonfly.utils.validation.validateInteger(level)
+    if not 0 <= level <= _MAX_LEVEL:
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg="The level of the cells is out of range",
+            expected=f"0 <= level <= {_MAX_LEVEL}",
+            current=str(level),
+        )
+        raise ValueError(msg)
+    return level
+
+
+def _spreadBits(x: np.ndarray) -> np.ndarray:
+    """PRIVATE FUNCTION - insert a zero bit between the 32 lower bits"""
+    x = x.astype(np.uint64) & np.uint64(0x00000000FFFFFFFF)
+    x = (x | (x << np.uint64(16))) & np.uint64(0x0000FFFF0000FFFF)
+    x = (x | (x << np.uint64(8))) & np.uint64(0x00FF00FF00FF00FF)
+    x = (x | (x << np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    x = (x | (x << np.uint64(2))) & np.uint64(0x3333333333333333)
+    x = (x | (x << np.uint64(1))) & np.uint64(0x5555555555555555)
+    return x
+
+
+def _compactBits(x: np.ndarray) -> np.ndarray:
+    """PRIVATE FUNCTION - inverse of _spreadBits (even bits)"""
+    x = x.astype(np.uint64) & np.uint64(0x5555555555555555)
+    x = (x | (x >> np.uint64(1))) & np.uint64(0x3333333333333333)
+    x = (x | (x >> np.uint64(2))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    x = (x | (x >> np.uint64(4))) & np.uint64(0x00FF00FF00FF00FF)
+    x = (x | (x >> np.uint64(8))) & np.uint64(0x0000FFFF0000FFFF)
+    x = (x | (x >> np.uint64(16))) & np.uint64(0x00000000FFFFFFFF)
+    return x.astype(np.int64)
+
+
+def _encode(level: np.ndarray, face: np.ndarray, row: np.ndarray,
+            column: np.ndarray) -> np.ndarray:
+    """PRIVATE FUNCTION - cell ID from the level, the face and the row
+    (latitude) and column (longitude) in the face"""
+    morton = (_spreadBits(column) | (_spreadBits(row) << np.uint64(1)))
+    level = level.astype(np.int64)
+    return ((np.int64(1) << (2 * level + 1)) |
+            (face.astype(np.int64) << (2 * level)) |
+            morton.astype(np.int64))
+
+
+def _decode(cellId: np.ndarray) -> tuple:
+    """PRIVATE FUNCTION - level, face, row and column of cells"""
+    level = getCellLevel(cellId)
+    morton = cellId & ((np.int64(1) << (2 * level)) - 1)
+    face = (cellId >> (2 * level)) & 1
+    row = _compactBits(morton.astype(np.uint64) >> np.uint64(1))
+    column = _compactBits(morton)
+    return level, face, row, column
+
+
+def _asCellIdArray(cellId) -> np.ndarray:
+    """PRIVATE FUNCTION - provide cell IDs as an int64 numpy array"""
+    cellId = np.asarray(cellId)
+    if not np.issubdtype(cellId.dtype, np.integer):
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg="The cell IDs shall be integers",
+            expected="int64 array",
+            current=f"{cellId.dtype}",
+        )
+        raise TypeError(msg)
+    return cellId.astype(np.int64)
+
+
+# -------------------------------------------------------------------------
+#                                CELL IDS
+# -------------------------------------------------------------------------
+
+def getCellId(latitude, longitude, level: int) -> np.ndarray:
+    """Compute the IDs of the cells containing geographic positions
+
+    Args:
+        latitude (array_like): latitudes in radians
+        longitude (array_like): longitudes in radians
+        level (int): level of the cells (0 to 30, the cells of the level L
+            are pi/2^L radians wide in latitude and longitude)
+
+    Returns:
+        np.ndarray: cell IDs (int64)
+    """
+    level = _validateLevel(level)
+    latitude, longitude = np.broadcast_arrays(
+        np.asarray(latitude, dtype=np.float64),
+        np.asarray(longitude, dtype=np.float64))
+
+    if not np.all(np.abs(latitude) <= np.pi/2):
+        raise ValueError("Latitudes Value shall be lower than 90")
+
+    size = 1 << level
+
+    # longitude in [0, 2 pi[ from the western face
+    longitude = np.mod(longitude + np.pi, 2 * np.pi)
+    column = np.floor(longitude * (2 * size / (2 * np.pi))).astype(np.int64)
+    column = np.clip(column, 0, 2 * size - 1)
+    row = np.floor((latitude + np.pi/2) * (size / np.pi)).astype(np.int64)
+    row = np.clip(row, 0, size - 1)
+
+    return _encode(np.full(row.shape, level), column >> level, row,
+                   column & (size - 1))
+
+
+def getCellLevel(cellId) -> np.ndarray:
+    """Provide the level of cells
+
+    Args:
+        cellId (array_like): cell IDs
+
+    Returns:
+        np.ndarray: levels of the cells
+    """
+    cellId = _asCellIdArray(cellId)
+    if not np.all(cellId >= 2):
+        raise ValueError("The cell IDs shall be valid (at least 2)")
+
+    # bit length of the IDs (corrected for the float rounding)
+    _, nbBits = np.frexp(cellId.astype(np.float64))
+    nbBits = nbBits.astype(np.int64)
+    nbBits = np.where((np.int64(1) << (nbBits - 1)) > cellId,
+                      nbBits - 1, nbBits)
+
+    if not np.all(nbBits % 2 == 0):
+        raise ValueError("The cell IDs shall be valid (sentinel bit)")
+
+    return (nbBits - 2) // 2
+
+
+def getCellParent(cellId, level: int = None) -> np.ndarray:
+    """Provide the parents of cells
+
+    Args:
+        cellId (array_like): cell IDs
+        level (int, optional): level of the parents. Defaults to the level
+            of the cells minus one.
+
+    Returns:
+        np.ndarray: cell IDs of the parents
+    """
+    cellId = _asCellIdArray(cellId)
+    cellLevel = getCellLevel(cellId)
+    if level is None:
+        level = cellLevel - 1
+    else:
+        level = _validateLevel(level)
+
+    if not np.all((level >= 0) & (level <= cellLevel)):
+        raise ValueError("The level of the parents shall be in"
+                         " [0, level of the cells]")
+
+    return cellId >> (2 * (cellLevel - level))
+
+
+def getCellChildren(cellId) -> np.ndarray:
+    """Provide the 4 children of cells
+
+    Args:
+        cellId (array_like): cell IDs
+
+    Returns:
+        np.ndarray: cell IDs of the children [... x 4]
+    """
+    cellId = _asCellIdArray(cellId)
+    if not np.all(getCellLevel(cellId) < _MAX_LEVEL):
+        raise ValueError(f"The level of the cells shall be lower than"
+                         f" {_MAX_LEVEL}")
+
+    return (cellId[..., np.newaxis] << 2) | np.arange(4, dtype=np.int64)
+
+
+def getCellNeighbours(cellId) -> np.ndarray:
+    """Provide the 8 neighbours of cells of the same level (wrapped in
+    longitude). The neighbours beyond the poles are set to -1
+
+    Args:
+        cellId (array_like): cell IDs
+
+    Returns:
+        np.ndarray: cell IDs of the neighbours [... x 8] in the order
+            S-W, S, S-E, W, E, N-W, N, N-E
+    """
+    cellId = _asCellIdArray(cellId)
+    level, face, row, column = _decode(cellId)
+    size = np.int64(1) << level
+
+    # global column over the two faces
+    column = face * size + column
+
+    offsets = np.array([(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1),
+                        (1, -1), (1, 0), (1, 1)], dtype=np.int64)
+    row = row[..., np.newaxis] + offsets[:, 0]
+    column = np.mod(column[..., np.newaxis] + offsets[:, 1],
+                    2 * size[..., np.newaxis])
+    size = size[..., np.newaxis]
+    level = np.broadcast_to(level[..., np.newaxis], row.shape)
+
+    valid = (row >= 0) & (row < size)
+    neighbours = _encode(level, column // size, np.where(valid, row, 0),
+                         column % size)
+    return np.where(valid, neighbours, -1)
+
+
+def getCellBounds(cellId) -> np.ndarray:
+    """Provide the bounding boxes of cells
+
+    Args:
+        cellId (array_like): cell IDs
+
+    Returns:
+        np.ndarray: bounding boxes [... x 4] as [minimum latitude, maximum
+            latitude, minimum longitude, maximum longitude] in radians
+    """
+    cellId = _asCellIdArray(cellId)
+    level, face, row, column = _decode(cellId)
+    step = np.pi / (np.int64(1) << level)
+
+    bounds = np.empty(cellId.shape + (4,), dtype=np.float64)
+    bounds[..., 0] = row * step - np.pi/2
+    bounds[..., 1] = (row + 1) * step - np.pi/2
+    bounds[..., 2] = (face - 1) * np.pi + column * step
+    bounds[..., 3] = (face - 1) * np.pi + (column + 1) * step
+    return bounds
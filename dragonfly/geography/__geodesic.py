@@ -0,0 +1,884 @@
+"""
+# ======================================================================= #
+# ===================== GEODESIC PROBLEMS (KARNEY) ====================== #
+# ======================================================================= #
+
+Vectorized solution of the geodesic problems on an ellipsoid of revolution
+following C. F. F. Karney, "Algorithms for geodesics", J. Geodesy 87 (2013)
+(series of order 6 in the third flattening, as in GeographicLib).
+"""
+
+# EXPORT
+__all__ = [
+    "getInverseGeodesic",
+    "getDirectGeodesic",
+]
+
+# IMPORT
+import sys
+import math
+import functools
+from collections import namedtuple
+import numpy as np
+import dragonfly
+
+
+# PARAMETERS
+_DEFAULT_MODEL = dragonfly.constants.DEFAULT_SETTINGS.EarthEllipsoid
+
+_ORDER = 6                                      # order of the series
+_MAXIT1 = 20                                    # Newton iterations
+_MAXIT2 = _MAXIT1 + sys.float_info.mant_dig + 10  # + bisection iterations
+_TINY = math.sqrt(sys.float_info.min)
+_TOL0 = sys.float_info.epsilon
+_TOL1 = 200 * _TOL0
+_TOL2 = math.sqrt(_TOL0)
+_TOLB = _TOL0
+_XTHRESH = 1000 * _TOL2
+
+_GeodesicConstants = namedtuple("_GeodesicConstants", (
+    "a",        # semi major axis
+    "f",        # flattening
+    "f1",       # 1 - f
+    "ep2",      # square of the second eccentricity
+    "n",        # third flattening
+    "b",        # semi minor axis
+    "etol2",    # tolerance of the short line solution
+    "A3x",      # coefficients of A3
+    "C3x",      # coefficients of C3
+))
+
+
+# -------------------------------------------------------------------------
+#                            ELLIPSOID CONSTANTS
+# -------------------------------------------------------------------------
+
+def _getConstants(earth_model: str) -> _GeodesicConstants:
+    """PRIVATE FUNCTION - get the (cached) constants of the series for an
+    ellipsoid model"""
+    earth = dragonfly.constants.EarthModel(earth_model)
+    if earth.f < 0:
+        msg = ("Geodesic calculation is only implemented for oblate"
+               f" ellipsoids [flattening: {earth.f}]")
+        raise ValueError(msg)
+    return _computeConstants(earth.a, earth.f)
+
+
+@functools.lru_cache(maxsize=None)
+def _computeConstants(a: float, f: float) -> _GeodesicConstants:
+    """PRIVATE FUNCTION - compute the constants of the series"""
+    f1 = 1 - f
+    e2 = f * (2 - f)
+    n = f / (2 - f)
+    etol2 = 0.1 * _TOL2 / math.sqrt(max(0.001, abs(f)) *
+                                    min(1.0, 1 - f / 2) / 2)
+
+    # A3 coefficients
+    coeff = [
+        -3, 128,
+        -2, -3, 64,
+        -1, -3, -1, 16,
+        3, -1, -2, 8,
+        1, -1, 2,
+        1, 1,
+    ]
+    A3x = []
+    o = 0
+    for j in range(_ORDER - 1, -1, -1):     # coeff of eps^j
+        m = min(_ORDER - j - 1, j)          # order of polynomial in n
+        A3x.append(_polyval(m, coeff, o, n) / coeff[o + m + 1])
+        o += m + 2
+
+    # C3 coefficients
+    coeff = [
+        3, 128,
+        2, 5, 128,
+        -1, 3, 3, 64,
+        -1, 0, 1, 8,
+        -1, 1, 4,
+        5, 256,
+        1, 3, 128,
+        -3, -2, 3, 64,
+        1, -3, 2, 32,
+        7, 512,
+        -10, 9, 384,
+        5, -9, 5, 192,
+        7, 512,
+        -14, 7, 512,
+        21, 2560,
+    ]
+    C3x = []
+    o = 0
+    for i in range(1, _ORDER):                  # i is index of C3[i]
+        for j in range(_ORDER - 1, i - 1, -1):  # coeff of eps^j
+            m = min(_ORDER - j - 1, j)          # order of polynomial in n
+            C3x.append(_polyval(m, coeff, o, n) / coeff[o + m + 1])
+            o += m + 2
+
+    return _GeodesicConstants(a=a, f=f, f1=f1, ep2=e2 / f1**2, n=n,
+                              b=a * f1, etol2=etol2,
+                              A3x=tuple(A3x), C3x=tuple(C3x))
+
+
+# -------------------------------------------------------------------------
+#                              ANGLES TOOLS
+# -------------------------------------------------------------------------
+
+def _polyval(N: int, p, s: int, x):
+    """PRIVATE FUNCTION - evaluate the polynomial p[s:s+N+1] (Horner)"""
+    y = 0.0 if N < 0 else float(p[s])
+    while N > 0:
+        N -= 1
+        s += 1
+        y = y * x + p[s]
+    return y
+
+
+def _norm(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """PRIVATE FUNCTION - normalize a two-vector"""
+    r = np.hypot(x, y)
+    return x / r, y / r
+
+
+def _remainder(x: np.ndarray, y: float) -> np.ndarray:
+    """PRIVATE FUNCTION - remainder of x/y in the range [-y/2, y/2]"""
+    return x - y * np.round(x / y)
+
+
+def _angRound(x: np.ndarray) -> np.ndarray:
+    """PRIVATE FUNCTION - round an angle so that small values underflow to
+    zero"""
+    z = 1 / 16.0
+    y = np.abs(x)
+    y = np.where(y < z, z - (z - y), y)
+    return np.copysign(y, x)
+
+
+def _angDiff(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """PRIVATE FUNCTION - compute y - x (degrees) reduced to [-180,180]
+    accurately (error free sum)"""
+    def errorFreeSum(u, v):
+        s = u + v
+        up = s - v
+        vpp = s - up
+        up = up - u
+        vpp = vpp - v
+        return s, np.where(s == 0, s, 0.0 - (up + vpp))
+
+    d, t = errorFreeSum(_remainder(-x, 360), _remainder(y, 360))
+    d, t = errorFreeSum(_remainder(d, 360), t)
+    d = np.where((d == 0) | (np.abs(d) == 180),
+                 np.copysign(d, np.where(t == 0, y - x, -t)), d)
+    return d, t
+
+
+def _rotateQuadrant(q: np.ndarray, s: np.ndarray,
+                    c: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """PRIVATE FUNCTION - rotate (sin, cos) by q quarter of turn"""
+    q = q.astype(np.int64) % 4
+    sNew = np.select([q == 1, q == 2, q == 3], [c, -s, -c], s)
+    cNew = np.select([q == 1, q == 2, q == 3], [-s, -c, s], c)
+    return sNew, cNew + 0.0
+
+
+def _sincosd(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """PRIVATE FUNCTION - sine and cosine of x in degrees (exact for the
+    multiples of 90 degrees)"""
+    r = np.fmod(x, 360)
+    q = np.round(r / 90)
+    r = np.radians(r - 90 * q)
+    s, c = _rotateQuadrant(q, np.sin(r), np.cos(r))
+    return np.where(s == 0, np.copysign(s, x), s), c
+
+
+def _sincosde(x: np.ndarray, t: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """PRIVATE FUNCTION - sine and cosine of (x + t) in degrees with x in
+    [-180, 180]"""
+    q = np.round(x / 90)
+    r = np.radians(_angRound(x - 90 * q + t))
+    s, c = _rotateQuadrant(q, np.sin(r), np.cos(r))
+    return np.where(s == 0, np.copysign(s, x), s), c
+
+
+# -------------------------------------------------------------------------
+#                                 SERIES
+# -------------------------------------------------------------------------
+
+def _sinCosSeries(sinp: bool, sinx, cosx, c: list):
+    """PRIVATE FUNCTION - evaluate a trigonometric series using Clenshaw
+    summation"""
+    k = len(c)
+    n = k - sinp
+    ar = 2 * (cosx - sinx) * (cosx + sinx)  # 2 * cos(2 * x)
+    y1 = 0
+    if n & 1:
+        k -= 1
+        y0 = c[k]
+    else:
+        y0 = 0
+    n = n // 2
+    while n:
+        n -= 1
+        k -= 1
+        y1 = ar * y0 - y1 + c[k]
+        k -= 1
+        y0 = ar * y1 - y0 + c[k]
+    return 2 * sinx * cosx * y0 if sinp else cosx * (y0 - y1)
+
+
+def _seriesCoefficients(coeff: list, eps) -> list:
+    """PRIVATE FUNCTION - coefficients c[1..ORDER] of a series in eps
+    defined by the polynomials coeff (C1, C1p, C2)"""
+    eps2 = eps**2
+    d = eps
+    o = 0
+    c = [0.0]
+    for i in range(1, _ORDER + 1):      # i is index of c[i]
+        m = (_ORDER - i) // 2           # order of polynomial in eps^2
+        c.append(d * _polyval(m, coeff, o, eps2) / coeff[o + m + 1])
+        o += m + 2
+        d = d * eps
+    return c
+
+
+def _A1m1f(eps):
+    """PRIVATE FUNCTION - A1 - 1"""
+    t = _polyval(_ORDER // 2, [1, 4, 64, 0, 256], 0, eps**2) / 256
+    return (t + eps) / (1 - eps)
+
+
+def _C1f(eps) -> list:
+    """PRIVATE FUNCTION - coefficients C1"""
+    return _seriesCoefficients([
+        -1, 6, -16, 32,
+        -9, 64, -128, 2048,
+        9, -16, 768,
+        3, -5, 512,
+        -7, 1280,
+        -7, 2048,
+    ], eps)
+
+
+def _C1pf(eps) -> list:
+    """PRIVATE FUNCTION - coefficients C1' (inverse of the C1 series)"""
+    return _seriesCoefficients([
+        205, -432, 768, 1536,
+        4005, -4736, 3840, 12288,
+        -225, 116, 384,
+        -7173, 2695, 7680,
+        3467, 7680,
+        38081, 61440,
+    ], eps)
+
+
+def _A2m1f(eps):
+    """PRIVATE FUNCTION - A2 - 1"""
+    t = _polyval(_ORDER // 2, [-11, -28, -192, 0, 256], 0, eps**2) / 256
+    return (t - eps) / (1 + eps)
+
+
+def _C2f(eps) -> list:
+    """PRIVATE FUNCTION - coefficients C2"""
+    return _seriesCoefficients([
+        1, 2, 16, 32,
+        35, 64, 384, 2048,
+        15, 80, 768,
+        7, 35, 512,
+        63, 1280,
+        77, 2048,
+    ], eps)
+
+
+def _A3f(geod: _GeodesicConstants, eps):
+    """PRIVATE FUNCTION - A3"""
+    return _polyval(_ORDER - 1, geod.A3x, 0, eps)
+
+
+def _C3f(geod: _GeodesicConstants, eps) -> list:
+    """PRIVATE FUNCTION - coefficients C3"""
+    mult = 1
+    o = 0
+    c = [0.0]
+    for i in range(1, _ORDER):          # i is index of C3[i]
+        m = _ORDER - i - 1              # order of polynomial in eps
+        mult = mult * eps
+        c.append(mult * _polyval(m, geod.C3x, o, eps))
+        o += m + 1
+    return c
+
+
+def _epsilon(geod: _GeodesicConstants, k2):
+    """PRIVATE FUNCTION - expansion parameter eps from k^2"""
+    k2 = k2 * geod.ep2
+    return k2 / (2 * (1 + np.sqrt(1 + k2)) + k2)
+
+
+# -------------------------------------------------------------------------
+#                             INVERSE PROBLEM
+# -------------------------------------------------------------------------
+
+def getInverseGeodesic(lat1, long1, lat2, long2,
+                       earth_model: str = _DEFAULT_MODEL
+                       ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Solve the inverse geodesic problem (distance and azimuths between
+    two points) with Karney's algorithm for arrays of pairs of points.
+
+    Contrary to the Vincenty formula, the method converges for all the
+    pairs (including near antipodal points) with a bounded cost: a few
+    Newton iterations (typically 2 to 4, at most 20) safeguarded by a
+    bisection. The accuracy is about 15 nanometers for WGS84.
+
+    Args:
+        lat1 (array_like): initial latitudes in radians
+        long1 (array_like): initial longitudes in radians
+        lat2 (array_like): final latitudes in radians
+        long2 (array_like): final longitudes in radians
+        earth_model (str, optional): name of the Ellipsoid model.
+            Defaults to "WGS84".
+
+    Returns:
+        np.ndarray: distances in meters
+        np.ndarray: azimuths at the initial points in radians
+            (clockwise from North)
+        np.ndarray: azimuths at the final points in radians
+            (clockwise from North)
+    """
+    lat1, long1, lat2, long2 = np.broadcast_arrays(
+        *[np.asarray(value, dtype=np.float64)
+          for value in (lat1, long1, lat2, long2)])
+    shape = lat1.shape
+
+    # latitue assertion
+    if not (np.all(np.abs(lat1) <= np.pi/2) and
+            np.all(np.abs(lat2) <= np.pi/2)):
+        msg = "Latitudes Value shall be lower than 90"
+        raise ValueError(msg)
+
+    geod = _getConstants(earth_model)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s12, salp1, calp1, salp2, calp2 = _inverse(
+            geod,
+            np.degrees(lat1.ravel()), np.degrees(long1.ravel()),
+            np.degrees(lat2.ravel()), np.degrees(long2.ravel()))
+
+    return (s12.reshape(shape),
+            np.arctan2(salp1, calp1).reshape(shape),
+            np.arctan2(salp2, calp2).reshape(shape))
+
+
+def _lengths(geod: _GeodesicConstants, eps, sig12,
+             ssig1, csig1, dn1, ssig2, csig2, dn2):
+    """PRIVATE FUNCTION - reduced distance s12/b and reduced length m12/b"""
+    A1 = _A1m1f(eps)
+    C1a = _C1f(eps)
+    A2 = _A2m1f(eps)
+    C2a = _C2f(eps)
+    m0x = A1 - A2
+    A1 = 1 + A1
+    A2 = 1 + A2
+
+    B1 = (_sinCosSeries(True, ssig2, csig2, C1a) -
+          _sinCosSeries(True, ssig1, csig1, C1a))
+    s12b = A1 * (sig12 + B1)
+    B2 = (_sinCosSeries(True, ssig2, csig2, C2a) -
+          _sinCosSeries(True, ssig1, csig1, C2a))
+    J12 = m0x * sig12 + (A1 * B1 - A2 * B2)
+    m12b = (dn2 * (csig1 * ssig2) - dn1 * (ssig1 * csig2) -
+            csig1 * csig2 * J12)
+    return s12b, m12b
+
+
+def _astroid(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """PRIVATE FUNCTION - solve the astroid equation (starting point of the
+    nearly antipodal points)"""
+    p = x**2
+    q = y**2
+    r = (p + q - 1) / 6
+    S = p * q / 4
+    r2 = r**2
+    r3 = r * r2
+    disc = S * (S + 2 * r3)
+
+    # disc >= 0
+    T3 = S + r3
+    T3 = T3 + np.copysign(np.sqrt(np.maximum(disc, 0)), T3)
+    T = np.cbrt(T3)
+    uPos = r + T + np.where(T != 0, r2 / T, 0)
+
+    # disc < 0
+    ang = np.arctan2(np.sqrt(np.maximum(-disc, 0)), -(S + r3))
+    uNeg = r + 2 * r * np.cos(ang / 3)
+
+    u = np.where(disc >= 0, uPos, uNeg)
+    v = np.sqrt(u**2 + q)
+    uv = np.where(u < 0, q / (v - u), u + v)
+    w = (uv - q) / (2 * v)
+    k = uv / (np.sqrt(uv + w**2) + w)
+    return np.where((q == 0) & (r <= 0), 0.0, k)
+
+
+def _inverseStart(geod: _GeodesicConstants, sbet1, cbet1, sbet2, cbet2,
+                  lam12, slam12, clam12):
+    """PRIVATE FUNCTION - starting point of the Newton method (and solution
+    of the short lines)"""
+    sig12 = np.full(sbet1.shape, -1.0)
+    salp2 = np.full(sbet1.shape, np.nan)
+    calp2 = np.full(sbet1.shape, np.nan)
+
+    sbet12 = sbet2 * cbet1 - cbet2 * sbet1
+    cbet12 = cbet2 * cbet1 + sbet2 * sbet1
+    sbet12a = sbet2 * cbet1 + cbet2 * sbet1
+
+    shortline = (cbet12 >= 0) & (sbet12 < 0.5) & (cbet2 * lam12 < 0.5)
+    sbetm2 = (sbet1 + sbet2)**2
+    sbetm2 = sbetm2 / (sbetm2 + (cbet1 + cbet2)**2)
+    dnm = np.where(shortline, np.sqrt(1 + geod.ep2 * sbetm2), np.nan)
+    omg12 = lam12 / (geod.f1 * dnm)
+    somg12 = np.where(shortline, np.sin(omg12), slam12)
+    comg12 = np.where(shortline, np.cos(omg12), clam12)
+
+    salp1 = cbet2 * somg12
+    calp1 = np.where(
+        comg12 >= 0,
+        sbet12 + cbet2 * sbet1 * somg12**2 / (1 + comg12),
+        sbet12a - cbet2 * sbet1 * somg12**2 / (1 - comg12))
+
+    ssig12 = np.hypot(salp1, calp1)
+    csig12 = sbet1 * sbet2 + cbet1 * cbet2 * comg12
+
+    # short lines: direct solution
+    short = shortline & (ssig12 < geod.etol2)
+    salp2s, calp2s = _norm(
+        cbet1 * somg12,
+        sbet12 - cbet1 * sbet2 * np.where(comg12 >= 0,
+                                          somg12**2 / (1 + comg12),
+                                          1 - comg12))
+    salp2 = np.where(short, salp2s, salp2)
+    calp2 = np.where(short, calp2s, calp2)
+    sig12 = np.where(short, np.arctan2(ssig12, csig12), sig12)
+
+    # nearly antipodal points: astroid
+    antipodal = ~short & ~((abs(geod.n) >= 0.1) | (csig12 >= 0) |
+                           (ssig12 >= 6 * abs(geod.n) * np.pi * cbet1**2))
+    idx = np.flatnonzero(antipodal)
+    if idx.size:
+        sb1, cb1, cb2 = sbet1[idx], cbet1[idx], cbet2[idx]
+        lam12x = np.arctan2(-slam12[idx], -clam12[idx])
+        eps = _epsilon(geod, sb1**2)
+        lamscale = geod.f * cb1 * _A3f(geod, eps) * np.pi
+        betscale = lamscale * cb1
+        x = lam12x / lamscale
+        y = sbet12a[idx] / betscale
+
+        k = _astroid(x, y)
+        omg12a = lamscale * (-x * k / (1 + k))
+        somg12a = np.sin(omg12a)
+        comg12a = -np.cos(omg12a)
+
+        close = (y > -_TOL1) & (x > -1 - _XTHRESH)
+        salp1Close = np.minimum(1.0, -x)
+        salp1[idx] = np.where(close, salp1Close, cb2 * somg12a)
+        calp1[idx] = np.where(
+            close, -np.sqrt(1 - salp1Close**2),
+            sbet12a[idx] - cb2 * sb1 * somg12a**2 / (1 - comg12a))
+
+    salp1n, calp1n = _norm(salp1, calp1)
+    valid = ~(salp1 <= 0)
+    salp1 = np.where(valid, salp1n, 1.0)
+    calp1 = np.where(valid, calp1n, 0.0)
+
+    return sig12, salp1, calp1, salp2, calp2, dnm
+
+
+def _lambda12(geod: _GeodesicConstants, sbet1, cbet1, dn1,
+              sbet2, cbet2, dn2, salp1, calp1, slam120, clam120):
+    """PRIVATE FUNCTION - solve the hybrid problem (longitude difference
+    for a given initial azimuth) and its derivative"""
+    calp1 = np.where((sbet1 == 0) & (calp1 == 0), -_TINY, calp1)
+
+    salp0 = salp1 * cbet1
+    calp0 = np.hypot(calp1, salp1 * sbet1)
+
+    somg1 = salp0 * sbet1
+    comg1 = calp1 * cbet1
+    ssig1, csig1 = _norm(sbet1, comg1)
+
+    salp2 = np.where(cbet2 != cbet1, salp0 / cbet2, salp1)
+    calp2 = np.where(
+        (cbet2 != cbet1) | (np.abs(sbet2) != -sbet1),
+        np.sqrt((calp1 * cbet1)**2 +
+                np.where(cbet1 < -sbet1,
+                         (cbet2 - cbet1) * (cbet1 + cbet2),
+                         (sbet1 - sbet2) * (sbet1 + sbet2))) / cbet2,
+        np.abs(calp1))
+
+    somg2 = salp0 * sbet2
+    comg2 = calp2 * cbet2
+    ssig2, csig2 = _norm(sbet2, comg2)
+
+    sig12 = np.arctan2(np.maximum(0.0, csig1 * ssig2 - ssig1 * csig2) + 0.0,
+                       csig1 * csig2 + ssig1 * ssig2)
+    somg12 = np.maximum(0.0, comg1 * somg2 - somg1 * comg2) + 0.0
+    comg12 = comg1 * comg2 + somg1 * somg2
+    eta = np.arctan2(somg12 * clam120 - comg12 * slam120,
+                     comg12 * clam120 + somg12 * slam120)
+
+    eps = _epsilon(geod, calp0**2)
+    C3a = _C3f(geod, eps)
+    B312 = (_sinCosSeries(True, ssig2, csig2, C3a) -
+            _sinCosSeries(True, ssig1, csig1, C3a))
+    lam12 = eta - geod.f * _A3f(geod, eps) * salp0 * (sig12 + B312)
+
+    # derivative with respect to the initial azimuth
+    _, m12b = _lengths(geod, eps, sig12, ssig1, csig1, dn1,
+                       ssig2, csig2, dn2)
+    dlam12 = np.where(calp2 == 0,
+                      -2 * geod.f1 * dn1 / sbet1,
+                      m12b * geod.f1 / (calp2 * cbet2))
+
+    return lam12, salp2, calp2, sig12, ssig1, csig1, ssig2, csig2, eps, \
+        dlam12
+
+
+def _newton(geod: _GeodesicConstants, sbet1, cbet1, dn1, sbet2, cbet2, dn2,
+            slam12, clam12, salp1, calp1):
+    """PRIVATE FUNCTION - find the initial azimuth with Newton's method
+    safeguarded by a bisection. All the pairs are iterated together and
+    removed from the working set once converged.
+
+    Returns:
+        tuple: s12, salp1, calp1, salp2, calp2
+    """
+    size = sbet1.size
+    s12 = np.empty(size)
+    salp2Out = np.empty(size)
+    calp2Out = np.empty(size)
+    salp1Out = np.empty(size)
+    calp1Out = np.empty(size)
+
+    # working set
+    act = np.arange(size)
+    salp1a = np.full(size, _TINY)
+    calp1a = np.full(size, 1.0)
+    salp1b = np.full(size, _TINY)
+    calp1b = np.full(size, -1.0)
+    tripn = np.zeros(size, dtype=bool)
+    tripb = np.zeros(size, dtype=bool)
+
+    numit = 0
+    while act.size:
+        sb1, cb1, d1 = sbet1[act], cbet1[act], dn1[act]
+        sb2, cb2, d2 = sbet2[act], cbet2[act], dn2[act]
+        (v, salp2, calp2, sig12, ssig1, csig1, ssig2, csig2,
+         eps, dv) = _lambda12(geod, sb1, cb1, d1, sb2, cb2, d2,
+                              salp1, calp1, slam12[act], clam12[act])
+
+        # converged pairs
+        done = (tripb | ~(np.abs(v) >= np.where(tripn, 8, 1) * _TOL0) |
+                (numit == _MAXIT2))
+        if np.any(done):
+            idx = act[done]
+            s12b, _ = _lengths(geod, eps[done], sig12[done],
+                               ssig1[done], csig1[done], d1[done],
+                               ssig2[done], csig2[done], d2[done])
+            s12[idx] = s12b * geod.b
+            salp1Out[idx] = salp1[done]
+            calp1Out[idx] = calp1[done]
+            salp2Out[idx] = salp2[done]
+            calp2Out[idx] = calp2[done]
+
+            keep = ~done
+            act = act[keep]
+            v, dv = v[keep], dv[keep]
+            salp1, calp1 = salp1[keep], calp1[keep]
+            salp1a, calp1a = salp1a[keep], calp1a[keep]
+            salp1b, calp1b = salp1b[keep], calp1b[keep]
+            tripn, tripb = tripn[keep], tripb[keep]
+            if not act.size:
+                break
+
+        # update the bracket of the solution
+        ratio = calp1 / salp1
+        updateB = (v > 0) & ((numit > _MAXIT1) | (ratio > calp1b / salp1b))
+        updateA = (v < 0) & ((numit > _MAXIT1) | (ratio < calp1a / salp1a))
+        salp1b = np.where(updateB, salp1, salp1b)
+        calp1b = np.where(updateB, calp1, calp1b)
+        salp1a = np.where(updateA, salp1, salp1a)
+        calp1a = np.where(updateA, calp1, calp1a)
+
+        numit += 1
+
+        # Newton step
+        dalp1 = -v / dv
+        sdalp1 = np.sin(dalp1)
+        cdalp1 = np.cos(dalp1)
+        nsalp1 = salp1 * cdalp1 + calp1 * sdalp1
+        ncalp1 = calp1 * cdalp1 - salp1 * sdalp1
+        newton = ((numit < _MAXIT1) & (dv > 0) & (np.abs(dalp1) < np.pi) &
+                  (nsalp1 > 0))
+        nsalp1, ncalp1 = _norm(nsalp1, ncalp1)
+
+        # bisection step
+        bsalp1, bcalp1 = _norm((salp1a + salp1b) / 2,
+                               (calp1a + calp1b) / 2)
+        btripb = ((np.abs(salp1a - bsalp1) + (calp1a - bcalp1) < _TOLB) |
+                  (np.abs(bsalp1 - salp1b) + (bcalp1 - calp1b) < _TOLB))
+
+        tripn = np.where(newton, np.abs(v) <= 16 * _TOL0, False)
+        tripb = np.where(newton, tripb, btripb)
+        salp1 = np.where(newton, nsalp1, bsalp1)
+        calp1 = np.where(newton, ncalp1, bcalp1)
+
+    return s12, salp1Out, calp1Out, salp2Out, calp2Out
+
+
+def _inverse(geod: _GeodesicConstants, lat1: np.ndarray, lon1: np.ndarray,
+             lat2: np.ndarray, lon2: np.ndarray):
+    """PRIVATE FUNCTION - vectorized inverse problem on 1D arrays of angles
+    in degrees
+
+    Returns:
+        tuple: s12, salp1, calp1, salp2, calp2
+    """
+    # longitude difference (lon12 in [0, 180])
+    lon12, lon12s = _angDiff(lon1, lon2)
+    lonsign = np.copysign(1.0, lon12)
+    lon12 = lonsign * lon12
+    lon12s = lonsign * lon12s
+    lam12 = np.radians(lon12)
+    slam12, clam12 = _sincosde(lon12, lon12s)
+    lon12s = (180 - lon12) - lon12s  # supplementary longitude difference
+
+    # swap points so that |lat1| >= |lat2| and make lat1 <= 0
+    lat1 = _angRound(lat1)
+    lat2 = _angRound(lat2)
+    swapp = np.where(np.abs(lat1) < np.abs(lat2), -1.0, 1.0)
+    lonsign = np.where(swapp < 0, -lonsign, lonsign)
+    lat1, lat2 = np.where(swapp < 0, lat2, lat1), np.where(swapp < 0,
+                                                           lat1, lat2)
+    latsign = np.copysign(1.0, -lat1)
+    lat1 = lat1 * latsign
+    lat2 = lat2 * latsign
+
+    # reduced latitudes
+    sbet1, cbet1 = _sincosd(lat1)
+    sbet1, cbet1 = _norm(sbet1 * geod.f1, cbet1)
+    cbet1 = np.maximum(_TINY, cbet1)
+    sbet2, cbet2 = _sincosd(lat2)
+    sbet2, cbet2 = _norm(sbet2 * geod.f1, cbet2)
+    cbet2 = np.maximum(_TINY, cbet2)
+
+    south = cbet1 < -sbet1
+    sbet2 = np.where(south & (cbet2 == cbet1), np.copysign(sbet1, sbet2),
+                     sbet2)
+    cbet2 = np.where(~south & (np.abs(sbet2) == -sbet1), cbet1, cbet2)
+
+    dn1 = np.sqrt(1 + geod.ep2 * sbet1**2)
+    dn2 = np.sqrt(1 + geod.ep2 * sbet2**2)
+
+    # outputs
+    s12 = np.empty(lat1.shape)
+    salp1 = np.empty(lat1.shape)
+    calp1 = np.empty(lat1.shape)
+    salp2 = np.empty(lat1.shape)
+    calp2 = np.empty(lat1.shape)
+
+    # meridional geodesics
+    meridian = (lat1 == -90) | (slam12 == 0)
+    idx = np.flatnonzero(meridian)
+    if idx.size:
+        mcalp1, msalp1 = clam12[idx], slam12[idx]
+        ssig1 = sbet1[idx]
+        csig1 = mcalp1 * cbet1[idx]
+        ssig2 = sbet2[idx]
+        csig2 = cbet2[idx]
+        sig12 = np.arctan2(
+            np.maximum(0.0, csig1 * ssig2 - ssig1 * csig2) + 0.0,
+            csig1 * csig2 + ssig1 * ssig2)
+        s12x, m12x = _lengths(geod, geod.n, sig12, ssig1, csig1, dn1[idx],
+                              ssig2, csig2, dn2[idx])
+        valid = (sig12 < _TOL2) | (m12x >= 0)
+        zero = (sig12 < 3 * _TINY) | ((sig12 < _TOL0) &
+                                      ((s12x < 0) | (m12x < 0)))
+        s12[idx] = np.where(zero, 0.0, s12x) * geod.b
+        salp1[idx] = msalp1
+        calp1[idx] = mcalp1
+        salp2[idx] = 0.0
+        calp2[idx] = 1.0
+        meridian[idx[~valid]] = False
+
+    # equatorial geodesics
+    equatorial = (~meridian & (sbet1 == 0) &
+                  ((geod.f <= 0) | (lon12s >= geod.f * 180)))
+    s12[equatorial] = geod.a * lam12[equatorial]
+    salp1[equatorial] = salp2[equatorial] = 1.0
+    calp1[equatorial] = calp2[equatorial] = 0.0
+
+    # general case
+    idx = np.flatnonzero(~meridian & ~equatorial)
+    if idx.size:
+        sig12, gsalp1, gcalp1, gsalp2, gcalp2, dnm = _inverseStart(
+            geod, sbet1[idx], cbet1[idx], sbet2[idx], cbet2[idx],
+            lam12[idx], slam12[idx], clam12[idx])
+
+        # short lines solved by the starting point
+        short = sig12 >= 0
+        sIdx = idx[short]
+        s12[sIdx] = sig12[short] * geod.b * dnm[short]
+        salp1[sIdx] = gsalp1[short]
+        calp1[sIdx] = gcalp1[short]
+        salp2[sIdx] = gsalp2[short]
+        calp2[sIdx] = gcalp2[short]
+
+        # Newton method
+        nIdx = idx[~short]
+        if nIdx.size:
+            (s12[nIdx], salp1[nIdx], calp1[nIdx],
+             salp2[nIdx], calp2[nIdx]) = _newton(
+                geod, sbet1[nIdx], cbet1[nIdx], dn1[nIdx],
+                sbet2[nIdx], cbet2[nIdx], dn2[nIdx],
+                slam12[nIdx], clam12[nIdx],
+                gsalp1[~short], gcalp1[~short])
+
+    # undo the swap and the sign changes
+    swap = swapp < 0
+    salp1, salp2 = np.where(swap, salp2, salp1), np.where(swap, salp1, salp2)
+    calp1, calp2 = np.where(swap, calp2, calp1), np.where(swap, calp1, calp2)
+    salp1 = salp1 * swapp * lonsign
+    calp1 = calp1 * swapp * latsign
+    salp2 = salp2 * swapp * lonsign
+    calp2 = calp2 * swapp * latsign
+
+    return 0.0 + s12, salp1, calp1, salp2, calp2
+
+
+# -------------------------------------------------------------------------
+#                              DIRECT PROBLEM
+# -------------------------------------------------------------------------
+
+def getDirectGeodesic(lat1, long1, azimuth1, distance,
+                      earth_model: str = _DEFAULT_MODEL
+                      ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Solve the direct geodesic problem (destination point and final
+    azimuth from an initial point, an initial azimuth and a distance) with
+    Karney's algorithm for arrays of geodesics.
+
+    The solution is explicit (no iteration), the inputs are broadcasted
+    against each other (e.g. sites [Nx1] with azimuths [M] give range
+    rings [NxM]). The accuracy is about 15 nanometers for WGS84.
+
+    Args:
+        lat1 (array_like): initial latitudes in radians
+        long1 (array_like): initial longitudes in radians
+        azimuth1 (array_like): azimuths at the initial points in radians
+            (clockwise from North)
+        distance (array_like): distances in meters (may be negative)
+        earth_model (str, optional): name of the Ellipsoid model.
+            Defaults to "WGS84".
+
+    Returns:
+        np.ndarray: final latitudes in radians
+        np.ndarray: final longitudes in radians (in [-pi, pi])
+        np.ndarray: azimuths at the final points in radians
+            (clockwise from North)
+    """
+    lat1, long1, azimuth1, distance = np.broadcast_arrays(
+        *[np.asarray(value, dtype=np.float64)
+          for value in (lat1, long1, azimuth1, distance)])
+    shape = lat1.shape
+
+    # latitue assertion
+    if not np.all(np.abs(lat1) <= np.pi/2):
+        msg = "Latitudes Value shall be lower than 90"
+        raise ValueError(msg)
+
+    geod = _getConstants(earth_model)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lat2, long2, azimuth2 = _direct(
+            geod, np.degrees(lat1.ravel()), long1.ravel(),
+            np.degrees(azimuth1.ravel()), distance.ravel())
+
+    return lat2.reshape(shape), long2.reshape(shape), azimuth2.reshape(shape)
+
+
+def _direct(geod: _GeodesicConstants, lat1: np.ndarray, lon1: np.ndarray,
+            azi1: np.ndarray, s12: np.ndarray):
+    """PRIVATE FUNCTION - direct problem (latitudes and azimuths in degrees,
+    longitudes in radians) -> (lat2, lon2, azi2) in radians"""
+    salp1, calp1 = _sincosd(_angRound(_remainder(azi1, 360)))
+
+    # reduced latitude
+    sbet1, cbet1 = _sincosd(_angRound(lat1))
+    sbet1, cbet1 = _norm(geod.f1 * sbet1, cbet1)
+    cbet1 = np.maximum(_TINY, cbet1)
+
+    # azimuth at the node (equator crossing)
+    salp0 = salp1 * cbet1
+    calp0 = np.hypot(calp1, salp1 * sbet1)
+
+    # arc length and longitude on the auxiliary sphere from the node
+    ssig1 = sbet1
+    somg1 = salp0 * sbet1
+    csig1 = comg1 = np.where((sbet1 != 0) | (calp1 != 0),
+                             cbet1 * calp1, 1.0)
+    ssig1, csig1 = _norm(ssig1, csig1)
+
+    k2 = calp0**2
+    eps = _epsilon(geod, k2)
+    k2 = k2 * geod.ep2
+
+    A1m1 = _A1m1f(eps)
+    C1a = _C1f(eps)
+    B11 = _sinCosSeries(True, ssig1, csig1, C1a)
+    s = np.sin(B11)
+    c = np.cos(B11)
+    stau1 = ssig1 * c + csig1 * s
+    ctau1 = csig1 * c - ssig1 * s
+
+    # arc length on the auxiliary sphere from the distance
+    tau12 = s12 / (geod.b * (1 + A1m1))
+    s = np.sin(tau12)
+    c = np.cos(tau12)
+    B12 = - _sinCosSeries(True, stau1 * c + ctau1 * s,
+                          ctau1 * c - stau1 * s, _C1pf(eps))
+    sig12 = tau12 - (B12 - B11)
+    ssig12 = np.sin(sig12)
+    csig12 = np.cos(sig12)
+    if abs(geod.f) > 0.01:
+        # one Newton step on the reverted series for large flattening
+        ssig2 = ssig1 * csig12 + csig1 * ssig12
+        csig2 = csig1 * csig12 - ssig1 * ssig12
+        B12 = _sinCosSeries(True, ssig2, csig2, C1a)
+        serr = (1 + A1m1) * (sig12 + (B12 - B11)) - s12 / geod.b
+        sig12 = sig12 - serr / np.sqrt(1 + k2 * ssig2**2)
+        ssig12 = np.sin(sig12)
+        csig12 = np.cos(sig12)
+
+    # final point
+    ssig2 = ssig1 * csig12 + csig1 * ssig12
+    csig2 = csig1 * csig12 - ssig1 * ssig12
+    sbet2 = calp0 * ssig2
+    cbet2 = np.hypot(salp0, calp0 * csig2)
+    vertex = cbet2 == 0
+    cbet2 = np.where(vertex, _TINY, cbet2)
+    csig2 = np.where(vertex, _TINY, csig2)
+    salp2 = salp0
+    calp2 = calp0 * csig2
+
+    # longitude difference
+    somg2 = salp0 * ssig2
+    comg2 = csig2
+    omg12 = np.arctan2(somg2 * comg1 - comg2 * somg1,
+                       comg2 * comg1 + somg2 * somg1)
+    C3a = _C3f(geod, eps)
+    B31 = _sinCosSeries(True, ssig1, csig1, C3a)
+    B32 = _sinCosSeries(True, ssig2, csig2, C3a)
+    lam12 = omg12 - geod.f * salp0 * _A3f(geod, eps) * (sig12 + (B32 - B31))
+
+    lat2 = np.arctan2(sbet2, geod.f1 * cbet2)
+    lon2 = _remainder(_remainder(lon1, 2 * np.pi) + lam12, 2 * np.pi)
+    azi2 = np.arctan2(salp2, calp2)
+
+    return lat2, lon2, azi2
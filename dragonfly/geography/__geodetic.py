@@ -0,0 +1,143 @@
+"""
+# ======================================================================= #
+# ================= BATCH GEODETIC COORDINATES CONVERSION =============== #
+# ======================================================================= #
+"""
+# EXPORT
+__all__ = [
+    "ecef2lla",
+    "lla2ecef",
+]
+
+# IMPORT
+import numpy as np
+import dragonfly
+
+
+# PARAMETERS
+_DEFAULT_MODEL = dragonfly.constants.DEFAULT_SETTINGS.EarthEllipsoid
+
+
+def ecef2lla(positions, ellipsoid: str = _DEFAULT_MODEL,
+             nbIter: int = 2) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert a set of ECEF positions into geographic positions (i.e.
+    latitude, longitude and altitude) against an Ellipsoid model in one
+    vectorized pass
+
+    The latitude is obtained with Bowring's formula followed by a fixed
+    number of fixed-point iterations (same scheme as Position.toLLA but
+    without the data dependent stop criterion). For WGS84, with
+    nbIter=2, the latitude error is below 1e-15 rad and the altitude error
+    below 1e-7 m for altitudes between -10 km and 40 000 km. nbIter=1
+    (pure Bowring) stays below 1e-9 rad up to 1 000 km.
+
+    Args:
+        positions (array_like): ECEF positions as a [Nx3] array (or
+            PositionArray) in meters
+        ellipsoid (str, optional): Ellispoid reference.
+            Defaults to "WGS84".
+        nbIter (int, optional): number of fixed-point iterations.
+            Defaults to 2.
+
+    Returns:
+        np.ndarray : latitudes in radians [N elements]
+        np.ndarray : longitudes in radians [N elements]
+        np.ndarray : altitudes in meters [N elements]
+    """
+    data = dragonfly.utils.validation.validateVectorArray(
+        positions, "positions")
+    nbIter = dragonfly.utils.validation.validateInstance(nbIter, int)
+    if nbIter < 1:
+        raise ValueError(f"nbIter shall be at least 1 [current: {nbIter}]")
+
+    x = data[:, 0]
+    y = data[:, 1]
+    z = data[:, 2]
+
+    # create EarthModel
+    earth = dragonfly.constants.EarthModel(ellipsoid)
+
+    # constante
+    a = earth.a
+    b = earth.b
+    f = earth.f
+    e2 = earth.e**2         # Square of first eccentricity
+    ep2 = e2 / (1 - e2)     # Square of second eccentricity
+
+    # Longitude
+    longitude = np.arctan2(y, x)
+
+    # Distance from Z-axis
+    D = np.hypot(x, y)
+
+    # Bowring's formula for initial parametric (beta) latitude then
+    # fixed-point iterations on the geodetic latitude (phi)
+    beta = np.arctan2(z, (1 - f) * D)
+    phi = np.arctan2(z + b * ep2 * np.sin(beta)**3,
+                     D - a * e2 * np.cos(beta)**3)
+    for _ in range(nbIter - 1):
+        beta = np.arctan2((1 - f) * np.sin(phi), np.cos(phi))
+        phi = np.arctan2(z + b * ep2 * np.sin(beta)**3,
+                         D - a * e2 * np.cos(beta)**3)
+
+    # Calculate ellipsoidal height from the final value for latitude
+    sinphi = np.sin(phi)
+    N = a / np.sqrt(1 - e2 * sinphi**2)
+    altitude = D * np.cos(phi) + (z + e2 * N * sinphi) * sinphi - N
+
+    return phi, longitude, altitude
+
+
+def lla2ecef(latitude, longitude, altitude=0.0,
+             ellipsoid: str = _DEFAULT_MODEL) -> np.ndarray:
+    """Convert a set of geographic positions (i.e. latitude, longitude and
+    altitude) into ECEF positions in one vectorized pass. The inputs are
+    validated and the ellipsoid constants are resolved once per call
+
+    Args:
+        latitude (array_like): latitudes in radians [N elements]
+        longitude (array_like): longitudes in radians [N elements]
+        altitude (array_like, optional): altitudes in meters [N elements].
+            Defaults to 0.
+        ellipsoid (str, optional): Model of Earth Ellipsoid.
+            Defaults to "WGS84".
+
+    Returns:
+        np.ndarray: array [Nx3] of the ECEF coordinates in meters
+    """
+
+    # IO management (scalars are broadcasted against the arrays)
+    try:
+        lat, lon, alt = np.broadcast_arrays(
+            np.ravel(np.asarray(latitude, dtype=np.float64)),
+            np.ravel(np.asarray(longitude, dtype=np.float64)),
+            np.ravel(np.asarray(altitude, dtype=np.float64)),
+        )
+    except ValueError as exc:
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg=("latitude, longitude and altitude shall be numbers"
+                      " or arrays of numbers with the same size"),
+            expected="arrays [N elements]",
+            current=(f"{np.shape(latitude)}, {np.shape(longitude)},"
+                     f" {np.shape(altitude)}"),
+        )
+        raise ValueError(msg) from exc
+
+    # constante
+    earth = dragonfly.constants.EarthModel(ellipsoid)
+    a = earth.a
+    e2 = earth.e**2
+
+    # transformation algorithm
+    sinlat = np.sin(lat)
+    coslat = np.cos(lat)
+
+    N = a / np.sqrt(1 - e2 * sinlat**2)
+
+    # Calculate ECEF position
+    ecef = np.empty((lat.size, 3), dtype=np.float64)
+    ecef[:, 0] = (N + alt) * coslat * np.cos(lon)
+    ecef[:, 1] = (N + alt) * coslat * np.sin(lon)
+    ecef[:, 2] = (N * (1 - e2) + alt) * sinlat
+
+    return ecef
@@ -6,4 +6,12 @@
 
 from .__rotationMatrix import *
 from .__position import *
+from .__geodetic import *
+from .__positionArray import *
+from .__geodesic import *
 from .__range import *
+from .__polyline import *
+from .__spatialIndex import *
+from .__cellId import *
+from .__localFrame import *
+from .__quaternion import *
@@ -0,0 +1,187 @@
+"""
+# ======================================================================= #
+# ================= LOCAL TANGENT PLANE (ENU/NED) CONVERSION ============ #
+# ======================================================================= #
+"""
+# EXPORT
+__all__ = [
+    "ecef2enu",
+    "enu2ecef",
+    "ecef2ned",
+    "ned2ecef",
+]
+
+# IMPORT
+import functools
+import numpy as np
+import dragonfly
+from dragonfly.geography import dcm_ecef2enu, dcm_ecef2ned, lla2ecef
+
+
+# PARAMETERS
+_DEFAULT_MODEL = dragonfly.constants.DEFAULT_SETTINGS.EarthEllipsoid
+_DCM = {"ENU": dcm_ecef2enu, "NED": dcm_ecef2ned}
+
+
+@functools.lru_cache(maxsize=256)
+def _getOrigin(latitude: float, longitude: float, altitude: float,
+               ellipsoid: str, frame: str) -> tuple[np.ndarray, np.ndarray]:
+    """PRIVATE FUNCTION - (cached) rotation matrix [3x3] and ECEF
+    coordinates [3] of a single origin"""
+    dcm = _DCM[frame](latitude, longitude)
+    origin = lla2ecef(latitude, longitude, altitude, ellipsoid)[0]
+    dcm.flags.writeable = False
+    origin.flags.writeable = False
+    return dcm, origin
+
+
+def _getLocalFrame(latitude, longitude, altitude, ellipsoid: str,
+                   frame: str) -> tuple[np.ndarray, np.ndarray]:
+    """PRIVATE FUNCTION - rotation matrices ([3x3] or [Nx3x3]) and ECEF
+    coordinates ([3] or [Nx3]) of the origins"""
+    if np.ndim(latitude) == np.ndim(longitude) == np.ndim(altitude) == 0:
+        return _getOrigin(float(latitude), float(longitude), float(altitude),
+                          ellipsoid, frame)
+
+    latitude, longitude, altitude = np.broadcast_arrays(
+        np.ravel(np.asarray(latitude, dtype=np.float64)),
+        np.ravel(np.asarray(longitude, dtype=np.float64)),
+        np.ravel(np.asarray(altitude, dtype=np.float64)))
+    return (_DCM[frame](latitude, longitude),
+            lla2ecef(latitude, longitude, altitude, ellipsoid))
+
+
+def _ecef2local(positions, latitude, longitude, altitude, ellipsoid: str,
+                isVector: bool, frame: str) -> np.ndarray:
+    """PRIVATE FUNCTION - ECEF to local tangent plane"""
+    data = dragonfly.utils.validation.validateVectorArray(
+        positions, "positions")
+    dcm, origin = _getLocalFrame(latitude, longitude, altitude, ellipsoid,
+                                 frame)
+    if not isVector:
+        data = data - origin
+
+    if dcm.ndim == 2:
+        return data @ dcm.T
+    return np.einsum("nij,nj->ni", dcm, data)
+
+
+def _local2ecef(positions, latitude, longitude, altitude, ellipsoid: str,
+                isVector: bool, frame: str) -> np.ndarray:
+    """PRIVATE FUNCTION - local tangent plane to ECEF"""
+    data = dragonfly.utils.validation.validateVectorArray(
+        positions, "positions")
+    dcm, origin = _getLocalFrame(latitude, longitude, altitude, ellipsoid,
+                                 frame)
+    if dcm.ndim == 2:
+        data = data @ dcm
+    else:
+        data = np.einsum("nji,nj->ni", dcm, data)
+
+    if not isVector:
+        data += origin
+    return data
+
+
+def ecef2enu(positions, latitude, longitude, altitude=0.0,
+             ellipsoid: str = _DEFAULT_MODEL,
+             isVector: bool = False) -> np.ndarray:
+    """Convert ECEF points (or vectors) into ENU (East North Up) coordinates
+    relative to one origin or to one origin per point.
+
+    The rotation matrix and the ECEF coordinates of a single origin are
+    cached: repeated calls for the same station only cost a matrix product.
+
+    Args:
+        positions (array_like): ECEF points or vectors [Nx3] in meters
+        latitude (float | array_like): latitude of the origin(s) in radians
+        longitude (float | array_like): longitude of the origin(s) in
+            radians
+        altitude (float | array_like, optional): altitude of the origin(s)
+            in meters. Defaults to 0.
+        ellipsoid (str, optional): Model of Earth Ellipsoid.
+            Defaults to "WGS84".
+        isVector (bool, optional): the inputs are vectors (e.g.
+            velocities): only rotated. Defaults to False.
+
+    Returns:
+        np.ndarray: ENU coordinates [Nx3]
+    """
+    return _ecef2local(positions, latitude, longitude, altitude, ellipsoid,
+                       isVector, "ENU")
+
+
+def enu2ecef(positions, latitude, longitude, altitude=0.0,
+             ellipsoid: str = _DEFAULT_MODEL,
+             isVector: bool = False) -> np.ndarray:
+    """Convert ENU (East North Up) points (or vectors) relative to one
+    origin or to one origin per point into ECEF coordinates (see ecef2enu)
+
+    Args:
+        positions (array_like): ENU points or vectors [Nx3] in meters
+        latitude (float | array_like): latitude of the origin(s) in radians
+        longitude (float | array_like): longitude of the origin(s) in
+            radians
+        altitude (float | array_like, optional): altitude of the origin(s)
+            in meters. Defaults to 0.
+        ellipsoid (str, optional): Model of Earth Ellipsoid.
+            Defaults to "WGS84".
+        isVector (bool, optional): the inputs are vectors (e.g.
+            velocities): only rotated. Defaults to False.
+
+    Returns:
+        np.ndarray: ECEF coordinates [Nx3]
+    """
+    return _local2ecef(positions, latitude, longitude, altitude, ellipsoid,
+                       isVector, "ENU")
+
+
+def ecef2ned(positions, latitude, longitude, altitude=0.0,
+             ellipsoid: str = _DEFAULT_MODEL,
+             isVector: bool = False) -> np.ndarray:
+    """Convert ECEF points (or vectors) into NED (North East Down)
+    coordinates relative to one origin or to one origin per point (see
+    ecef2enu)
+
+    Args:
+        positions (array_like): ECEF points or vectors [Nx3] in meters
+        latitude (float | array_like): latitude of the origin(s) in radians
+        longitude (float | array_like): longitude of the origin(s) in
+            radians
+        altitude (float | array_like, optional): altitude of the origin(s)
+            in meters. Defaults to 0.
+        ellipsoid (str, optional): Model of Earth Ellipsoid.
+            Defaults to "WGS84".
+        isVector (bool, optional): the inputs are vectors (e.g.
+            velocities): only rotated. Defaults to False.
+
+    Returns:
+        np.ndarray: NED coordinates [Nx3]
+    """
+    return _ecef2local(positions, latitude, longitude, altitude, ellipsoid,
+                       isVector, "NED")
+
+
+def ned2ecef(positions, latitude, longitude, altitude=0.0,
+             ellipsoid: str = _DEFAULT_MODEL,
+             isVector: bool = False) -> np.ndarray:
+    """Convert NED (North East Down) points (or vectors) relative to one
+    origin or to one origin per point into ECEF coordinates (see ecef2enu)
+
+    Args:
+        positions (array_like): NED points or vectors [Nx3] in meters
+        latitude (float | array_like): latitude of the origin(s) in radians
+        longitude (float | array_like): longitude of the origin(s) in
+            radians
+        altitude (float | array_like, optional): altitude of the origin(s)
+            in meters. Defaults to 0.
+        ellipsoid (str, optional): Model of Earth Ellipsoid.
+            Defaults to "WGS84".
+        isVector (bool, optional): the inputs are vectors (e.g.
+            velocities): only rotated. Defaults to False.
+
+    Returns:
+        np.ndarray: ECEF coordinates [Nx3]
+    """
+    return _local2ecef(positions, latitude, longitude, altitude, ellipsoid,
+                       isVector, "NED")
@@ -0,0 +1,160 @@
+"""
+# ======================================================================= #
+# ==================== GEODESIC POLYLINE DENSIFICATION ================== #
+# ======================================================================= #
+"""
+
+# EXPORT
+__all__ = [
+    "densifyPolyline",
+]
+
+# IMPORT
+import math
+import numbers
+import itertools
+import typing
+import numpy as np
+import dragonfly
+from dragonfly.geography import getInverseGeodesic, getDirectGeodesic
+
+
+# PARAMETERS
+_DEFAULT_MODEL = dragonfly.constants.DEFAULT_SETTINGS.EarthEllipsoid
+
+
+def _getStep(spacing, maxChordError, earth_model: str) -> float:
+    """PRIVATE FUNCTION - distance between two densified points from the
+    spacing and/or the maximum chord error"""
+    if spacing is None and maxChordError is None:
+        raise ValueError("spacing or maxChordError shall be defined")
+
+    steps = []
+    for name, value in (("spacing", spacing),
+                        ("maxChordError", maxChordError)):
+        if value is None:
+            continue
+        value = float(dragonfly.utils.validation.validateInstance(
+            value, numbers.Real, inheritance=True))
+        if not value > 0:
+            raise ValueError(
+                f"{name} shall be strictly positive [current: {value}]")
+        steps.append(value)
+
+    if maxChordError is not None:
+        # sagitta of an arc of length d: d^2 / (8 R) with R the smallest
+        # radius of curvature of the ellipsoid (meridian at the equator)
+        earth = dragonfly.constants.EarthModel(earth_model)
+        steps[-1] = math.sqrt(8 * maxChordError * earth.b**2 / earth.a)
+
+    return min(steps)
+
+
+def _readWaypoints(waypoints: typing.Iterable,
+                   size: int) -> typing.Iterator[np.ndarray]:
+    """PRIVATE FUNCTION - read the waypoints by blocks of [Kx2] arrays"""
+    waypoints = iter(waypoints)
+
+    while True:
+        block = np.array(list(itertools.islice(waypoints, size)),
+                         dtype=np.float64)
+        if block.size == 0:
+            return
+        if block.ndim != 2 or block.shape[1] != 2:
+            msg = dragonfly.utils.exception.createErrorMessage(
+                errorMsg="waypoints shall be [latitude, longitude] pairs",
+                expected="[Nx2] array of [latitude, longitude]",
+                current=f"shape: {block.shape}",
+            )
+            raise ValueError(msg)
+        if not np.all(np.abs(block[:, 0]) <= np.pi/2):
+            raise ValueError("Latitudes Value shall be lower than 90")
+        yield block
+
+
+def densifyPolyline(waypoints: typing.Iterable, spacing: float = None,
+                    maxChordError: float = None, chunkSize: int = 4096,
+                    earth_model: str = _DEFAULT_MODEL
+                    ) -> typing.Iterator[np.ndarray]:
+    """Densify a polyline of waypoints into points along the geodesics
+    between consecutive waypoints. The path is streamed: the waypoints are
+    read lazily by blocks and the points are yielded by chunks, so that the
+    memory does not depend on the length of the route.
+
+    Each leg is split in the smallest number of equal segments not longer
+    than the step (spacing and/or the length for which the deviation
+    between the chord and the geodesic arc stays below maxChordError).
+    The waypoints are part of the output, the zero length legs are skipped.
+
+    Args:
+        waypoints (Iterable): [latitude, longitude] pairs in radians (e.g.
+            [Nx2] array or generator)
+        spacing (float, optional): maximum distance between two points in
+            meters. Defaults to None.
+        maxChordError (float, optional): maximum distance between the
+            chord and the geodesic in meters. Defaults to None.
+        chunkSize (int, optional): number of points per chunk.
+            Defaults to 4096.
+        earth_model (str, optional): name of the Ellipsoid model.
+            Defaults to "WGS84".
+
+    Yields:
+        np.ndarray: chunk [chunkSize x 2] of [latitude, longitude] in
+            radians (the last chunk may be smaller)
+    """
+    step = _getStep(spacing, maxChordError, earth_model)
+    chunkSize = dragonfly.utils.validation.validateInteger(chunkSize)
+    if chunkSize < 1:
+        raise ValueError(
+            f"chunkSize shall be strictly positive [current: {chunkSize}]")
+
+    chunk = np.empty((chunkSize, 2), dtype=np.float64)
+    nbFilled = 0
+    previous = None
+
+    for block in _readWaypoints(waypoints, chunkSize):
+        if previous is not None:
+            block = np.concatenate((previous, block))
+        previous = block[-1:]
+        if block.shape[0] < 2:
+            continue
+
+        # legs of the block
+        lat1 = block[:-1, 0]
+        long1 = block[:-1, 1]
+        s12, azimuth1, _ = getInverseGeodesic(
+            lat1, long1, block[1:, 0], block[1:, 1], earth_model)
+        nbSegments = np.ceil(s12 / step).astype(np.int64)
+        offsets = np.cumsum(nbSegments)
+        nbPoints = int(offsets[-1])
+
+        # fill the chunks by windows of point indexes
+        start = 0
+        while start < nbPoints:
+            stop = min(nbPoints, start + chunkSize - nbFilled)
+            index = np.arange(start, stop)
+            leg = np.searchsorted(offsets, index, side="right")
+            k = index - (offsets[leg] - nbSegments[leg])
+
+            lat2, long2, _ = getDirectGeodesic(
+                lat1[leg], long1[leg], azimuth1[leg],
+                k * (s12[leg] / nbSegments[leg]), earth_model)
+
+            # exact waypoints
+            isWaypoint = k == 0
+            window = chunk[nbFilled:nbFilled + index.size]
+            window[:, 0] = np.where(isWaypoint, lat1[leg], lat2)
+            window[:, 1] = np.where(isWaypoint, long1[leg], long2)
+            nbFilled += index.size
+            start = stop
+
+            if nbFilled == chunkSize:
+                yield chunk
+                chunk = np.empty((chunkSize, 2), dtype=np.float64)
+                nbFilled = 0
+
+    # last waypoint
+    if previous is not None:
+        chunk[nbFilled] = previous[0]
+        nbFilled += 1
+        yield chunk[:nbFilled]
@@ -5,7 +5,8 @@
 """
 # EXPORT
 __all__ = [
-    "Position"
+    "Position",
+    "FrozenPosition",
 ]
 
 # IMPORT
@@ -19,10 +20,29 @@ from dragonfly.utils.validation import validateInstance
 DEFAULT_MODEL = dragonfly.constants.DEFAULT_SETTINGS.EarthEllipsoid
 
 
+def _toFloat(name: str, value) -> float:
+    """PRIVATE FUNCTION - convert a coordinate into a float"""
+    try:
+        return float(value)
+    except TypeError:
+        raise TypeError(
+            f'"{name}" shall be a scalar not a list or a tuple') from None
+    except ValueError:
+        raise ValueError(
+            f'"{name}" shall be a number') from None
+
+
 class Position:
     """Class for the management of ECEF position
+
+    The coordinates are stored in slots (no instance __dict__) and the norm
+    is cached until one of the coordinates is modified. Position objects are
+    mutable, hence not hashable: see freeze and FrozenPosition to use a
+    position as a key of a dict or a set.
     """
 
+    __slots__ = ("_x", "_y", "_z", "_norm")
+
     def __init__(self, x: float, y: float, z: float):
         """create a Position object based on ECEF coordinates
 
@@ -31,25 +51,40 @@ class Position:
             y (float): y coordinates in ECEF
             z (float): z coordinates in ECEF
         """
-        self.x = x
-        self.y = y
-        self.z = z
+        self._x = _toFloat("x", x)
+        self._y = _toFloat("y", y)
+        self._z = _toFloat("z", z)
+        self._norm = None
 
-    def __getattr__(self, name: str):
-        return self.__dict__[f"_{name}"]
+    @property
+    def x(self) -> float:
+        """x coordinates in ECEF"""
+        return self._x
 
-    def __setattr__(self, name, value):
-        # see https://realpython.com/python-getter-setter/ for more details
+    @x.setter
+    def x(self, value) -> None:
+        self._x = _toFloat("x", value)
+        self._norm = None
 
-        try:
-            self.__dict__[f"_{name}"] = float(value)
+    @property
+    def y(self) -> float:
+        """y coordinates in ECEF"""
+        return self._y
+
+    @y.setter
+    def y(self, value) -> None:
+        self._y = _toFloat("y", value)
+        self._norm = None
+
+    @property
+    def z(self) -> float:
+        """z coordinates in ECEF"""
+        return self._z
 
-        except TypeError:
-            raise TypeError(
-                f'"{name}" shall be a scalar not a list or a tuple')
-        except ValueError:
-            raise ValueError(
-                f'"{name}" shall be a number') from None
+    @z.setter
+    def z(self, value) -> None:
+        self._z = _toFloat("z", value)
+        self._norm = None
 
     def __repr__(self):
         """internal method for the print"""
@@ -58,7 +93,7 @@ class Position:
     def __eq__(self, __o: object) -> bool:
         """internal method for equality"""
         if isinstance(__o, Position):
-            return (self.x, self.y, self.z) == (__o.x, __o.y, __o.z)
+            return (self._x, self._y, self._z) == (__o._x, __o._y, __o._z)
         raise NotImplementedError(
             "Class Position equality with" +
             f" this data type [{type(__o)} is not implemented]")
@@ -66,7 +101,9 @@ class Position:
     def __sub__(self, __o: object) -> bool:
         """internal method for equality"""
         if isinstance(__o, Position):
-            return Position(self.x - __o.x, self.y - __o.y, self.z - __o.z)
+            return Position.__fromFloats(self._x - __o._x,
+                                         self._y - __o._y,
+                                         self._z - __o._z)
 
         msg = (
             f"Class Position equality with this data type [{type(__o)}"
@@ -75,6 +112,17 @@ class Position:
         raise NotImplementedError(msg)
 
 # IMPORTER:
+    @classmethod
+    def __fromFloats(cls, x: float, y: float, z: float):
+        """PRIVATE METHOD : create Position from trusted float values
+        (no conversion)"""
+        newObj = object.__new__(Position)
+        newObj._x = x
+        newObj._y = y
+        newObj._z = z
+        newObj._norm = None
+        return newObj
+
     @classmethod
     def fromList(cls, data: list):
         """Create a instance of position (or a list) based on a list of
@@ -156,26 +204,42 @@ class Position:
         N = a / math.sqrt(1 - e2 * sinlat**2)
 
         # Calculate ECEF position
-        X = (N + alt) * coslat * np.cos(long)
-        Y = (N + alt) * coslat * np.sin(long)
+        X = (N + alt) * coslat * math.cos(long)
+        Y = (N + alt) * coslat * math.sin(long)
         Z = (N*(1 - e2) + alt) * sinlat
 
-        return Position(X, Y, Z)
+        return Position.__fromFloats(float(X), float(Y), float(Z))
 
 # ------------------------- PROPERTIES -------------------------
     @property
-    def norm(self):
-        return np.linalg.norm([self.x, self.y, self.z])
+    def norm(self) -> float:
+        """norm of the ECEF coordinates (cached)"""
+        if self._norm is None:
+            self._norm = math.hypot(self._x, self._y, self._z)
+        return self._norm
 
 # ------------------------- EXPORTER -------------------------
 
+    def freeze(self):
+        """Provide an immutable and hashable copy of the position
+
+        Returns:
+            FrozenPosition: frozen position
+        """
+        newObj = object.__new__(FrozenPosition)
+        object.__setattr__(newObj, "_x", self._x)
+        object.__setattr__(newObj, "_y", self._y)
+        object.__setattr__(newObj, "_z", self._z)
+        object.__setattr__(newObj, "_norm", self._norm)
+        return newObj
+
     def toNumpy(self):
         """Provide Postion ECEF vector as a numpy vector
 
         Returns:
             np.ndarray : column vector [3x1] of the ECEF coordinates
         """
-        return np.reshape(np.array([self.x, self.y, self.z]), (3, -1))
+        return np.array([[self._x], [self._y], [self._z]])
 
     def toLLA(self, ellipsoid: str = DEFAULT_MODEL):
         """return the geographic position (i.e. latitude, longitude and
@@ -237,3 +301,101 @@ class Position:
 
         # voir https://github.com/kvenkman/ecef2lla/blob/master/ecef2lla.py
         return latitude, longitude, altitude
+
+
+class FrozenPosition(Position):
+    """Immutable and hashable ECEF position (e.g. key of a dict or element
+    of a set), see Position.freeze
+
+    The hash is consistent with the equality of the positions.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, x: float, y: float, z: float):
+        """create a FrozenPosition object based on ECEF coordinates
+
+        Args:
+            x (float): x coordinates in ECEF
+            y (float): y coordinates in ECEF
+            z (float): z coordinates in ECEF
+        """
+        object.__setattr__(self, "_x", _toFloat("x", x))
+        object.__setattr__(self, "_y", _toFloat("y", y))
+        object.__setattr__(self, "_z", _toFloat("z", z))
+        object.__setattr__(self, "_norm", None)
+
+    @classmethod
+    def fromList(cls, data: list):
+        """Create a frozen position (or a list) based on a list of
+        cartesian position in ECEF reference (see Position.fromList)
+
+        Args:
+            data (list): position X,Y,Z in meter (or a nested list of [X,Y,Z])
+
+        Returns:
+            object : frozen position or a list of frozen positions
+        """
+        positions = Position.fromList(data)
+        if isinstance(positions, list):
+            return [position.freeze() for position in positions]
+        return positions.freeze()
+
+    @classmethod
+    def fromLLA(cls, lat: float, long: float, alt: float,
+                ellipsoid: str = DEFAULT_MODEL):
+        """create a frozen position based on geodetic position (see
+        Position.fromLLA)
+
+        Args:
+            lat (float): latitude in radians
+            long (float): longitude in radians
+            alt (float): altitude in meters
+            ellipsoid (str, optional): Model of
+                Earth Ellipsoid. Defaults to "WGS84".
+
+        Returns:
+            obj: instance of FrozenPosition Class
+        """
+        return Position.fromLLA(lat, long, alt, ellipsoid).freeze()
+
+    @property
+    def x(self) -> float:
+        """x coordinates in ECEF"""
+        return self._x
+
+    @property
+    def y(self) -> float:
+        """y coordinates in ECEF"""
+        return self._y
+
+    @property
+    def z(self) -> float:
+        """z coordinates in ECEF"""
+        return self._z
+
+    @property
+    def norm(self) -> float:
+        """norm of the ECEF coordinates (cached)"""
+        if self._norm is None:
+            object.__setattr__(self, "_norm",
+                               math.hypot(self._x, self._y, self._z))
+        return self._norm
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("FrozenPosition objects are immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("FrozenPosition objects are immutable")
+
+    def __hash__(self) -> int:
+        """internal method for hashing (consistent with equality)"""
+        return hash((self._x, self._y, self._z))
+
+    def freeze(self):
+        """Provide the position itself (already frozen)
+
+        Returns:
+            FrozenPosition: frozen position
+        """
+        return self
@@ -0,0 +1,248 @@
+"""
+# ======================================================================= #
+# ========================= POSITION ARRAY CLASS ======================== #
+# ======================================================================= #
+"""
+# EXPORT
+__all__ = [
+    "PositionArray"
+]
+
+# IMPORT
+import numpy as np
+import dragonfly
+from dragonfly.geography import Position, ecef2lla, lla2ecef
+
+
+# PARAMETERS
+_DEFAULT_MODEL = dragonfly.constants.DEFAULT_SETTINGS.EarthEllipsoid
+
+
+class PositionArray:
+    """Class for the management of a set of ECEF positions (e.g. a whole
+    trajectory) stored as a contiguous [Nx3] float64 numpy array
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, x, y, z):
+        """create a PositionArray object based on ECEF coordinates
+
+        Args:
+            x (array_like): x coordinates in ECEF [N elements]
+            y (array_like): y coordinates in ECEF [N elements]
+            z (array_like): z coordinates in ECEF [N elements]
+        """
+        x = np.ravel(np.asarray(x, dtype=np.float64))
+        y = np.ravel(np.asarray(y, dtype=np.float64))
+        z = np.ravel(np.asarray(z, dtype=np.float64))
+
+        if not x.shape == y.shape == z.shape:
+            msg = ("x, y and z shall have the same number of elements"
+                   f" [current: {x.size}, {y.size}, {z.size}]")
+            raise ValueError(msg)
+
+        data = np.empty((x.size, 3), dtype=np.float64)
+        data[:, 0] = x
+        data[:, 1] = y
+        data[:, 2] = z
+        self._data = data
+
+    def __repr__(self):
+        """internal method for the print"""
+        return f"ECEF Coordinates [{len(self)} positions]:\n{self._data}"
+
+    def __len__(self) -> int:
+        """number of positions"""
+        return self._data.shape[0]
+
+    def __getitem__(self, index):
+        """return a Position for an integer index or a PositionArray view
+        for a slice (or a copy for a fancy index / boolean mask)"""
+        if isinstance(index, (int, np.integer)):
+            row = self._data[index]
+            return Position(row[0], row[1], row[2])
+
+        data = self._data[index]
+        if data.ndim != 2 or data.shape[1] != 3:
+            msg = ("the index shall select whole positions [Kx3], use "
+                   "toNumpy (or x, y, z) to access the coordinates "
+                   f"[current shape: {data.shape}]")
+            raise IndexError(msg)
+        return PositionArray.__wrap(data)
+
+    def __iter__(self):
+        """iterate over the positions as Position objects"""
+        for x, y, z in self._data.tolist():
+            yield Position(x, y, z)
+
+    def __array__(self, dtype=None, copy=None):
+        """numpy interface (e.g. np.asarray(positions))"""
+        if dtype is None or np.dtype(dtype) == self._data.dtype:
+            return self._data.copy() if copy else self._data
+        return self._data.astype(dtype)
+
+    def __eq__(self, __o: object) -> bool:
+        """internal method for equality"""
+        if isinstance(__o, PositionArray):
+            return np.array_equal(self._data, __o._data)
+        raise NotImplementedError(
+            "Class PositionArray equality with" +
+            f" this data type [{type(__o)} is not implemented]")
+
+    def __sub__(self, __o: object):
+        """internal method for subtraction (with a PositionArray of the same
+        size or a Position broadcasted to all the elements)"""
+        if isinstance(__o, PositionArray):
+            return PositionArray.__wrap(self._data - __o._data)
+        if isinstance(__o, Position):
+            return PositionArray.__wrap(
+                self._data - np.array([__o.x, __o.y, __o.z]))
+
+        msg = (
+            f"Class PositionArray subtraction with this data type [{type(__o)}"
+            " is not implemented]"
+        )
+        raise NotImplementedError(msg)
+
+# IMPORTER:
+    @classmethod
+    def __wrap(cls, data: np.ndarray):
+        """PRIVATE METHOD : create PositionArray around an existing [Nx3]
+        array without copy"""
+        newObj = PositionArray.__new__(PositionArray)
+        newObj._data = data
+        return newObj
+
+    @classmethod
+    def fromNumpy(cls, data: np.ndarray):
+        """Create a PositionArray based on a [Nx3] numpy array of cartesian
+        positions in ECEF reference. No copy is done if data is already a
+        C-contiguous float64 array
+
+        Args:
+            data (np.ndarray): array [Nx3] of the X,Y,Z positions in meter
+
+        Returns:
+            PositionArray: positions object
+        """
+        if not isinstance(data, np.ndarray):
+            raise TypeError(
+                f"data shall be a numpy array [current: {type(data)}] ")
+
+        data = dragonfly.utils.validation.validateVectorArray(data, "data")
+        return PositionArray.__wrap(np.ascontiguousarray(data))
+
+    @classmethod
+    def fromList(cls, data: list):
+        """Create a PositionArray based on a nested list of cartesian
+        positions in ECEF reference
+
+        Args:
+            data (list): nested list of [X,Y,Z] positions in meter
+
+        Returns:
+            PositionArray: positions object
+        """
+        if not isinstance(data, list):
+            raise TypeError(f"data shall be a list  [current: {type(data)}] ")
+
+        try:
+            array = np.array(data, dtype=np.float64)
+        except ValueError as exc:
+            msg = "data shall be a nested list of [X, Y, Z] numbers"
+            raise ValueError(msg) from exc
+
+        return PositionArray.fromNumpy(array)
+
+    @classmethod
+    def fromPosition(cls, positions):
+        """Create a PositionArray based on a Position or a list of Position
+
+        Args:
+            positions (Position | list[Position]): position objects
+
+        Returns:
+            PositionArray: positions object
+        """
+        if isinstance(positions, Position):
+            positions = [positions, ]
+
+        if not all(isinstance(pos, Position) for pos in positions):
+            raise TypeError("positions shall be Position objects")
+
+        return PositionArray.__wrap(
+            np.array([[pos.x, pos.y, pos.z] for pos in positions],
+                     dtype=np.float64).reshape((-1, 3)))
+
+    @classmethod
+    def fromLLA(cls, lat, long, alt=0.0, ellipsoid: str = _DEFAULT_MODEL):
+        """create a PositionArray object based on geodetic positions
+        (ie. latitude, longitude, altitude) in one vectorized pass
+
+        Args:
+            lat (array_like): latitudes in radians
+            long (array_like): longitudes in radians
+            alt (array_like, optional): altitudes in meters. Defaults to 0.
+            ellipsoid (str, optional): Model of
+                Earth Ellipsoid. Defaults to "WGS84".
+
+        Returns:
+            PositionArray: positions object
+        """
+        return PositionArray.__wrap(lla2ecef(lat, long, alt, ellipsoid))
+
+# ------------------------- PROPERTIES -------------------------
+    @property
+    def x(self) -> np.ndarray:
+        """x coordinates in ECEF (view on the storage)"""
+        return self._data[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """y coordinates in ECEF (view on the storage)"""
+        return self._data[:, 1]
+
+    @property
+    def z(self) -> np.ndarray:
+        """z coordinates in ECEF (view on the storage)"""
+        return self._data[:, 2]
+
+    @property
+    def norm(self) -> np.ndarray:
+        """norm of the ECEF coordinates of each position [N elements]"""
+        return np.sqrt(np.einsum("ij,ij->i", self._data, self._data))
+
+# ------------------------- EXPORTER -------------------------
+
+    def toNumpy(self) -> np.ndarray:
+        """Provide the ECEF positions as a numpy array (no copy)
+
+        Returns:
+            np.ndarray : array [Nx3] of the ECEF coordinates
+        """
+        return self._data
+
+    def toList(self) -> list:
+        """Provide the ECEF positions as a list of Position objects
+
+        Returns:
+            list : list of Position objects
+        """
+        return list(self)
+
+    def toLLA(self, ellipsoid: str = _DEFAULT_MODEL):
+        """return the geographic positions (i.e. latitude, longitude and
+        altitude) against an Ellipsoid model (by default WGS84) in one
+        vectorized pass (see ecef2lla)
+
+        Args:
+            ellipsoid (str, optional): Ellispoid reference.
+            Defaults to "WGS84".
+
+        Returns:
+            np.ndarray : latitudes in radians
+            np.ndarray : longitudes in radians
+            np.ndarray : altitudes in meters
+        """
+        return ecef2lla(self._data, ellipsoid)
@@ -0,0 +1,373 @@
+"""
+# ======================================================================= #
+# =========================== QUATERNION CLASS ========================== #
+# ======================================================================= #
+"""
+# EXPORT
+__all__ = [
+    "Quaternion"
+]
+
+# IMPORT
+import numpy as np
+import dragonfly
+from dragonfly.geography import dcm2angle
+
+
+class Quaternion:
+    """Class for the management of a set of attitudes stored as unit
+    quaternions [w, x, y, z] (scalar first) in a [Nx4] float64 numpy array.
+
+    The quaternions follow the Direction Cosine Matrix (DCM) convention of
+    angle2dcm: the DCM of q (toDcm) is the Hamilton rotation matrix of q,
+    so that (q1 * q2).toDcm() = q1.toDcm() @ q2.toDcm() and
+    q.rotate(v) = q.toDcm() @ v.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, w, x, y, z):
+        """create a Quaternion object based on its components
+
+        Args:
+            w (array_like): scalar parts [N elements]
+            x (array_like): first components of the vector parts
+            y (array_like): second components of the vector parts
+            z (array_like): third components of the vector parts
+        """
+        try:
+            components = np.broadcast_arrays(
+                *[np.ravel(np.asarray(value, dtype=np.float64))
+                  for value in (w, x, y, z)])
+        except ValueError as exc:
+            msg = ("w, x, y and z shall have the same number of elements"
+                   f" [current: {np.size(w)}, {np.size(x)}, {np.size(y)},"
+                   f" {np.size(z)}]")
+            raise ValueError(msg) from exc
+
+        self._data = np.stack(components, axis=-1)
+
+    def __repr__(self):
+        """internal method for the print"""
+        return (f"Quaternions [w, x, y, z] [{len(self)} attitudes]:\n"
+                f"{self._data}")
+
+    def __len__(self) -> int:
+        """number of attitudes"""
+        return self._data.shape[0]
+
+    def __getitem__(self, index):
+        """return a Quaternion with the selected attitude(s)"""
+        return Quaternion.__wrap(np.atleast_2d(self._data[index]))
+
+    def __array__(self, dtype=None, copy=None):
+        """numpy interface (e.g. np.asarray(quaternions))"""
+        if dtype is None or np.dtype(dtype) == self._data.dtype:
+            return self._data.copy() if copy else self._data
+        return self._data.astype(dtype)
+
+    def __eq__(self, __o: object) -> bool:
+        """internal method for equality"""
+        if isinstance(__o, Quaternion):
+            return np.array_equal(self._data, __o._data)
+        raise NotImplementedError(
+            "Class Quaternion equality with" +
+            f" this data type [{type(__o)} is not implemented]")
+
+    def __mul__(self, __o: object):
+        """composition of the attitudes (Hamilton product) element by element
+        (a single quaternion is broadcasted to all the elements)"""
+        if not isinstance(__o, Quaternion):
+            msg = (
+                f"Class Quaternion multiplication with this data type"
+                f" [{type(__o)} is not implemented]"
+            )
+            raise NotImplementedError(msg)
+
+        try:
+            data = np.empty(np.broadcast_shapes(self._data.shape,
+                                                __o._data.shape))
+        except ValueError as exc:
+            msg = ("Quaternions shall have the same number of elements"
+                   f" [current: {len(self)}, {len(__o)}]")
+            raise ValueError(msg) from exc
+
+        w1, x1, y1, z1 = self._data.T
+        w2, x2, y2, z2 = __o._data.T
+        data[:, 0] = w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2
+        data[:, 1] = w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2
+        data[:, 2] = w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2
+        data[:, 3] = w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
+
+        return Quaternion.__wrap(data)
+
+# IMPORTER:
+    @classmethod
+    def __wrap(cls, data: np.ndarray):
+        """PRIVATE METHOD : create Quaternion around an existing [Nx4]
+        array without copy"""
+        newObj = Quaternion.__new__(Quaternion)
+        newObj._data = data
+        return newObj
+
+    @classmethod
+    def identity(cls, size: int = 1):
+        """Create identity quaternions (no rotation)
+
+        Args:
+            size (int, optional): number of attitudes. Defaults to 1.
+
+        Returns:
+            Quaternion: quaternions object
+        """
+        size = dragonfly.utils.validation.validateInstance(size, int)
+        data = np.zeros((size, 4), dtype=np.float64)
+        data[:, 0] = 1.0
+        return Quaternion.__wrap(data)
+
+    @classmethod
+    def fromNumpy(cls, data: np.ndarray):
+        """Create a Quaternion based on a [Nx4] numpy array of [w, x, y, z]
+        components. No copy is done if data is already a C-contiguous
+        float64 array
+
+        Args:
+            data (np.ndarray): array [Nx4] of the quaternions
+
+        Returns:
+            Quaternion: quaternions object
+        """
+        if not isinstance(data, np.ndarray):
+            raise TypeError(
+                f"data shall be a numpy array [current: {type(data)}] ")
+
+        if data.ndim == 1 and data.shape[0] == 4:
+            data = data.reshape((1, 4))
+
+        if data.ndim != 2 or data.shape[1] != 4:
+            msg = f"data shall be a [Nx4] array [current: {data.shape}] "
+            raise ValueError(msg)
+
+        return Quaternion.__wrap(np.ascontiguousarray(data, dtype=np.float64))
+
+    @classmethod
+    def fromDcm(cls, dcm: np.ndarray):
+        """Create a Quaternion based on Direction Cosine Matrices (Shepperd's
+        method, the scalar parts are positive)
+
+        Args:
+            dcm (np.ndarray): direction cosine matrix [3x3] or stack of
+                matrices [Nx3x3]
+
+        Returns:
+            Quaternion: quaternions object
+        """
+        dcm = np.asarray(dcm, dtype=np.float64)
+        if dcm.ndim == 2:
+            dcm = dcm.reshape((1, 3, 3))
+
+        if dcm.ndim != 3 or dcm.shape[1:] != (3, 3):
+            msg = dragonfly.utils.exception.createErrorMessage(
+                errorMsg=("The DCM shall be a [3x3] matrix or a stack of"
+                          " matrices"),
+                expected="[3x3] or [Nx3x3] Numpy Array",
+                current=f"shape: {dcm.shape}",
+            )
+            raise ValueError(msg)
+
+        # largest of 4w^2, 4x^2, 4y^2, 4z^2 for the numerical stability
+        trace = np.trace(dcm, axis1=1, axis2=2)
+        diagonal = np.diagonal(dcm, axis1=1, axis2=2)
+        candidates = np.column_stack((trace, 2 * diagonal - trace[:, None]))
+        choice = np.argmax(candidates, axis=1)
+
+        data = np.empty((dcm.shape[0], 4), dtype=np.float64)
+        rows = np.arange(dcm.shape[0])
+
+        # w is the largest component
+        isW = choice == 0
+        M = dcm[isW]
+        data[isW, 0] = 1 + trace[isW]
+        data[isW, 1] = M[:, 2, 1] - M[:, 1, 2]
+        data[isW, 2] = M[:, 0, 2] - M[:, 2, 0]
+        data[isW, 3] = M[:, 1, 0] - M[:, 0, 1]
+
+        # a vector component is the largest component
+        for i in range(3):
+            isI = choice == i + 1
+            j = (i + 1) % 3
+            k = (i + 2) % 3
+            M = dcm[isI]
+            data[isI, 0] = M[:, k, j] - M[:, j, k]
+            data[isI, i + 1] = 1 + 2 * M[:, i, i] - trace[isI]
+            data[isI, j + 1] = M[:, j, i] + M[:, i, j]
+            data[isI, k + 1] = M[:, k, i] + M[:, i, k]
+
+        data /= np.linalg.norm(data, axis=1)[:, None]
+        data[data[rows, 0] < 0] *= -1
+        return Quaternion.__wrap(data)
+
+    @classmethod
+    def fromAngles(cls, rotAngle1, rotAngle2, rotAngle3,
+                   rotationSequence: str = "ZYX"):
+        """Create a Quaternion based on Euler Angles (same convention as
+        angle2dcm)
+
+        Args:
+            rotAngle1 (float | array_like): first angle of roation in radians
+                (e.g. yaw for 'ZYX')
+            rotAngle2 (float | array_like): second angle of roation in
+                radians (e.g. pitch for 'ZYX')
+            rotAngle3 (float | array_like): third angle of roation in
+                radians (e.g. roll for 'ZYX')
+            rotationSequence (str, optional): sequence of rotations.
+                Defaults to 'ZYX'.
+
+        Returns:
+            Quaternion: quaternions object
+        """
+        rotationSequence = \
+            dragonfly.utils.validation.validateRotationSequence(
+                rotationSequence)
+        try:
+            angles = np.broadcast_arrays(
+                *[np.ravel(np.asarray(angle, dtype=np.float64))
+                  for angle in (rotAngle1, rotAngle2, rotAngle3)])
+        except ValueError as exc:
+            msg = dragonfly.utils.exception.createErrorMessage(
+                errorMsg=("The angles shall be numbers or arrays of numbers"
+                          " with compatible shapes"),
+                expected="arrays [N elements]",
+                current=(f"{np.shape(rotAngle1)}, {np.shape(rotAngle2)},"
+                         f" {np.shape(rotAngle3)}"),
+            )
+            raise ValueError(msg) from exc
+
+        # successive rotations of the frame: q3 * q2 * q1
+        quaternion = None
+        for axis, angle in zip(rotationSequence, angles):
+            data = np.zeros((angle.size, 4), dtype=np.float64)
+            data[:, 0] = np.cos(angle / 2)
+            data[:, "XYZ".index(axis) + 1] = -np.sin(angle / 2)
+            elementary = Quaternion.__wrap(data)
+            quaternion = elementary if quaternion is None else \
+                elementary * quaternion
+        return quaternion
+
+# ------------------------- PROPERTIES -------------------------
+    @property
+    def w(self) -> np.ndarray:
+        """scalar parts (view on the storage)"""
+        return self._data[:, 0]
+
+    @property
+    def x(self) -> np.ndarray:
+        """first components of the vector parts (view on the storage)"""
+        return self._data[:, 1]
+
+    @property
+    def y(self) -> np.ndarray:
+        """second components of the vector parts (view on the storage)"""
+        return self._data[:, 2]
+
+    @property
+    def z(self) -> np.ndarray:
+        """third components of the vector parts (view on the storage)"""
+        return self._data[:, 3]
+
+    @property
+    def norm(self) -> np.ndarray:
+        """norm of the quaternions [N elements]"""
+        return np.sqrt(np.einsum("ij,ij->i", self._data, self._data))
+
+# ------------------------- ALGEBRA -------------------------
+    def normalize(self):
+        """Provide the unit quaternions (e.g. to remove the drift of a long
+        chain of compositions)
+
+        Returns:
+            Quaternion: normalized quaternions
+        """
+        return Quaternion.__wrap(self._data / self.norm[:, None])
+
+    def conjugate(self):
+        """Provide the conjugate quaternions
+
+        Returns:
+            Quaternion: conjugate quaternions
+        """
+        return Quaternion.__wrap(self._data * np.array([1., -1., -1., -1.]))
+
+    def inverse(self):
+        """Provide the inverse quaternions (i.e. the inverse rotations)
+
+        Returns:
+            Quaternion: inverse quaternions
+        """
+        data = self.conjugate()._data
+        data /= np.einsum("ij,ij->i", self._data, self._data)[:, None]
+        return Quaternion.__wrap(data)
+
+    def rotate(self, vectors) -> np.ndarray:
+        """Transform vectors with the attitudes (equivalent to dcm @ vector)
+        element by element (a single quaternion or a single vector is
+        broadcasted). The quaternions are normalized as in toDcm
+
+        Args:
+            vectors (array_like): vectors [Nx3] (or [3])
+
+        Returns:
+            np.ndarray: transformed vectors [Nx3]
+        """
+        vectors = dragonfly.utils.validation.validateVectorArray(vectors)
+
+        # v' = v + 2 w (u x v) + 2 u x (u x v)
+        q = self.normalize()._data
+        w = q[:, :1]
+        u = q[:, 1:]
+        t = 2 * np.cross(u, vectors)
+        return vectors + w * t + np.cross(u, t)
+
+# ------------------------- EXPORTER -------------------------
+    def toNumpy(self) -> np.ndarray:
+        """Provide the quaternions as a numpy array (no copy)
+
+        Returns:
+            np.ndarray : array [Nx4] of the [w, x, y, z] components
+        """
+        return self._data
+
+    def toDcm(self) -> np.ndarray:
+        """Provide the Direction Cosine Matrices of the attitudes
+
+        Returns:
+            np.ndarray: direction cosine matrices [Nx3x3]
+        """
+        q = self.normalize()._data
+        w, x, y, z = q.T
+
+        dcm = np.empty((q.shape[0], 3, 3), dtype=np.float64)
+        dcm[:, 0, 0] = 1 - 2 * (y**2 + z**2)
+        dcm[:, 0, 1] = 2 * (x * y - w * z)
+        dcm[:, 0, 2] = 2 * (x * z + w * y)
+        dcm[:, 1, 0] = 2 * (x * y + w * z)
+        dcm[:, 1, 1] = 1 - 2 * (x**2 + z**2)
+        dcm[:, 1, 2] = 2 * (y * z - w * x)
+        dcm[:, 2, 0] = 2 * (x * z - w * y)
+        dcm[:, 2, 1] = 2 * (y * z + w * x)
+        dcm[:, 2, 2] = 1 - 2 * (x**2 + y**2)
+        return dcm
+
+    def toAngles(self, rotationSequence: str = "ZYX") -> tuple:
+        """Provide the Euler Angles of the attitudes (see dcm2angle)
+
+        Args:
+            rotationSequence (str, optional): sequence of rotations.
+                Defaults to 'ZYX'.
+
+        Returns:
+            np.ndarray: first angles of rotation in radians
+            np.ndarray: second angles of rotation in radians
+            np.ndarray: third angles of rotation in radians
+        """
+        return dcm2angle(self.toDcm(), rotationSequence)
@@ -7,21 +7,43 @@
 # EXPORT
 __all__ = [
     "getRange",
+    "getRanges",
+    "getRangeMatrix",
 ]
 
 # IMPORT
 import math
+import os
+import itertools
+import concurrent.futures
 import dragonfly
 import numpy as np
+from dragonfly.geography import getInverseGeodesic
 
 
 # PARAMETER
 _DEFAULT_MODEL = dragonfly.constants.DEFAULT_SETTINGS.EarthEllipsoid
+_METHODS = ("VINCENTY", "KARNEY")
+
+
+def _validateMethod(method: str) -> str:
+    """PRIVATE FUNCTION - check the name of the range calculation method"""
+    method = dragonfly.utils.validation.validateInstance(method, str)
+    if method.upper() in _METHODS:
+        return method.upper()
+
+    msg = dragonfly.utils.exception.createErrorMessage(
+        errorMsg="Unknown range calculation method",
+        expected=str(_METHODS),
+        current=method,
+    )
+    raise ValueError(msg)
 
 
 def getRange(lat1: float, long1: float, lat2: float, long2: float,
              earth_model: str = _DEFAULT_MODEL,
-             nbIter: int = 200) -> float:
+             nbIter: int = 200,
+             method: str = "vincenty") -> float:
     """Calculate the distance between two points on the surface of a spheroid
 
     Args:
@@ -30,17 +52,43 @@ def getRange(lat1: float, long1: float, lat2: float, long2: float,
         lat2 (float): final latitude in radians
         long2 (float): final initial longitude in radians
         earth_model (str, optional): _description_. Defaults to "WGS84".
+        nbIter (int, optional): maximum number of iterations of the
+            Vincenty method. Defaults to 200.
+        method (str, optional): "vincenty" (may not converge for near
+            antipodal points) or "karney" (always converges, see
+            getInverseGeodesic). Defaults to "vincenty".
 
     Returns:
-        float: distance in meters
+        float: distance in meters (None if the Vincenty method does not
+            converge)
     """
 
+    method = _validateMethod(method)
+
     # latitue assertion
     if not (abs(lat1) <= np.pi/2 and abs(lat2) <= np.pi/2):
         msg = ("Latitudes Value shall be lower than 90"
                f" (lat1: {np.rad2deg(lat1)} , lat2: {np.rad2deg(lat2)})")
         raise ValueError(msg)
 
+    if method == "KARNEY":
+        return _karneyRange(lat1, long1, lat2, long2, earth_model)
+    return _vincentyRange(lat1, long1, lat2, long2, earth_model, nbIter)
+
+
+def _karneyRange(lat1: float, long1: float, lat2: float, long2: float,
+                 earth_model: str) -> float:
+    """PRIVATE FUNCTION - distance between two points with Karney's
+    algorithm (see getInverseGeodesic)"""
+    s = getInverseGeodesic(lat1, long1, lat2, long2, earth_model)[0]
+    return round(float(s), 4)
+
+
+def _vincentyRange(lat1: float, long1: float, lat2: float, long2: float,
+                   earth_model: str, nbIter: int) -> float:
+    """PRIVATE FUNCTION - distance between two points with the Vincenty
+    inverse formula (None if it does not converge)"""
+
     # short-circuit coincident points
     if lat1 == lat2 and long1 == long2:
         return 0.0
@@ -109,3 +157,300 @@ def getRange(lat1: float, long1: float, lat2: float, long2: float,
     s = b * A * (sigma - deltaSigma)
 
     return round(s, 4)
+
+
+def getRanges(lat1, long1, lat2, long2,
+              earth_model: str = _DEFAULT_MODEL,
+              nbIter: int = 200,
+              method: str = "vincenty") -> tuple[np.ndarray, np.ndarray]:
+    """Calculate the distances between pairs of points on the surface of a
+    spheroid with the Vincenty inverse formula (all the pairs are iterated
+    simultaneously and each pair is frozen as soon as it has converged) or
+    with Karney's algorithm (no failure, see getInverseGeodesic).
+
+    Args:
+        lat1 (array_like): initial latitudes in radians
+        long1 (array_like): initial longitudes in radians
+        lat2 (array_like): final latitudes in radians
+        long2 (array_like): final longitudes in radians
+        earth_model (str, optional): name of the Ellipsoid model.
+            Defaults to "WGS84".
+        nbIter (int, optional): maximum number of iterations of the
+            Vincenty method. Defaults to 200.
+        method (str, optional): "vincenty" or "karney".
+            Defaults to "vincenty".
+
+    Returns:
+        np.ndarray: distances in meters (NaN for the non converged pairs),
+            with the broadcasted shape of the inputs
+        np.ndarray: boolean mask of the non converged pairs (always False
+            with the Karney method)
+    """
+    if _validateMethod(method) == "KARNEY":
+        s = getInverseGeodesic(lat1, long1, lat2, long2, earth_model)[0]
+        return np.round(s, 4), np.zeros(s.shape, dtype=bool)
+
+    lat1, long1, lat2, long2 = np.broadcast_arrays(
+        *[np.asarray(value, dtype=np.float64)
+          for value in (lat1, long1, lat2, long2)])
+    shape = lat1.shape
+
+    # latitue assertion
+    if not (np.all(np.abs(lat1) <= np.pi/2) and
+            np.all(np.abs(lat2) <= np.pi/2)):
+        msg = "Latitudes Value shall be lower than 90"
+        raise ValueError(msg)
+
+    # load earth model
+    earth = dragonfly.constants.EarthModel(earth_model)
+
+    s, converged = _vincentyInverse(
+        lat1.ravel(), long1.ravel(), lat2.ravel(), long2.ravel(),
+        earth.a, earth.b, earth.f, nbIter)
+
+    return np.round(s, 4).reshape(shape), ~converged.reshape(shape)
+
+
+def _vincentyInverse(lat1: np.ndarray, long1: np.ndarray,
+                     lat2: np.ndarray, long2: np.ndarray,
+                     a: float, b: float, f: float,
+                     nbIter: int) -> tuple[np.ndarray, np.ndarray]:
+    """PRIVATE FUNCTION - vectorized Vincenty inverse formula on 1D arrays
+
+    Returns:
+        np.ndarray: distances in meters (NaN if not converged)
+        np.ndarray: boolean mask of the converged pairs
+    """
+
+    # constant
+    CONVERGENCE_THRESHOLD = 1e-12
+    POLE_LIMIT = np.pi/2 - 1e-10
+
+    # correct for errors at exact poles by adjusting 0.6 millimeters
+    lat1 = np.clip(lat1, -POLE_LIMIT, POLE_LIMIT)
+    lat2 = np.clip(lat2, -POLE_LIMIT, POLE_LIMIT)
+
+    U1 = np.arctan((1 - f) * np.tan(lat1))
+    U2 = np.arctan((1 - f) * np.tan(lat2))
+    L = long2 - long1
+
+    sinU1 = np.sin(U1)
+    cosU1 = np.cos(U1)
+    sinU2 = np.sin(U2)
+    cosU2 = np.cos(U2)
+
+    # state of each pair (values of the last iteration)
+    nbPairs = L.size
+    sinSigma = np.zeros(nbPairs)
+    cosSigma = np.ones(nbPairs)
+    sigma = np.zeros(nbPairs)
+    cosSqAlpha = np.ones(nbPairs)
+    cos2SigmaM = np.zeros(nbPairs)
+
+    # short-circuit coincident points
+    converged = (lat1 == lat2) & (long1 == long2)
+
+    # indexes of the pairs still iterating and their lambda
+    active = np.flatnonzero(~converged)
+    Lambda = L[active]
+
+    for _ in range(nbIter):
+        if active.size == 0:
+            break
+
+        sU1, cU1 = sinU1[active], cosU1[active]
+        sU2, cU2 = sinU2[active], cosU2[active]
+
+        sinLambda = np.sin(Lambda)
+        cosLambda = np.cos(Lambda)
+        sSigma = np.sqrt((cU2 * sinLambda) ** 2 +
+                         (cU1 * sU2 - sU1 * cU2 * cosLambda) ** 2)
+        cSigma = sU1 * sU2 + cU1 * cU2 * cosLambda
+        sig = np.arctan2(sSigma, cSigma)
+
+        coincident = sSigma == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sinAlpha = np.where(coincident, 0.0,
+                                cU1 * cU2 * sinLambda / sSigma)
+            cSqAlpha = 1 - sinAlpha ** 2
+            c2SigmaM = np.where(cSqAlpha == 0, 0.0,
+                                cSigma - 2 * sU1 * sU2 / cSqAlpha)
+
+        C = f / 16 * cSqAlpha * (4 + f * (4 - 3 * cSqAlpha))
+        LambdaPrev = Lambda
+        Lambda = L[active] + (1 - C) * f * sinAlpha * (
+            sig + C * sSigma * (c2SigmaM + C * cSigma *
+                                (-1 + 2 * c2SigmaM ** 2)))
+
+        # store the state
+        sinSigma[active] = sSigma
+        cosSigma[active] = cSigma
+        sigma[active] = sig
+        cosSqAlpha[active] = cSqAlpha
+        cos2SigmaM[active] = c2SigmaM
+
+        # successful convergence (or coincident points)
+        done = (np.abs(Lambda - LambdaPrev) < CONVERGENCE_THRESHOLD) | \
+            coincident
+        converged[active[done]] = True
+        active = active[~done]
+        Lambda = Lambda[~done]
+
+    uSq = cosSqAlpha * (a ** 2 - b ** 2) / (b ** 2)
+    A = 1 + uSq / 16384 * (4096 + uSq * (-768 + uSq * (320 - 175 * uSq)))
+    B = uSq / 1024 * (256 + uSq * (-128 + uSq * (74 - 47 * uSq)))
+    deltaSigma = (B * sinSigma * (cos2SigmaM + B / 4 * (cosSigma *
+                  (-1 + 2 * cos2SigmaM ** 2) - B / 6 * cos2SigmaM *
+                  (-3 + 4 * sinSigma ** 2) * (-3 + 4 * cos2SigmaM ** 2))))
+    s = b * A * (sigma - deltaSigma)
+
+    # failure to converge
+    s[~converged] = np.nan
+
+    return s, converged
+
+
+def getRangeMatrix(pointsA, pointsB,
+                   earth_model: str = _DEFAULT_MODEL,
+                   nbIter: int = 200, *,
+                   method: str = "vincenty",
+                   tileSize: int = 512,
+                   nbWorkers: int = 1,
+                   out: np.ndarray | None = None,
+                   outPath: str | os.PathLike[str] | None = None
+                   ) -> np.ndarray:
+    """Calculate the [NxM] matrix of the distances between each point of
+    pointsA and each point of pointsB. The matrix is computed by square
+    tiles of tileSize x tileSize pairs (bounded memory), optionally spread
+    across a pool of processes, and written into a numpy array, a caller
+    provided array or a memory-mapped .npy file.
+
+    Args:
+        pointsA (array_like): array [Nx2] of [latitude, longitude] in radians
+        pointsB (array_like): array [Mx2] of [latitude, longitude] in radians
+        earth_model (str, optional): name of the Ellipsoid model.
+            Defaults to "WGS84".
+        nbIter (int, optional): maximum number of iterations of the
+            Vincenty method. Defaults to 200.
+        method (str, optional): "vincenty" or "karney".
+            Defaults to "vincenty".
+        tileSize (int, optional): number of rows and columns of a tile.
+            Defaults to 512.
+        nbWorkers (int, optional): number of processes used to compute
+            the tiles (1 to compute them in the current process).
+            Defaults to 1.
+        out (np.ndarray, optional): [NxM] float64 array (e.g. np.memmap)
+            receiving the result. Defaults to None.
+        outPath (str | os.PathLike, optional): path of a .npy file created
+            as a memory-mapped array receiving the result (ignored if out
+            is provided). Defaults to None.
+
+    Returns:
+        np.ndarray: [NxM] matrix of the distances in meters (NaN for the non
+            converged pairs)
+    """
+    method = _validateMethod(method)
+    pointsA = _asLatLongArray(pointsA, "pointsA")
+    pointsB = _asLatLongArray(pointsB, "pointsB")
+    tileSize = dragonfly.utils.validation.validateInstance(tileSize, int)
+    nbWorkers = dragonfly.utils.validation.validateInstance(nbWorkers, int)
+    if tileSize < 1 or nbWorkers < 1:
+        msg = ("tileSize and nbWorkers shall be strictly positive"
+               f" [current: {tileSize}, {nbWorkers}]")
+        raise ValueError(msg)
+
+    # latitue assertion (once for all the tiles)
+    if not (np.all(np.abs(pointsA[:, 0]) <= np.pi/2) and
+            np.all(np.abs(pointsB[:, 0]) <= np.pi/2)):
+        msg = "Latitudes Value shall be lower than 90"
+        raise ValueError(msg)
+
+    shape = (pointsA.shape[0], pointsB.shape[0])
+    out = _allocateMatrix(shape, out, outPath)
+
+    def tileArgs(row: int, col: int) -> tuple:
+        rowsA = pointsA[row:row + tileSize]
+        colsB = pointsB[col:col + tileSize]
+        return (rowsA[:, 0:1], rowsA[:, 1:2], colsB[:, 0], colsB[:, 1],
+                earth_model, nbIter, method)
+
+    tiles = itertools.product(range(0, shape[0], tileSize),
+                              range(0, shape[1], tileSize))
+    _computeTiles(tiles, tileArgs, out, nbWorkers)
+
+    if isinstance(out, np.memmap):
+        out.flush()
+
+    return out
+
+
+def _asLatLongArray(points, name: str) -> np.ndarray:
+    """PRIVATE FUNCTION - provide points as a [Nx2] float64 numpy array"""
+    data = np.asarray(points, dtype=np.float64)
+    if data.ndim != 2 or data.shape[1] != 2:
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg=f"{name} shall be mutable to a [Nx2] numpy array",
+            expected="[Nx2] array of [latitude, longitude]",
+            current=f"shape: {data.shape}",
+        )
+        raise ValueError(msg)
+    return data
+
+
+def _allocateMatrix(shape: tuple, out: np.ndarray | None,
+                    outPath: str | os.PathLike[str] | None) -> np.ndarray:
+    """PRIVATE FUNCTION - output matrix of getRangeMatrix: the caller
+    provided array, a memory-mapped .npy file or a new numpy array"""
+    if out is None:
+        if outPath is None:
+            return np.empty(shape, dtype=np.float64)
+        return np.lib.format.open_memmap(outPath, mode="w+",
+                                         dtype=np.float64, shape=shape)
+    if not (isinstance(out, np.ndarray) and out.shape == shape):
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg="out shall be a numpy array with the matrix shape",
+            expected=f"{shape} numpy array",
+            current=f"{type(out)} - shape: {np.shape(out)}",
+        )
+        raise ValueError(msg)
+    return out
+
+
+def _computeTiles(tiles, tileArgs, out: np.ndarray, nbWorkers: int) -> None:
+    """PRIVATE FUNCTION - compute the (row, col) tiles of the range matrix
+    in the current process or in a pool of nbWorkers processes and write
+    them into out"""
+    if nbWorkers == 1:
+        for row, col in tiles:
+            tile = _rangeTile(*tileArgs(row, col))
+            out[row:row + tile.shape[0], col:col + tile.shape[1]] = tile
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(nbWorkers) as executor:
+        pending = {}
+        for row, col in tiles:
+            # bound the number of tiles in flight (memory)
+            if len(pending) >= 2 * nbWorkers:
+                _collectTiles(pending, out,
+                              concurrent.futures.FIRST_COMPLETED)
+            future = executor.submit(_rangeTile, *tileArgs(row, col))
+            pending[future] = (row, col)
+        _collectTiles(pending, out, concurrent.futures.ALL_COMPLETED)
+
+
+def _collectTiles(pending: dict, out: np.ndarray, returnWhen: str) -> None:
+    """PRIVATE FUNCTION - wait for computed tiles and write them into out"""
+    done, _ = concurrent.futures.wait(pending, return_when=returnWhen)
+    for future in done:
+        row, col = pending.pop(future)
+        tile = future.result()
+        out[row:row + tile.shape[0], col:col + tile.shape[1]] = tile
+
+
+def _rangeTile(lat1: np.ndarray, long1: np.ndarray,
+               lat2: np.ndarray, long2: np.ndarray,
+               earth_model: str, nbIter: int, method: str) -> np.ndarray:
+    """PRIVATE FUNCTION - compute one tile of the range matrix (shall be
+    defined at module level to be sent to a process pool)"""
+    return getRanges(lat1, long1, lat2, long2, earth_model, nbIter,
+                     method)[0]
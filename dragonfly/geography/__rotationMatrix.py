@@ -5,6 +5,8 @@
 # EXPORT
 __all__ = [
     "dcm_eci2ecef",
+    "eci2ecef",
+    "ecef2eci",
     "dcm_ecef2enu",
     "dcm_ecef2ned",
     "dcm2angle",
@@ -17,7 +19,12 @@ import dragonfly
 from dragonfly.utils.math import rotx, roty, rotz
 
 
-def dcm_eci2ecef(dt: float) -> np.ndarray:
+# PARAMETERS
+_AXES = {"X": 0, "Y": 1, "Z": 2}
+_ELEMENTARY_DCM = {"X": rotx, "Y": roty, "Z": rotz}
+
+
+def dcm_eci2ecef(dt) -> np.ndarray:
     """Provide the Direct Cosine Matrix to convert Earth-centered inertial
      (ECI) to Earth-centered Earth-fixed (ECEF) coordinates
 
@@ -26,97 +33,233 @@ def dcm_eci2ecef(dt: float) -> np.ndarray:
         plane.
     - The z-axis points northward along the Earth rotation axis.
 
+    The matrices are computed in closed form (rotation around the z-axis),
+    for one time or a stack of times in one vectorized pass.
+
     Args:
-        dt (float): time in second since the user defined the Earth Center
-        Inertial (ECI) frame. This value shall be positive (>=0)
+        dt (float | array_like): time in second since the user defined the
+        Earth Center Inertial (ECI) frame. This value shall be positive (>=0)
 
     Returns:
-        np.ndarray: rotational matrix [3x3] to transform a vector in ECI in
-        the ECEF frame
+        np.ndarray: rotational matrix [3x3] (or [Nx3x3] for N times) to
+        transform a vector in ECI in the ECEF frame
     """
 
     # voir https://github.com/NavPy/NavPy/blob/master/navpy/core/navpy.py
-
     return rotz(
-        dragonfly.constants.EarthModel.earthRotationRate * dt
+        dragonfly.constants.EarthModel.earthRotationRate *
+        np.asarray(dt, dtype=np.float64)
     )
 
 
-def dcm_ecef2ned(latitude: float, longitude: float) -> np.ndarray:
+def _rotateEarth(positions, dt, sign: float) -> np.ndarray:
+    """PRIVATE FUNCTION - rotate [Nx3] vectors around the z-axis by the
+    Earth rotation angle (sign=1: ECI to ECEF, sign=-1: ECEF to ECI)"""
+    data = dragonfly.utils.validation.validateVectorArray(
+        positions, "positions")
+    theta = sign * dragonfly.constants.EarthModel.earthRotationRate * \
+        np.ravel(np.asarray(dt, dtype=np.float64))
+    if theta.size not in (1, data.shape[0]):
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg="One time or one time per position is expected",
+            expected=f"1 or {data.shape[0]} elements",
+            current=f"{theta.size} elements",
+        )
+        raise ValueError(msg)
+
+    sinTheta = np.sin(theta)
+    cosTheta = np.cos(theta)
+
+    rotated = np.empty_like(data)
+    rotated[:, 0] = cosTheta * data[:, 0] + sinTheta * data[:, 1]
+    rotated[:, 1] = cosTheta * data[:, 1] - sinTheta * data[:, 0]
+    rotated[:, 2] = data[:, 2]
+    return rotated
+
+
+def eci2ecef(positions, dt) -> np.ndarray:
+    """Convert vectors defined in the Earth-centered inertial (ECI) frame
+    into the Earth-centered Earth-fixed (ECEF) frame (see dcm_eci2ecef)
+    without building the rotation matrices
+
+    Args:
+        positions (array_like): ECI vectors [Nx3]
+        dt (float | array_like): time in second since the definition of
+            the ECI frame (one time or one time per vector)
+
+    Returns:
+        np.ndarray: ECEF vectors [Nx3]
+    """
+    return _rotateEarth(positions, dt, 1.0)
+
+
+def ecef2eci(positions, dt) -> np.ndarray:
+    """Convert vectors defined in the Earth-centered Earth-fixed (ECEF)
+    frame into the Earth-centered inertial (ECI) frame (see dcm_eci2ecef)
+    without building the rotation matrices
+
+    Args:
+        positions (array_like): ECEF vectors [Nx3]
+        dt (float | array_like): time in second since the definition of
+            the ECI frame (one time or one time per vector)
+
+    Returns:
+        np.ndarray: ECI vectors [Nx3]
+    """
+    return _rotateEarth(positions, dt, -1.0)
+
+
+def _asLatLong(latitude, longitude) -> tuple[np.ndarray, np.ndarray]:
+    """PRIVATE FUNCTION - broadcast latitudes and longitudes as float64
+    numpy arrays"""
+    try:
+        return np.broadcast_arrays(np.asarray(latitude, dtype=np.float64),
+                                   np.asarray(longitude, dtype=np.float64))
+    except ValueError as exc:
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg=("latitude and longitude shall be numbers or arrays of"
+                      " numbers with compatible shapes"),
+            expected="arrays [N elements]",
+            current=f"{np.shape(latitude)}, {np.shape(longitude)}",
+        )
+        raise ValueError(msg) from exc
+
+
+def dcm_ecef2ned(latitude, longitude) -> np.ndarray:
     """Calculate the rotational matrix from the ECEF (Earth Centered Earth
     Fixed) to NED (North Earth Down) to transform a vector defined in ECEF
     to NED frame
 
+    The matrices are computed in closed form from the sines and cosines of
+    the angles, for one point or a stack of points in one vectorized pass.
+
     Args:
-        latitude (float): latitude of the geographical point in radians
-        longitude (float): longitude of the geographical point in radians
+        latitude (float | array_like): latitude of the geographical
+            point(s) in radians
+        longitude (float | array_like): longitude of the geographical
+            point(s) in radians
 
     Returns:
-        np.ndarray: Direct Cosinus Matrix from ECEF to NED
+        np.ndarray: Direct Cosinus Matrix from ECEF to NED ([3x3] for
+            scalars, [Nx3x3] for arrays of N points)
     """
-
-    M = np.matmul(
-        roty(-(latitude + np.pi / 2)),
-        rotz(longitude)
-    )
+    latitude, longitude = _asLatLong(latitude, longitude)
+
+    sinLat = np.sin(latitude)
+    cosLat = np.cos(latitude)
+    sinLong = np.sin(longitude)
+    cosLong = np.cos(longitude)
+
+    M = np.empty(latitude.shape + (3, 3), dtype=np.float64)
+    M[..., 0, 0] = -sinLat * cosLong
+    M[..., 0, 1] = -sinLat * sinLong
+    M[..., 0, 2] = cosLat
+    M[..., 1, 0] = -sinLong
+    M[..., 1, 1] = cosLong
+    M[..., 1, 2] = 0.0
+    M[..., 2, 0] = -cosLat * cosLong
+    M[..., 2, 1] = -cosLat * sinLong
+    M[..., 2, 2] = -sinLat
 
     return M
 
 
-def dcm_ecef2enu(latitude: float, longitude: float) -> np.ndarray:
+def dcm_ecef2enu(latitude, longitude) -> np.ndarray:
     """Calculate the rotational matrix from the ECEF (Earth Centered Earth
      Fixed) to ENU (East North Up) to transform a vector defined in ECEF to
      ENU frame
 
+    The matrices are computed in closed form from the sines and cosines of
+    the angles, for one point or a stack of points in one vectorized pass.
+
     Args:
-        latitude (float): latitude of the geographical point in radians
-        longitude (float): longitude of the geographical point in radians
+        latitude (float | array_like): latitude of the geographical
+            point(s) in radians
+        longitude (float | array_like): longitude of the geographical
+            point(s) in radians
 
     Reference:
         https://gssc.esa.int/navipedia/index.php/Transformations_between_ECEF_and_ENU_coordinates
 
     Returns:
-        np.ndarray: Direct Cosinus Matrix from ECEF to ENU
+        np.ndarray: Direct Cosinus Matrix from ECEF to ENU ([3x3] for
+            scalars, [Nx3x3] for arrays of N points)
     """
+    latitude, longitude = _asLatLong(latitude, longitude)
+
+    sinLat = np.sin(latitude)
+    cosLat = np.cos(latitude)
+    sinLong = np.sin(longitude)
+    cosLong = np.cos(longitude)
+
+    M = np.empty(latitude.shape + (3, 3), dtype=np.float64)
+    M[..., 0, 0] = -sinLong
+    M[..., 0, 1] = cosLong
+    M[..., 0, 2] = 0.0
+    M[..., 1, 0] = -sinLat * cosLong
+    M[..., 1, 1] = -sinLat * sinLong
+    M[..., 1, 2] = cosLat
+    M[..., 2, 0] = cosLat * cosLong
+    M[..., 2, 1] = cosLat * sinLong
+    M[..., 2, 2] = sinLat
 
-    return (
-        rotx(np.pi / 2) @ rotz(np.pi / 2) @ roty(-latitude) @ rotz(longitude)
-    )  # np.matmul(roty(-latitude+np.pi/2),rotz(np.pi/2+longitude))
+    return M
 
 
-def angle2dcm(rotAngle1: float, rotAngle2: float,
-              rotAngle3: float, rotationSequence: str = 'ZYX') -> np.ndarray:
+def angle2dcm(rotAngle1, rotAngle2, rotAngle3,
+              rotationSequence: str = 'ZYX') -> np.ndarray:
     """This function converts Euler Angle into Direction Cosine Matrix (DCM).
+
+    The twelve sequences (Tait-Bryan and proper Euler angles) are supported
+    and the angles may be arrays: the matrices are computed in closed form
+    for all the sets of angles in one vectorized pass.
+
     Args:
-        rotAngle1 (float): first angle of roation in radians
+        rotAngle1 (float | array_like): first angle of roation in radians
             (e.g. yaw for 'ZYX')
-        rotAngle2 (float): second angle of roation in radians
+        rotAngle2 (float | array_like): second angle of roation in radians
             (e.g. pitch for 'ZYX')
-        rotAngle3 (float): third angle of roation in radians
+        rotAngle3 (float | array_like): third angle of roation in radians
             (e.g. roll for 'ZYX')
         rotationSequence (str, optional): sequence of rotations.
             Defaults to 'ZYX'.
 
     Returns:
         np.ndarray: direction cosine matrix associated to the rotation angles
+            ([3x3] for scalars, [Nx3x3] for arrays of N angles)
     """
-
-    if rotationSequence.upper() == "ZYX":
-        return rotx(rotAngle3)@roty(rotAngle2)@rotz(rotAngle1)
-    else:
-        msg = (f"Rotation sequence {rotationSequence.upper()}"
-               " is not implemented.")
-        raise NotImplementedError(msg)
+    rotationSequence = dragonfly.utils.validation.validateRotationSequence(
+        rotationSequence)
+    try:
+        angles = np.broadcast_arrays(
+            *[np.asarray(angle, dtype=np.float64)
+              for angle in (rotAngle1, rotAngle2, rotAngle3)])
+    except ValueError as exc:
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg=("The angles shall be numbers or arrays of numbers"
+                      " with compatible shapes"),
+            expected="arrays [N elements]",
+            current=(f"{np.shape(rotAngle1)}, {np.shape(rotAngle2)},"
+                     f" {np.shape(rotAngle3)}"),
+        )
+        raise ValueError(msg) from exc
+
+    # successive rotations of the frame: R3 @ R2 @ R1
+    M = _ELEMENTARY_DCM[rotationSequence[0]](angles[0])
+    for axis, angle in zip(rotationSequence[1:], angles[1:]):
+        M = _ELEMENTARY_DCM[axis](angle) @ M
+    return M
 
 
-def dcm2angle(dcm: np.ndarray,
-              rotationSequence: str = 'ZYX') -> tuple[float, float, float]:
+def dcm2angle(dcm: np.ndarray, rotationSequence: str = 'ZYX') -> tuple:
     """This function converts a Direction Cosine Matrix (DCM) into the three
     rotation angles.
 
     Notes:
     The returned rotAngle1 and 3 will be between   +/- 180 deg (+/- pi rad).
-    In contrast, rotAngle2 will be in the interval +/- 90 deg (+/- pi/2 rad).
+    In contrast, rotAngle2 will be in the interval +/- 90 deg (+/- pi/2 rad)
+    for the Tait-Bryan sequences (e.g. 'ZYX') and in the interval [0, 180]
+    deg ([0, pi] rad) for the proper Euler sequences (e.g. 'ZXZ').
     In the 'ZYX' or '321' aerospace sequence, that means the pitch angle
     returned will always be inside the closed interval +/- 90 deg
     (+/- pi/2 rad).
@@ -126,26 +269,46 @@ def dcm2angle(dcm: np.ndarray,
 
     Args:
         dcm (np.ndarray): direction cosine matrix associated
-            to the rotation angles
+            to the rotation angles ([3x3] or stack [Nx3x3])
         rotationSequence (str, optional): sequence of rotations.
             Defaults to 'ZYX'.
 
     Returns:
-        rotAngle1 (float): first angle of roation in radians
+        rotAngle1 (float | np.ndarray): first angle of roation in radians
             (e.g. yaw for 'ZYX')
-        rotAngle2 (float): second angle of roation in radians
+        rotAngle2 (float | np.ndarray): second angle of roation in radians
             (e.g. pitch for 'ZYX')
-        rotAngle3 (float): third angle of roation in radians
+        rotAngle3 (float | np.ndarray): third angle of roation in radians
             (e.g. roll for 'ZYX')
     """
-
-    if rotationSequence.upper() == "ZYX":
-        rotAngle1 = np.arctan2(dcm[0, 1], dcm[0, 0])   # Yaw
-        rotAngle2 = -np.arcsin(dcm[0, 2])  # Pitch
-        rotAngle3 = np.arctan2(dcm[1, 2], dcm[2, 2])  # Roll
-
-        return rotAngle1, rotAngle2, rotAngle3
+    rotationSequence = dragonfly.utils.validation.validateRotationSequence(
+        rotationSequence)
+    dcm = np.asarray(dcm, dtype=np.float64)
+    if dcm.ndim < 2 or dcm.shape[-2:] != (3, 3):
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg="The DCM shall be a [3x3] matrix or a stack of matrices",
+            expected="[3x3] or [Nx3x3] Numpy Array",
+            current=f"shape: {dcm.shape}",
+        )
+        raise ValueError(msg)
+
+    # the transposed DCM is the product of the rotations Ri @ Rj @ Rk of
+    # the vectors (i.e. C[q, p] = A[p, q])
+    i = _AXES[rotationSequence[0]]
+    j = _AXES[rotationSequence[1]]
+    if rotationSequence[0] != rotationSequence[2]:
+        # Tait-Bryan angles
+        k = _AXES[rotationSequence[2]]
+        sign = 1.0 if (j - i) % 3 == 1 else -1.0
+        rotAngle1 = np.arctan2(-sign * dcm[..., k, j], dcm[..., k, k])
+        rotAngle2 = np.arcsin(np.clip(sign * dcm[..., k, i], -1.0, 1.0))
+        rotAngle3 = np.arctan2(-sign * dcm[..., j, i], dcm[..., i, i])
     else:
-        msg = (f"Rotation sequence {rotationSequence.upper()}"
-               " is not implemented.")
-        raise NotImplementedError(msg)
+        # proper Euler angles
+        k = 3 - i - j
+        sign = 1.0 if (j - i) % 3 == 1 else -1.0
+        rotAngle1 = np.arctan2(dcm[..., i, j], -sign * dcm[..., i, k])
+        rotAngle2 = np.arccos(np.clip(dcm[..., i, i], -1.0, 1.0))
+        rotAngle3 = np.arctan2(dcm[..., j, i], sign * dcm[..., k, i])
+
+    return rotAngle1, rotAngle2, rotAngle3
@@ -0,0 +1,219 @@
+"""
+# ======================================================================= #
+# ========================= SPATIAL INDEX CLASS ========================= #
+# ======================================================================= #
+"""
+# EXPORT
+__all__ = [
+    "SpatialIndex"
+]
+
+# IMPORT
+import numpy as np
+from scipy.spatial import cKDTree
+import dragonfly
+from dragonfly.geography import (Position, PositionArray, ecef2lla,
+                                 lla2ecef, getInverseGeodesic)
+
+
+# PARAMETERS
+_DEFAULT_MODEL = dragonfly.constants.DEFAULT_SETTINGS.EarthEllipsoid
+_MARGIN = 1e-6      # rounding margin on the chord bound (meter)
+
+
+class SpatialIndex:
+    """Spatial index of a set of geographic positions for radius and
+    k-nearest queries on the ellipsoidal range.
+
+    The positions are projected on the ellipsoid (altitude 0) and stored
+    in a k-d tree on their ECEF coordinates. The chord between two points
+    is a lower bound of the geodesic distance and, the curvature of a
+    geodesic being at most a/b^2, 2.R.asin(chord/2R) with R = b^2/a is an
+    upper bound. The exact range is only computed for the candidates
+    between both bounds.
+    """
+
+    __slots__ = ("_tree", "_latitudes", "_longitudes", "_earthModel",
+                 "_radius")
+
+    def __init__(self, latitudes, longitudes,
+                 earth_model: str = _DEFAULT_MODEL, leafSize: int = 16):
+        """create a SpatialIndex object based on geographic positions
+
+        Args:
+            latitudes (array_like): latitudes in radians [N elements]
+            longitudes (array_like): longitudes in radians [N elements]
+            earth_model (str, optional): name of the Ellipsoid model.
+                Defaults to "WGS84".
+            leafSize (int, optional): number of points in the leaves of the
+                tree. Defaults to 16.
+        """
+        latitudes = np.ravel(np.asarray(latitudes, dtype=np.float64))
+        longitudes = np.ravel(np.asarray(longitudes, dtype=np.float64))
+        if latitudes.shape != longitudes.shape:
+            msg = ("latitudes and longitudes shall have the same number of"
+                   f" elements [current: {latitudes.size},"
+                   f" {longitudes.size}]")
+            raise ValueError(msg)
+
+        if not np.all(np.abs(latitudes) <= np.pi/2):
+            raise ValueError("Latitudes Value shall be lower than 90")
+
+        leafSize = dragonfly.utils.validation.validateInstance(leafSize, int)
+
+        earth = dragonfly.constants.EarthModel(earth_model)
+        self._earthModel = earth_model
+        self._radius = earth.b**2 / earth.a
+        self._latitudes = latitudes
+        self._longitudes = longitudes
+        self._tree = cKDTree(lla2ecef(latitudes, longitudes, 0.0, earth_model),
+                             leafsize=leafSize)
+
+    def __repr__(self):
+        """internal method for the print"""
+        return (f"Spatial Index [{len(self)} positions,"
+                f" ellipsoid: {self._earthModel}]")
+
+    def __len__(self) -> int:
+        """number of indexed positions"""
+        return self._latitudes.size
+
+# IMPORTER:
+    @classmethod
+    def fromPositions(cls, positions, earth_model: str = _DEFAULT_MODEL,
+                      leafSize: int = 16):
+        """Create a SpatialIndex based on ECEF positions (the altitudes are
+        ignored)
+
+        Args:
+            positions (PositionArray | list[Position] | np.ndarray): ECEF
+                positions ([Nx3] array in meters)
+            earth_model (str, optional): name of the Ellipsoid model.
+                Defaults to "WGS84".
+            leafSize (int, optional): number of points in the leaves of the
+                tree. Defaults to 16.
+
+        Returns:
+            SpatialIndex: spatial index object
+        """
+        if isinstance(positions, (Position, list)):
+            positions = PositionArray.fromPosition(positions)
+
+        latitudes, longitudes, _ = ecef2lla(positions, earth_model)
+        return SpatialIndex(latitudes, longitudes, earth_model, leafSize)
+
+# ------------------------- PROPERTIES -------------------------
+    @property
+    def latitudes(self) -> np.ndarray:
+        """latitudes of the indexed positions in radians"""
+        return self._latitudes
+
+    @property
+    def longitudes(self) -> np.ndarray:
+        """longitudes of the indexed positions in radians"""
+        return self._longitudes
+
+# ------------------------- QUERIES -------------------------
+    def __prepareQuery(self, latitude: float, longitude: float) -> tuple:
+        """PRIVATE METHOD : check the query point and compute its ECEF
+        coordinates on the ellipsoid"""
+        latitude = float(latitude)
+        longitude = float(longitude)
+        if abs(latitude) > np.pi/2:
+            raise ValueError("Latitudes Value shall be lower than 90")
+        center = lla2ecef(latitude, longitude, 0.0, self._earthModel)[0]
+        return latitude, longitude, center
+
+    def __upperBound(self, chord: np.ndarray) -> np.ndarray:
+        """PRIVATE METHOD : upper bound of the geodesic distance from the
+        chord (infinite when the chord reaches 2R: near antipodal positions
+        always need the exact range)"""
+        ratio = chord / (2 * self._radius)
+        bound = np.full(ratio.shape, np.inf)
+        below = ratio < 1.0
+        bound[below] = 2 * self._radius * np.arcsin(ratio[below])
+        return bound
+
+    def __ranges(self, latitude: float, longitude: float,
+                 index: np.ndarray) -> np.ndarray:
+        """PRIVATE METHOD : exact ranges to a subset of the positions"""
+        ranges, _, _ = getInverseGeodesic(
+            latitude, longitude, self._latitudes[index],
+            self._longitudes[index], self._earthModel)
+        return ranges
+
+    def queryRadius(self, latitude: float, longitude: float, radius: float,
+                    returnRanges: bool = False):
+        """Find the positions within a range of a point
+
+        Args:
+            latitude (float): latitude of the point in radians
+            longitude (float): longitude of the point in radians
+            radius (float): maximum range in meters
+            returnRanges (bool, optional): return the exact ranges (computed
+                for all the positions found). Defaults to False.
+
+        Returns:
+            np.ndarray: indexes of the positions (sorted by index or by
+                range if returnRanges is True)
+            np.ndarray: ranges in meters (only if returnRanges is True)
+        """
+        latitude, longitude, center = self.__prepareQuery(latitude,
+                                                          longitude)
+        radius = float(radius)
+
+        # the chord is a lower bound of the range
+        index = np.asarray(
+            self._tree.query_ball_point(center, radius, return_sorted=True),
+            dtype=np.int64)
+
+        if returnRanges:
+            ranges = self.__ranges(latitude, longitude, index)
+            inside = ranges <= radius
+            order = np.argsort(ranges[inside], kind="stable")
+            return index[inside][order], ranges[inside][order]
+
+        # exact range only between the bounds
+        chord = np.linalg.norm(self._tree.data[index] - center, axis=1)
+        inside = self.__upperBound(chord) <= radius
+        toRefine = np.flatnonzero(~inside)
+        inside[toRefine] = self.__ranges(latitude, longitude,
+                                         index[toRefine]) <= radius
+        return index[inside]
+
+    def queryNearest(self, latitude: float, longitude: float,
+                     k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """Find the k nearest positions of a point
+
+        Args:
+            latitude (float): latitude of the point in radians
+            longitude (float): longitude of the point in radians
+            k (int, optional): number of positions. Defaults to 1.
+
+        Returns:
+            np.ndarray: indexes of the positions sorted by range
+            np.ndarray: ranges in meters
+        """
+        latitude, longitude, center = self.__prepareQuery(latitude,
+                                                          longitude)
+        k = dragonfly.utils.validation.validateInteger(k)
+        if k < 1:
+            raise ValueError(f"k shall be strictly positive [current: {k}]")
+        k = min(k, len(self))
+        if k == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        # k nearest positions for the chord
+        _, index = self._tree.query(center, k=k)
+        index = np.atleast_1d(index)
+        ranges = self.__ranges(latitude, longitude, index)
+
+        # any closer position has a chord lower than the k-th range
+        index = np.asarray(
+            self._tree.query_ball_point(center, float(np.max(ranges)) +
+                                        _MARGIN),
+            dtype=np.int64)
+        ranges = self.__ranges(latitude, longitude, index)
+
+        order = np.argsort(ranges, kind="stable")[:k]
+        return index[order], ranges[order]
@@ -0,0 +1,9 @@
+"""
+=======================================================================
+============================ GRAVITY MODELS ===========================
+=======================================================================
+"""
+
+from .__zonal import *
+from .__sphericalHarmonics import *
+from .__gravityGrid import *
@@ -0,0 +1,324 @@
+"""
+# ======================================================================= #
+# ================= SPHERICAL HARMONIC GRAVITY MODEL ==================== #
+# ======================================================================= #
+"""
+# EXPORT
+__all__ = [
+    "SphericalHarmonicModel",
+]
+
+# IMPORT
+import numpy as np
+import dragonfly
+from dragonfly.constants import EarthModel
+
+
+# PARAMETERS
+_DEFAULT_MODEL = dragonfly.constants.DEFAULT_SETTINGS.EarthEllipsoid
+
+
+class SphericalHarmonicModel():
+    """Gravity field expanded in fully normalized spherical harmonics
+    (EGM-style coefficients C[n, m] and S[n, m])
+
+    The coefficients are stored as one [2 x (N+1) x (N+1)] array (C, then
+    S, entries with m > n are ignored). Loaded from a .npy file, the table
+    is memory mapped: the worker processes of a simulation share one copy
+    of it and only the rows used by the requested truncation are read.
+
+    The gravity vectors are evaluated with the normalized V/W recursion of
+    Cunningham (see Montenbruck & Gill, Satellite Orbits, 3.2.4), one
+    degree at a time for all the orders and all the positions of a chunk.
+    """
+
+    def __init__(self, coefficients: np.ndarray, mu: float = None,
+                 radius: float = None) -> None:
+        """Create a spherical harmonic model from its coefficients
+
+        Args:
+            coefficients (array_like): normalized coefficients [2 x (N+1) x
+                (N+1)] with C[n, m] = coefficients[0, n, m] and
+                S[n, m] = coefficients[1, n, m]. Not copied (memory maps
+                are kept as is).
+            mu (float, optional): gravitational constant of the model in
+                m3/s2. Defaults to the one of the default Earth model.
+            radius (float, optional): reference radius of the model in
+                meters. Defaults to the semi major axis of the default
+                Earth model.
+        """
+        coefficients = np.asarray(coefficients, dtype=np.float64)
+        if (coefficients.ndim != 3 or coefficients.shape[0] != 2
+                or coefficients.shape[1] != coefficients.shape[2]
+                or coefficients.shape[1] == 0):
+            msg = dragonfly.utils.exception.createErrorMessage(
+                errorMsg="The coefficients shall be a [2 x (N+1) x (N+1)] "
+                         "array (C, S)",
+                expected="shape (2, N+1, N+1)",
+                current=f"shape {coefficients.shape}",
+            )
+            raise ValueError(msg)
+
+        earth = EarthModel(_DEFAULT_MODEL)
+        self.__coefficients = coefficients
+        self.__mu = float(earth.mu if mu is None else mu)
+        self.__radius = float(earth.a if radius is None else radius)
+
+    @classmethod
+    def fromFile(cls, filepath: str, mu: float = None, radius: float = None,
+                 mmap: bool = True):
+        """Load a model from a .npy coefficient file (see save)
+
+        Args:
+            filepath (str): path of the .npy file
+            mu (float, optional): gravitational constant of the model in
+                m3/s2. Defaults to the one of the default Earth model.
+            radius (float, optional): reference radius of the model in
+                meters. Defaults to the semi major axis of the default
+                Earth model.
+            mmap (bool, optional): memory map the file (read only) instead
+                of loading it. Defaults to True.
+
+        Returns:
+            SphericalHarmonicModel: spherical harmonic model
+        """
+        filepath = dragonfly.utils.validation.validateFile(filepath)
+        filepath = dragonfly.utils.validation.validateFileExtension(
+            filepath, ".npy")
+        coefficients = np.load(filepath, mmap_mode="r" if mmap else None,
+                               allow_pickle=False)
+        return cls(coefficients, mu, radius)
+
+    @classmethod
+    def fromText(cls, filepath: str, mu: float = None, radius: float = None,
+                 maxDegree: int = None):
+        """Read a model from a text coefficient table: one "n m C S" line
+        per coefficient (extra columns, header lines, "gfc" keywords of the
+        ICGEM format and Fortran "D" exponents are accepted). Convert it
+        once with save to benefit from the memory mapping of fromFile.
+
+        Args:
+            filepath (str): path of the text file
+            mu (float, optional): gravitational constant of the model in
+                m3/s2. Defaults to the one of the default Earth model.
+            radius (float, optional): reference radius of the model in
+                meters. Defaults to the semi major axis of the default
+                Earth model.
+            maxDegree (int, optional): truncation degree of the table.
+                Defaults to the whole table.
+
+        Returns:
+            SphericalHarmonicModel: spherical harmonic model
+        """
+        filepath = dragonfly.utils.validation.validateFile(filepath)
+        if maxDegree is not None:
+            maxDegree = dragonfly.utils.validation.validateInstance(
+                maxDegree, int)
+
+        rows = []
+        with open(filepath, "r", encoding="utf-8") as file:
+            for line in file:
+                fields = line.replace("D", "E").replace("d", "e").split()
+                if fields and fields[0] == "gfc":
+                    fields = fields[1:]
+                try:
+                    degree, order = int(fields[0]), int(fields[1])
+                    rows.append((degree, order, float(fields[2]),
+                                 float(fields[3])))
+                except (IndexError, ValueError):
+                    continue
+
+        if not rows:
+            msg = dragonfly.utils.exception.createErrorMessage(
+                errorMsg="The file does not contain any coefficient",
+                expected="lines 'n m C S'",
+                current=filepath,
+            )
+            raise ValueError(msg)
+
+        table = np.array(rows)
+        degrees = table[:, 0].astype(int)
+        orders = table[:, 1].astype(int)
+        size = degrees.max() if maxDegree is None else maxDegree
+        kept = (degrees <= size) & (orders <= degrees)
+
+        coefficients = np.zeros((2, size + 1, size + 1))
+        coefficients[0, degrees[kept], orders[kept]] = table[kept, 2]
+        coefficients[1, degrees[kept], orders[kept]] = table[kept, 3]
+        if not np.any(kept & (degrees == 0)):
+            coefficients[0, 0, 0] = 1.
+        return cls(coefficients, mu, radius)
+
+    @classmethod
+    def fromEarthModel(cls, earthModel: str = _DEFAULT_MODEL):
+        """Spherical harmonic model of the zonal harmonics of an Earth
+        model (C[n, 0] = -Jn / sqrt(2n + 1))
+
+        Args:
+            earthModel (str, optional): name of the Ellipsoid model.
+                Defaults to "WGS84".
+
+        Returns:
+            SphericalHarmonicModel: spherical harmonic model
+        """
+        earth = EarthModel(earthModel)
+        size = earth.maxDegree + 1
+        coefficients = np.zeros((2, size, size))
+        coefficients[0, 0, 0] = 1.
+        for degree, zonal in enumerate(earth.zonals, start=2):
+            coefficients[0, degree, 0] = -zonal / np.sqrt(2 * degree + 1)
+        return cls(coefficients, earth.mu, earth.a)
+
+    def save(self, filepath: str) -> None:
+        """Save the coefficients as a .npy file (see fromFile)
+
+        Args:
+            filepath (str): path of the .npy file
+        """
+        filepath = dragonfly.utils.validation.validateInstance(filepath, str)
+        filepath = dragonfly.utils.validation.validateFileExtension(
+            filepath, ".npy")
+        np.save(filepath, self.__coefficients, allow_pickle=False)
+
+    # --------------------- PROPERTIES
+    @property
+    def mu(self) -> float:
+        """gravitational constant of the model in m3/s2"""
+        return self.__mu
+
+    @property
+    def radius(self) -> float:
+        """reference radius of the model in meters"""
+        return self.__radius
+
+    @property
+    def maxDegree(self) -> int:
+        """highest degree of the coefficient table"""
+        return self.__coefficients.shape[1] - 1
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        """read only view of the normalized coefficients [2 x (N+1) x
+        (N+1)]"""
+        view = self.__coefficients.view()
+        view.flags.writeable = False
+        return view
+
+    # --------------------- GRAVITY
+    def getGravity(self, positions, degree: int = None, order: int = None,
+                   chunkSize: int = 512) -> np.ndarray:
+        """Calculate the gravity vectors of a set of ECEF positions
+
+        The expansion can be truncated at call time: the same model serves
+        fast screenings (low degree) and high fidelity runs.
+
+        Args:
+            positions (array_like): ECEF positions as a [Nx3] array (or
+                PositionArray) in meters
+            degree (int, optional): truncation degree (0 is the point
+                mass). Defaults to the highest degree of the model.
+            order (int, optional): truncation order (lower or equal to
+                the degree). Defaults to the degree.
+            chunkSize (int, optional): number of positions evaluated
+                together. Defaults to 512.
+
+        Returns:
+            np.ndarray: array [Nx3] of the ECEF coordinates of the gravity
+                vectors in m/s^2
+        """
+        data = dragonfly.utils.validation.validateVectorArray(
+            positions, "positions")
+        degree = self.maxDegree if degree is None else degree
+        degree = _validateTruncation(degree, self.maxDegree, "degree")
+        order = degree if order is None else order
+        order = _validateTruncation(order, degree, "order")
+        chunkSize = dragonfly.utils.validation.validateInteger(chunkSize)
+        if chunkSize < 1:
+            msg = dragonfly.utils.exception.createErrorMessage(
+                errorMsg="The chunk size shall be strictly positive",
+                expected="chunkSize >= 1",
+                current=str(chunkSize),
+            )
+            raise ValueError(msg)
+
+        gravity = np.empty_like(data)
+        for start in range(0, len(data), chunkSize):
+            stop = start + chunkSize
+            gravity[start:stop] = self.__evaluate(data[start:stop], degree,
+                                                  order)
+        return gravity
+
+    def __evaluate(self, data: np.ndarray, degree: int,
+                   order: int) -> np.ndarray:
+        """PRIVATE FUNCTION - gravity vectors [Nx3] of a chunk of positions
+
+        The row n + 1 of the normalized V/W terms is built from the rows n
+        and n - 1 (and the sectoral term from V[n, n]), then combined with
+        the coefficients of degree n.
+        """
+        radius = self.__radius
+        r2 = np.einsum("ij,ij->i", data, data)
+        xr, yr, zr = (data * (radius / r2)[:, np.newaxis]).T
+        rr = radius**2 / r2
+
+        nbCols = order + 2
+        VPrev2, WPrev2 = np.zeros((2, nbCols, len(data)))
+        VPrev, WPrev = np.zeros((2, nbCols, len(data)))
+        VPrev[0] = radius / np.sqrt(r2)
+        acceleration = np.zeros((3, len(data)))
+
+        for n in range(degree + 1):
+            # row n + 1 of V and W
+            k = n + 1
+            V, W = np.zeros((2, nbCols, len(data)))
+            last = min(k - 1, order + 1)
+            m = np.arange(last + 1)[:, np.newaxis]
+            a = np.sqrt((2 * k + 1) * (2 * k - 1) / ((k - m) * (k + m)))
+            V[:last + 1] = a * zr * VPrev[:last + 1]
+            W[:last + 1] = a * zr * WPrev[:last + 1]
+            if k >= 2:
+                b = np.sqrt((2 * k + 1) * (k + m - 1) * (k - m - 1)
+                            / ((2 * k - 3) * (k + m) * (k - m)))
+                V[:last + 1] -= b * rr * VPrev2[:last + 1]
+                W[:last + 1] -= b * rr * WPrev2[:last + 1]
+            if k <= order + 1:
+                s = np.sqrt(3.) if k == 1 else np.sqrt((2 * k + 1) / (2 * k))
+                V[k] = s * (xr * VPrev[k - 1] - yr * WPrev[k - 1])
+                W[k] = s * (xr * WPrev[k - 1] + yr * VPrev[k - 1])
+
+            # contribution of the degree n
+            M = min(n, order)
+            m = np.arange(M + 1)
+            C = np.asarray(self.__coefficients[0, n, :M + 1])
+            S = np.asarray(self.__coefficients[1, n, :M + 1])
+            f = (2 * n + 1) / (2 * n + 3)
+            K0 = np.sqrt(f * (n + m + 1) * (n - m + 1))
+            K1 = 0.5 * np.sqrt(f * (n + m + 2) * (n + m + 1))
+            K1[0] *= np.sqrt(2.)
+            K2 = 0.5 * np.sqrt(f * (n - m[1:] + 2) * (n - m[1:] + 1))
+            K2[:1] *= np.sqrt(2.)
+
+            V1, W1 = V[1:M + 2], W[1:M + 2]
+            Vm1, Wm1 = V[:M], W[:M]
+            acceleration[0] += ((C[1:] * K2) @ Vm1 + (S[1:] * K2) @ Wm1
+                                - (C * K1) @ V1 - (S * K1) @ W1)
+            acceleration[1] += ((S[1:] * K2) @ Vm1 - (C[1:] * K2) @ Wm1
+                                + (S * K1) @ V1 - (C * K1) @ W1)
+            acceleration[2] -= (C * K0) @ V[:M + 1] + (S * K0) @ W[:M + 1]
+
+            VPrev2, WPrev2, VPrev, WPrev = VPrev, WPrev, V, W
+
+        return (self.__mu / radius**2 * acceleration).T
+
+
+def _validateTruncation(value: int, maximum: int, name: str) -> int:
+    """PRIVATE FUNCTION - check a truncation degree or order"""
+    value = dragonfly.utils.validation.validateInstance(value, int)
+    if not 0 <= value <= maximum:
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg=f"The {name} of the truncation is out of range",
+            expected=f"0 <= {name} <= {maximum}",
+            current=str(value),
+        )
+        raise ValueError(msg)
+    return value
@@ -0,0 +1,268 @@
+"""
+--------------   GRAVITY MODEL  --------------
+"""
+
+# EXPORT
+__all__ = [
+    "Gravity",
+    "getGravity",
+    "getGravityGradient",
+]
+
+# Import Module
+import numpy as np
+import dragonfly
+from dragonfly.geography import Position
+from dragonfly.constants import EarthModel
+
+
+# PARAMERTERS
+_DEFAULT_MODEL = dragonfly.constants.DEFAULT_SETTINGS.EarthEllipsoid
+
+
+class Gravity():
+    def __init__(self, x_ECEF: float, y_ECEF: float, z_ECEF: float,
+                 earthModel: str = _DEFAULT_MODEL, degree: int = 2):
+        """create a gravity object based on ECEF coordinates
+
+        Args:
+            x_ECEF (float): x coordinate
+            y_ECEF (float): y coordinate
+            z_ECEF (float): z coordinate
+            earthModel (str, optional): name of the Ellipsoid model.
+                Defaults to "WGS84".
+            degree (int, optional): highest degree of the zonal harmonics
+                (see getGravity). Defaults to 2 (J2).
+        """
+
+        self.__positionECEF = Position(x_ECEF, y_ECEF, z_ECEF)
+        self.__model = earthModel
+        self.__degree = degree
+
+    @classmethod
+    def fromPosition(cls, pos: Position, earthModel: str = _DEFAULT_MODEL,
+                     degree: int = 2):
+        """Create a gravity object based on dragonFly.geography.Position Object
+
+        Args:
+            pos (Position)              : Position object
+            earthModel (str, optional)  : name of the Earth model.
+                                         Defaults to _DEFAULT_MODEL.
+            degree (int, optional)      : highest degree of the zonal
+                                         harmonics. Defaults to 2 (J2).
+
+        Returns:
+            gravity: gravity instance
+        """
+        return Gravity(pos.x, pos.y, pos.z, earthModel, degree)
+
+    @classmethod
+    def fromLLA(cls, latitude: float, longitude: float, altitude: float,
+                earthModel: str = _DEFAULT_MODEL, degree: int = 2):
+        """Create a gravity object based on Latitude Longitude and altitude
+            information
+
+        Args:
+            latitude (float): latitude in radians
+            longitude (float): longitude in radians
+            altitude (float): altitude in meters
+            earthModel (str, optional): name of the Earth model.
+                Defaults to _DEFAULT_MODEL.
+            degree (int, optional): highest degree of the zonal harmonics.
+                Defaults to 2 (J2).
+
+        Returns:
+            gravity: gravity instance
+        """
+        return Gravity.fromPosition(Position.fromLLA(latitude, longitude,
+                                                     altitude),
+                                    earthModel, degree)
+
+    def toList(self):
+        """Provide gravity vector as a Python list in ECEF frame
+
+        Returns:
+            list : list [3 elements] of the ECEF coordinates of the
+                gravity vector
+        """
+        return self.__calculateGravity()
+
+    def toNumpy(self):
+        """Provide gravity vector as a numpy vector in ECEF frame
+
+        Returns:
+            np.ndarray : column vector [3x1] of the ECEF coordinates
+            of the gravity vector
+        """
+        return np.reshape(np.array(self.__calculateGravity()), (3, -1))
+
+    def toGradient(self):
+        """Provide the gravity gradient (Jacobian of the gravity vector
+        with respect to the ECEF position, see getGravityGradient)
+
+        Returns:
+            np.ndarray : matrix [3x3] of the gravity gradient in s^-2
+        """
+        position = self.__positionECEF
+        return getGravityGradient([position.x, position.y, position.z],
+                                  self.__model, self.__degree)[0]
+
+    def __calculateGravity(self):
+        """PRIVATE FUNCTION -  calculate the gravity vector based
+        on ECEF coordinates and ellipsoid model
+        """
+
+        position = self.__positionECEF
+        return getGravity([position.x, position.y, position.z],
+                          self.__model, self.__degree)[0].tolist()
+
+
+def getGravity(positions, earthModel: str = _DEFAULT_MODEL,
+               degree: int = 2) -> np.ndarray:
+    """Calculate the gravity vectors of a set of ECEF positions in one
+    vectorized pass (the ellipsoid constants are resolved once)
+
+    The gravity field is the point mass plus the zonal harmonics J2 to
+    J(degree). The Legendre polynomials P_n(z/r) and their derivatives are
+    evaluated with the Bonnet recurrence, so each additional degree only
+    costs a few array operations:
+
+        g = -mu/r^2 [1 - sum(Jn (a/r)^n ((n+1) Pn + u Pn'))] r/|r|
+            - mu/r^2 sum(Jn (a/r)^n Pn') z/|z|
+
+    Args:
+        positions (array_like): ECEF positions as a [Nx3] array (or
+            PositionArray) in meters
+        earthModel (str, optional): name of the Ellipsoid model.
+            Defaults to "WGS84".
+        degree (int, optional): highest degree of the zonal harmonics
+            (from 1, point mass only, to EarthModel.maxDegree).
+            Defaults to 2 (J2).
+
+    Returns:
+        np.ndarray: array [Nx3] of the ECEF coordinates of the gravity
+            vectors in m/s^2
+    """
+    data = dragonfly.utils.validation.validateVectorArray(
+        positions, "positions")
+
+    # get constant
+    earth = EarthModel(earthModel)
+    degree = dragonfly.utils.validation.validateDegree(degree,
+                                                       earth.maxDegree)
+    a = earth.a
+    mu = earth.mu
+    zonals = earth.zonals
+
+    # geometry
+    r2 = np.einsum("ij,ij->i", data, data)
+    r = np.sqrt(r2)
+    u = data[:, 2] / r
+    rho = a / r
+
+    # Legendre recurrence on the zonal terms
+    radialSum = np.zeros_like(r)
+    axialSum = np.zeros_like(r)
+    rhoN = rho
+    for n, P, dP, _ in _legendre(u, degree):
+        rhoN = rhoN * rho
+        radialSum += zonals[n - 2] * rhoN * ((n + 1) * P + u * dP)
+        axialSum += zonals[n - 2] * rhoN * dP
+
+    muOverR2 = mu / r2
+    gravity = -(muOverR2 * (1 - radialSum) / r)[:, np.newaxis] * data
+    gravity[:, 2] -= muOverR2 * axialSum
+    return gravity
+
+
+def getGravityGradient(positions, earthModel: str = _DEFAULT_MODEL,
+                       degree: int = 2) -> np.ndarray:
+    """Calculate the gravity gradients dg/dr of a set of ECEF positions
+    analytically (same model as getGravity), e.g. for the variational
+    equations of a trajectory
+
+    Writing the gravity as g = A(r, u) r + B(r, u) z/|z| with u = z/|r|,
+    the gradient is A I + r (grad A)^T + z/|z| (grad B)^T, where the
+    second derivatives of the Legendre polynomials come from the same
+    recurrence: Pn'' = (n + 1) P(n-1)' + u P(n-1)''. The matrices are
+    symmetric and traceless (Laplace equation).
+
+    Args:
+        positions (array_like): ECEF positions as a [Nx3] array (or
+            PositionArray) in meters
+        earthModel (str, optional): name of the Ellipsoid model.
+            Defaults to "WGS84".
+        degree (int, optional): highest degree of the zonal harmonics
+            (from 1, point mass only, to EarthModel.maxDegree).
+            Defaults to 2 (J2).
+
+    Returns:
+        np.ndarray: array [Nx3x3] of the gravity gradients in s^-2
+            (gradient[k, i, j] = dg_i / dr_j)
+    """
+    data = dragonfly.utils.validation.validateVectorArray(
+        positions, "positions")
+
+    # get constant
+    earth = EarthModel(earthModel)
+    degree = dragonfly.utils.validation.validateDegree(degree,
+                                                       earth.maxDegree)
+    zonals = earth.zonals
+
+    # geometry
+    r2 = np.einsum("ij,ij->i", data, data)
+    r = np.sqrt(r2)
+    u = data[:, 2] / r
+    rho = earth.a / r
+
+    # sums over the zonal terms of g and of its derivatives in (r, u)
+    radialSum, axialSum = np.zeros((2, len(r)))
+    dRadialSum, dAxialSum = np.zeros((2, len(r)))   # n-weighted (d/dr)
+    uRadialSum, uAxialSum = np.zeros((2, len(r)))   # d/du
+    rhoN = rho
+    for n, P, dP, d2P in _legendre(u, degree):
+        rhoN = rhoN * rho
+        radial = zonals[n - 2] * rhoN * ((n + 1) * P + u * dP)
+        axial = zonals[n - 2] * rhoN * dP
+        radialSum += radial
+        axialSum += axial
+        dRadialSum += n * radial
+        dAxialSum += n * axial
+        uRadialSum += zonals[n - 2] * rhoN * ((n + 2) * dP + u * d2P)
+        uAxialSum += zonals[n - 2] * rhoN * d2P
+
+    # g = A r + B z/|z| and the partial derivatives of A and B
+    muOverR3 = earth.mu / (r2 * r)
+    A = -muOverR3 * (1 - radialSum)
+    dAdr = muOverR3 / r * (3 * (1 - radialSum) - dRadialSum)
+    dAdu = muOverR3 * uRadialSum
+    dBdr = muOverR3 * (2 * axialSum + dAxialSum)
+    dBdu = -muOverR3 * r * uAxialSum
+
+    # grad f = (df/dr - u/r df/du) r/|r| + (1/r df/du) z/|z|
+    unit = data / r[:, np.newaxis]
+    gradA = (dAdr - u * dAdu / r)[:, np.newaxis] * unit
+    gradA[:, 2] += dAdu / r
+    gradB = (dBdr - u * dBdu / r)[:, np.newaxis] * unit
+    gradB[:, 2] += dBdu / r
+
+    gradient = data[:, :, np.newaxis] * gradA[:, np.newaxis, :]
+    gradient[:, 2] += gradB
+    gradient[:, [0, 1, 2], [0, 1, 2]] += A[:, np.newaxis]
+    return gradient
+
+
+def _legendre(u: np.ndarray, degree: int):
+    """PRIVATE FUNCTION - Legendre polynomials Pn(u) and their first and
+    second derivatives from the degree 2 to degree (Bonnet recurrence)
+
+    Yields:
+        tuple: n, Pn, Pn', Pn''
+    """
+    P, PPrev = u, np.ones_like(u)              # P1, P0
+    dP, d2P = np.ones_like(u), np.zeros_like(u)  # P1', P1''
+    for n in range(2, degree + 1):
+        P, PPrev = ((2 * n - 1) * u * P - (n - 1) * PPrev) / n, P
+        d2P = (n + 1) * dP + u * d2P
+        dP = n * PPrev + u * dP
+        yield n, P, dP, d2P
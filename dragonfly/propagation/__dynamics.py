@@ -0,0 +1,117 @@
+"""
+# ======================================================================= #
+# ===================== POINT MASS EQUATIONS OF MOTION ================== #
+# ======================================================================= #
+"""
+# EXPORT
+__all__ = [
+    "PointMassDynamics",
+]
+
+# IMPORT
+import functools
+import numpy as np
+import dragonfly
+from dragonfly.constants import EarthModel
+from dragonfly.geography import eci2ecef, ecef2eci
+from dragonfly.gravity import getGravity
+
+
+# PARAMETERS
+_DEFAULT_MODEL = dragonfly.constants.DEFAULT_SETTINGS.EarthEllipsoid
+_FRAMES = ("ECI", "ECEF")
+
+
+class PointMassDynamics():
+    """Right-hand side of the equations of motion of point masses in the
+    gravity field of the Earth, in the ECI or in the ECEF frame
+
+    The states are numpy arrays [6] or [Nx6] (position in meters then
+    velocity in m/s): a whole ensemble is evaluated with one call of the
+    gravity model and no intermediate Position/Gravity objects.
+    """
+
+    def __init__(self, frame: str = "ECI", gravity=None,
+                 earthModel: str = _DEFAULT_MODEL, degree: int = 2) -> None:
+        """Create the equations of motion
+
+        Args:
+            frame (str, optional): frame of the states, "ECI" or "ECEF".
+                Defaults to "ECI".
+            gravity (callable, optional): gravity model taking [Nx3] ECEF
+                positions and returning [Nx3] ECEF gravity vectors (e.g.
+                SphericalHarmonicModel(...).getGravity or
+                GravityGrid(...).getGravity). Defaults to the zonal model
+                getGravity of earthModel and degree.
+            earthModel (str, optional): name of the Ellipsoid model of the
+                default gravity model. Defaults to "WGS84".
+            degree (int, optional): highest degree of the zonal harmonics
+                of the default gravity model. Defaults to 2 (J2).
+        """
+        frame = dragonfly.utils.validation.validateInstance(frame, str)
+        if frame.upper() not in _FRAMES:
+            msg = dragonfly.utils.exception.createErrorMessage(
+                errorMsg="The frame of the equations of motion is not "
+                         "supported",
+                expected=" or ".join(_FRAMES),
+                current=frame,
+            )
+            raise ValueError(msg)
+
+        if gravity is None:
+            # fail early on an invalid Earth model or degree
+            dragonfly.utils.validation.validateDegree(
+                degree, EarthModel(earthModel).maxDegree)
+            gravity = functools.partial(getGravity, earthModel=earthModel,
+                                        degree=degree)
+        elif not callable(gravity):
+            msg = dragonfly.utils.exception.createErrorMessage(
+                errorMsg="The gravity model shall be callable",
+                expected="callable(positions) -> [Nx3] array",
+                current=str(type(gravity)),
+            )
+            raise TypeError(msg)
+
+        self.__frame = frame.upper()
+        self.__gravity = gravity
+        self.__rotationRate = EarthModel.earthRotationRate
+
+    @property
+    def frame(self) -> str:
+        """frame of the states ("ECI" or "ECEF")"""
+        return self.__frame
+
+    def __call__(self, t: float, states: np.ndarray) -> np.ndarray:
+        """Time derivative of the states
+
+        Args:
+            t (float): time in seconds (since the definition of the ECI
+                frame for the ECI states)
+            states (np.ndarray): states [6] or [Nx6] (position in meters,
+                velocity in m/s)
+
+        Returns:
+            np.ndarray: derivatives of the states (same shape)
+        """
+        states = np.asarray(states, dtype=np.float64)
+        if states.shape[-1:] != (6,) or states.ndim > 2:
+            msg = dragonfly.utils.exception.createErrorMessage(
+                errorMsg="The states shall be a [6] or [Nx6] array",
+                expected="[6] or [Nx6] array",
+                current=f"shape: {states.shape}",
+            )
+            raise ValueError(msg)
+        data = states.reshape((-1, 6))
+
+        derivative = np.empty_like(data)
+        derivative[:, :3] = data[:, 3:]
+        if self.__frame == "ECI":
+            gravity = self.__gravity(eci2ecef(data[:, :3], t))
+            derivative[:, 3:] = ecef2eci(gravity, t)
+        else:
+            # Coriolis and centrifugal accelerations (rotation around z)
+            omega = self.__rotationRate
+            derivative[:, 3:] = self.__gravity(data[:, :3])
+            derivative[:, 3] += 2 * omega * data[:, 4] + omega**2 * data[:, 0]
+            derivative[:, 4] += omega**2 * data[:, 1] - 2 * omega * data[:, 3]
+        return derivative.reshape(states.shape)
@@ -0,0 +1,210 @@
+"""
+# ======================================================================= #
+# ===================== LOCKSTEP ENSEMBLE PROPAGATION =================== #
+# ======================================================================= #
+"""
+# EXPORT
+__all__ = [
+    "EnsembleTrajectory",
+    "propagateEnsemble",
+]
+
+# IMPORT
+import math
+import numpy as np
+import dragonfly
+from dragonfly.propagation.__integrators import (_stepRK4,
+                                                 _validatePropagation)
+from dragonfly.propagation.__trajectory import _denseOutput
+
+
+class EnsembleTrajectory():
+    """Result of a lockstep ensemble propagation (see propagateEnsemble)
+
+    The members share the time grid. After the termination of a member,
+    its stored states are nan.
+    """
+
+    def __init__(self, times: np.ndarray, states: np.ndarray,
+                 finalStates: np.ndarray, terminationTimes: np.ndarray
+                 ) -> None:
+        """Create an ensemble trajectory
+
+        Args:
+            times (np.ndarray): times of the steps [M]
+            states (np.ndarray): states of the members at the steps
+                [M x N x 6] (nan after the termination), or None when the
+                steps are not stored
+            finalStates (np.ndarray): states of the members at their
+                termination or at the final time [N x 6]
+            terminationTimes (np.ndarray): termination times of the
+                members [N] (nan for the members reaching the final time)
+        """
+        self.__times = times
+        self.__states = states
+        self.__finalStates = finalStates
+        self.__terminationTimes = terminationTimes
+
+    def __len__(self) -> int:
+        """number of members of the ensemble"""
+        return len(self.__finalStates)
+
+    # --------------------- PROPERTIES
+    @property
+    def times(self) -> np.ndarray:
+        """times of the steps [M]"""
+        return self.__times
+
+    @property
+    def states(self) -> np.ndarray:
+        """states of the members at the steps [M x N x 6] (nan after the
+        termination, None if the steps are not stored)"""
+        return self.__states
+
+    @property
+    def finalStates(self) -> np.ndarray:
+        """states of the members at their termination or at the final
+        time [N x 6]"""
+        return self.__finalStates
+
+    @property
+    def terminationTimes(self) -> np.ndarray:
+        """termination times of the members [N] (nan if not terminated)"""
+        return self.__terminationTimes
+
+    @property
+    def terminated(self) -> np.ndarray:
+        """mask [N] of the terminated members"""
+        return ~np.isnan(self.__terminationTimes)
+
+
+def _validateEnsemble(states0, t0: float, tf: float, step: float,
+                      timeTolerance: float) -> np.ndarray:
+    """PRIVATE FUNCTION - initial states as a [Nx6] float64 array (copy)
+    and check of the time span, the step and the time tolerance"""
+    y = _validatePropagation(states0, t0, tf)
+    if y.ndim != 2 or y.shape[1] != 6:
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg="The initial states shall be a [Nx6] array",
+            expected="[Nx6] array",
+            current=f"shape: {y.shape}",
+        )
+        raise ValueError(msg)
+    for name, value in (("step", step), ("timeTolerance", timeTolerance)):
+        if not value > 0:
+            msg = dragonfly.utils.exception.createErrorMessage(
+                errorMsg=f"The {name} shall be positive",
+                expected=f"{name} > 0",
+                current=str(value),
+            )
+            raise ValueError(msg)
+    return y
+
+
+def propagateEnsemble(dynamics, states0, t0: float, tf: float,
+                      step: float, terminate=None,
+                      timeTolerance: float = 1e-6,
+                      storeSteps: bool = True) -> EnsembleTrajectory:
+    """Propagate N states together in lockstep with the classical fixed
+    step Runge-Kutta scheme of order 4
+
+    All the active members are advanced by the same vectorized calls of
+    the right-hand side (e.g. PointMassDynamics, one batched gravity
+    evaluation per stage). The members flagged by the termination mask
+    are removed from the active set: the following steps only cost the
+    members still flying. The termination times are refined by bisection
+    on the cubic Hermite interpolation of the step.
+
+    Args:
+        dynamics (callable): right-hand side f(t, states [Kx6]) ->
+            derivatives [Kx6], e.g. PointMassDynamics
+        states0 (array_like): initial states [Nx6]
+        t0 (float): initial time in seconds
+        tf (float): final time in seconds
+        step (float): time step in seconds
+        terminate (callable, optional): termination mask
+            f(t, states [Kx6]) -> bool [K], t being a float or one time
+            per state [K] (e.g. lambda t, y: np.linalg.norm(y[:, :3],
+            axis=1) < 6.4e6). Defaults to None (no termination).
+        timeTolerance (float, optional): accuracy of the termination
+            times in seconds. Defaults to 1e-6.
+        storeSteps (bool, optional): store the states of all the steps
+            [M x N x 6], otherwise only the final states are kept.
+            Defaults to True.
+
+    Returns:
+        EnsembleTrajectory: states and termination of the members
+    """
+    y = _validateEnsemble(states0, t0, tf, step, timeTolerance)
+
+    nbSteps = max(1, math.ceil((tf - t0) / step - 1e-9))
+    times = t0 + step * np.arange(nbSteps + 1, dtype=np.float64)
+    times[-1] = tf
+
+    finalStates = y.copy()
+    terminationTimes = np.full(len(y), np.nan)
+    states = None
+    if storeSteps:
+        states = np.full((nbSteps + 1,) + y.shape, np.nan)
+        states[0] = y
+
+    # active members (indices in the ensemble and compact states)
+    members = np.arange(len(y))
+    if terminate is not None:
+        stopped = np.asarray(terminate(t0, y), dtype=bool)
+        terminationTimes[stopped] = t0
+        members, y = members[~stopped], y[~stopped]
+
+    nextState = np.empty_like(y)
+    yStage = np.empty_like(y)
+    for idx in range(nbSteps):
+        if not len(members):
+            break
+        t, h = times[idx], times[idx + 1] - times[idx]
+        k1 = dynamics(t, y)
+        _stepRK4(dynamics, t, h, y, k1, yStage, nextState)
+
+        if terminate is not None:
+            stopped = np.asarray(terminate(times[idx + 1], nextState),
+                                 dtype=bool)
+            if np.any(stopped):
+                y0, f0 = y[stopped], k1[stopped]
+                y1 = nextState[stopped]
+                f1 = dynamics(times[idx + 1], y1)
+                s = _bisect(terminate, t, h, y0, y1, f0, f1, timeTolerance)
+
+                terminated = members[stopped]
+                terminationTimes[terminated] = t + s * h
+                finalStates[terminated] = _denseOutput(
+                    s[:, np.newaxis], h, y0, y1, f0, f1)
+
+                members = members[~stopped]
+                nextState = nextState[~stopped]
+                yStage = yStage[:len(members)]
+
+        if storeSteps:
+            states[idx + 1, members] = nextState
+        y, nextState = nextState, y[:len(members)]
+
+    finalStates[members] = y
+    return EnsembleTrajectory(times, states, finalStates, terminationTimes)
+
+
+def _bisect(terminate, t: float, h: float, y0: np.ndarray, y1: np.ndarray,
+            f0: np.ndarray, f1: np.ndarray,
+            timeTolerance: float) -> np.ndarray:
+    """PRIVATE FUNCTION - fractions of the step [K] at which the
+    termination masks switch, by bisection on the cubic Hermite
+    interpolation of the step"""
+    lower = np.zeros(len(y0))
+    upper = np.ones(len(y0))
+    nbIterations = max(1, math.ceil(math.log2(h / timeTolerance)))
+    for _ in range(nbIterations):
+        middle = (lower + upper) / 2
+        stopped = np.asarray(terminate(
+            t + middle * h,
+            _denseOutput(middle[:, np.newaxis], h, y0, y1, f0, f1)),
+            dtype=bool)
+        upper = np.where(stopped, middle, upper)
+        lower = np.where(stopped, lower, middle)
+    return upper
@@ -0,0 +1,10 @@
+"""
+=======================================================================
+========================= TRAJECTORY PROPAGATION ======================
+=======================================================================
+"""
+
+from .__dynamics import *
+from .__trajectory import *
+from .__integrators import *
+from .__ensemble import *
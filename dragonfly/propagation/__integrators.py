@@ -0,0 +1,298 @@
+"""
+# ======================================================================= #
+# ========================= RUNGE-KUTTA INTEGRATORS ===================== #
+# ======================================================================= #
+"""
+# EXPORT
+__all__ = [
+    "propagateRK4",
+    "propagateDOPRI5",
+]
+
+# IMPORT
+import math
+import numpy as np
+import dragonfly
+from dragonfly.propagation.__trajectory import Trajectory
+
+
+# PARAMETERS
+# Dormand-Prince 5(4) tableau (Hairer, Solving ODE I, table 5.2)
+_C = np.array([0., 1/5, 3/10, 4/5, 8/9, 1., 1.])
+_A = [
+    np.array([1/5]),
+    np.array([3/40, 9/40]),
+    np.array([44/45, -56/15, 32/9]),
+    np.array([19372/6561, -25360/2187, 64448/6561, -212/729]),
+    np.array([9017/3168, -355/33, 46732/5247, 49/176, -5103/18656]),
+    np.array([35/384, 0., 500/1113, 125/192, -2187/6784, 11/84]),
+]
+# error estimation (5th - 4th order) of the 7 stages
+_E = np.array([71/57600, 0., -71/16695, 71/1920, -17253/339200, 22/525,
+               -1/40])
+# continuous extension
+_D = np.array([-12715105075/11282082432, 0., 87487479700/32700410799,
+               -10690763975/1880347072, 701980252875/199316789632,
+               -1453857185/822651844, 69997945/29380423])
+
+_SAFETY = 0.9
+_MIN_FACTOR = 0.2
+_MAX_FACTOR = 10.
+
+
+def _validatePropagation(state0, t0: float, tf: float) -> np.ndarray:
+    """PRIVATE FUNCTION - initial state as a float64 array (copy) and check
+    of the time span"""
+    if not tf > t0:
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg="The final time shall be after the initial time",
+            expected=f"tf > {t0}",
+            current=str(tf),
+        )
+        raise ValueError(msg)
+    return np.array(state0, dtype=np.float64)
+
+
+def propagateRK4(dynamics, state0, t0: float, tf: float,
+                 step: float) -> Trajectory:
+    """Propagate a state with the classical fixed step Runge-Kutta scheme
+    of order 4
+
+    The output buffers are allocated once for all the steps (the last
+    step is shortened to end at tf) and the dense output is the cubic
+    Hermite interpolation of the steps.
+
+    Args:
+        dynamics (callable): right-hand side f(t, state) -> derivative,
+            e.g. PointMassDynamics
+        state0 (array_like): initial state (e.g. [6] or [Nx6])
+        t0 (float): initial time in seconds
+        tf (float): final time in seconds
+        step (float): time step in seconds
+
+    Returns:
+        Trajectory: states at the steps and dense output
+    """
+    y = _validatePropagation(state0, t0, tf)
+    if not step > 0:
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg="The time step shall be positive",
+            expected="step > 0",
+            current=str(step),
+        )
+        raise ValueError(msg)
+
+    nbSteps = max(1, math.ceil((tf - t0) / step - 1e-9))
+    times = t0 + step * np.arange(nbSteps + 1, dtype=np.float64)
+    times[-1] = tf
+
+    states = np.empty((nbSteps + 1,) + y.shape)
+    derivatives = np.empty_like(states)
+    yStage = np.empty_like(y)
+    states[0] = y
+    derivatives[0] = dynamics(t0, y)
+
+    for idx in range(nbSteps):
+        t, h = times[idx], times[idx + 1] - times[idx]
+        _stepRK4(dynamics, t, h, states[idx], derivatives[idx], yStage,
+                 states[idx + 1])
+        derivatives[idx + 1] = dynamics(times[idx + 1], states[idx + 1])
+
+    return Trajectory(times, states, derivatives)
+
+
+def _stepRK4(dynamics, t: float, h: float, y: np.ndarray, k1: np.ndarray,
+             yStage: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """PRIVATE FUNCTION - one step of the classical Runge-Kutta scheme
+    from the state y and its derivative k1 (yStage is a work buffer, the
+    new state is written in out)"""
+    np.multiply(k1, h / 2, out=yStage)
+    yStage += y
+    k2 = dynamics(t + h / 2, yStage)
+    np.multiply(k2, h / 2, out=yStage)
+    yStage += y
+    k3 = dynamics(t + h / 2, yStage)
+    np.multiply(k3, h, out=yStage)
+    yStage += y
+    k4 = dynamics(t + h, yStage)
+
+    np.add(k2, k3, out=out)
+    out *= 2
+    out += k1
+    out += k4
+    out *= h / 6
+    out += y
+    return out
+
+
+def _validateDOPRI5(rtol: float, atol, firstStep: float, maxStep: float,
+                    maxSteps: int) -> tuple[float, np.ndarray, int]:
+    """PRIVATE FUNCTION - check the tolerances and the steps of
+    propagateDOPRI5 (tolerances as float and float64 array)"""
+    maxSteps = dragonfly.utils.validation.validateInstance(maxSteps, int)
+    atol = np.asarray(atol, dtype=np.float64)
+    rtol = float(rtol)
+    if not (rtol >= 0 and np.all(atol >= 0)) or \
+            (rtol == 0 and np.any(atol == 0)):
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg="The tolerances shall be positive (not both zero)",
+            expected="rtol >= 0, atol >= 0, rtol + atol > 0",
+            current=f"rtol = {rtol}, atol = {atol}",
+        )
+        raise ValueError(msg)
+    for name, value in (("firstStep", firstStep), ("maxStep", maxStep)):
+        if value is not None and not value > 0:
+            msg = dragonfly.utils.exception.createErrorMessage(
+                errorMsg=f"The {name} shall be positive",
+                expected=f"{name} > 0",
+                current=str(value),
+            )
+            raise ValueError(msg)
+    return rtol, atol, maxSteps
+
+
+def propagateDOPRI5(dynamics, state0, t0: float, tf: float,
+                    rtol: float = 1e-10, atol: float = 1e-6,
+                    firstStep: float = None, maxStep: float = np.inf,
+                    maxSteps: int = 1000000) -> Trajectory:
+    """Propagate a state with the adaptive embedded Runge-Kutta scheme of
+    Dormand and Prince (order 5 with an error estimation of order 4)
+
+    The step is controlled on the RMS norm of the scaled error estimation
+    (atol + rtol |y|) and the dense output is the continuous extension of
+    order 4 of the scheme. The stages are stored in one preallocated
+    buffer and the output buffers grow by doubling their size.
+
+    Args:
+        dynamics (callable): right-hand side f(t, state) -> derivative,
+            e.g. PointMassDynamics
+        state0 (array_like): initial state (e.g. [6] or [Nx6])
+        t0 (float): initial time in seconds
+        tf (float): final time in seconds
+        rtol (float, optional): relative tolerance. Defaults to 1e-10.
+        atol (float | array_like, optional): absolute tolerance (can be
+            set per component of the state). Defaults to 1e-6.
+        firstStep (float, optional): first time step in seconds.
+            Defaults to an automatic estimation.
+        maxStep (float, optional): largest time step in seconds.
+            Defaults to inf.
+        maxSteps (int, optional): largest number of steps.
+            Defaults to 1000000.
+
+    Returns:
+        Trajectory: states at the steps and dense output
+    """
+    y = _validatePropagation(state0, t0, tf)
+    rtol, atol, maxSteps = _validateDOPRI5(rtol, atol, firstStep, maxStep,
+                                           maxSteps)
+
+    # stages k1 to k7 and output buffers
+    stages = np.empty((7,) + y.shape)
+    stages[0] = dynamics(t0, y)
+    yStage = np.empty_like(y)
+    capacity = 64
+    times = np.empty(capacity)
+    states = np.empty((capacity,) + y.shape)
+    derivatives = np.empty_like(states)
+    corrections = np.empty_like(states)
+    times[0], states[0], derivatives[0] = t0, y, stages[0]
+
+    if firstStep is None:
+        h = _initialStep(dynamics, t0, y, stages[0], rtol, atol)
+    else:
+        h = float(firstStep)
+    h = min(h, maxStep, tf - t0)
+
+    t = t0
+    count = 0
+    rejected = False
+    while t < tf:
+        if count >= maxSteps:
+            msg = dragonfly.utils.exception.createErrorMessage(
+                errorMsg="The propagation needs too many steps",
+                expected=f"at most {maxSteps} steps",
+                current=f"t = {t} < tf = {tf}",
+            )
+            raise RuntimeError(msg)
+        last = t + h >= tf
+        if last:
+            h = tf - t
+
+        # stages (the 7th is the derivative at the new state: FSAL)
+        for idx in range(6):
+            np.add(y, h * np.tensordot(_A[idx], stages[:idx + 1], axes=1),
+                   out=yStage)
+            stages[idx + 1] = dynamics(t + _C[idx + 1] * h, yStage)
+
+        error = _errorNorm(t, h, stages, y, yStage, rtol, atol)
+        if not error <= 1:
+            factor = max(_MIN_FACTOR, _SAFETY * error**-0.2)
+            h *= factor
+            rejected = True
+            continue
+
+        # accepted step
+        count += 1
+        if count >= capacity:
+            capacity *= 2
+            times = np.resize(times, capacity)
+            states = _grow(states, capacity)
+            derivatives = _grow(derivatives, capacity)
+            corrections = _grow(corrections, capacity)
+        corrections[count - 1] = h * np.tensordot(_D, stages, axes=1)
+        t = tf if last else t + h
+        y, yStage = yStage, y
+        stages[0] = stages[6]
+        times[count], states[count], derivatives[count] = t, y, stages[0]
+
+        factor = _MAX_FACTOR if error == 0 else \
+            min(_MAX_FACTOR, _SAFETY * error**-0.2)
+        if rejected:
+            factor = min(1., factor)
+            rejected = False
+        h = min(h * factor, maxStep)
+
+    return Trajectory(times[:count + 1], states[:count + 1],
+                      derivatives[:count + 1], corrections[:count])
+
+
+def _errorNorm(t: float, h: float, stages: np.ndarray, y: np.ndarray,
+               yNew: np.ndarray, rtol: float, atol: np.ndarray) -> float:
+    """PRIVATE FUNCTION - RMS norm of the scaled error estimation of a
+    step (the propagation is stopped if it is not finite)"""
+    scale = atol + rtol * np.maximum(np.abs(y), np.abs(yNew))
+    error = h * np.tensordot(_E, stages, axes=1) / scale
+    error = math.sqrt(np.mean(error**2))
+    if not math.isfinite(error):
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg="The error estimation of the step is not finite",
+            expected="finite states and derivatives",
+            current=f"t = {t}, h = {h}, error = {error}",
+        )
+        raise RuntimeError(msg)
+    return error
+
+
+def _grow(buffer: np.ndarray, capacity: int) -> np.ndarray:
+    """PRIVATE FUNCTION - copy of a buffer with a larger first dimension"""
+    grown = np.empty((capacity,) + buffer.shape[1:])
+    grown[:len(buffer)] = buffer
+    return grown
+
+
+def _initialStep(dynamics, t0: float, y0: np.ndarray, f0: np.ndarray,
+                 rtol: float, atol: np.ndarray) -> float:
+    """PRIVATE FUNCTION - estimation of the first step (Hairer, Solving
+    ODE I, II.4)"""
+    scale = atol + rtol * np.abs(y0)
+    d0 = math.sqrt(np.mean((y0 / scale)**2))
+    d1 = math.sqrt(np.mean((f0 / scale)**2))
+    h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+
+    f1 = dynamics(t0 + h0, y0 + h0 * f0)
+    d2 = math.sqrt(np.mean(((f1 - f0) / scale)**2)) / h0
+    if max(d1, d2) <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2))**0.2
+    return min(100 * h0, h1)
@@ -0,0 +1,139 @@
+"""
+# ======================================================================= #
+# ====================== PROPAGATED TRAJECTORY ========================== #
+# ======================================================================= #
+"""
+# EXPORT
+__all__ = [
+    "Trajectory",
+]
+
+# IMPORT
+import numpy as np
+import dragonfly
+
+
+class Trajectory():
+    """Result of a propagation: the states at the steps of the integrator
+    and a continuous (dense) output between them
+
+    Between two steps, the states are the polynomial of Hairer
+    (Solving Ordinary Differential Equations I, II.6):
+
+        y(t0 + s h) = y0 + s (dy + (1 - s) (h f0 - dy
+                      + s (2 dy - h (f0 + f1) + (1 - s) r)))
+
+    with dy = y1 - y0. It is the cubic Hermite interpolation when the
+    correction r is zero (fixed step RK4) and the 4th order continuous
+    extension of Dormand-Prince otherwise.
+    """
+
+    def __init__(self, times: np.ndarray, states: np.ndarray,
+                 derivatives: np.ndarray, corrections: np.ndarray = None
+                 ) -> None:
+        """Create a trajectory (see propagateRK4 and propagateDOPRI5)
+
+        Args:
+            times (np.ndarray): increasing times of the steps [M]
+            states (np.ndarray): states at the steps [M x ...]
+            derivatives (np.ndarray): derivatives of the states at the
+                steps [M x ...]
+            corrections (np.ndarray, optional): corrections of the dense
+                output of the steps [(M-1) x ...]. Defaults to None
+                (cubic Hermite interpolation).
+        """
+        times = np.asarray(times, dtype=np.float64)
+        if times.ndim != 1 or times.size < 2 or np.any(np.diff(times) <= 0):
+            msg = dragonfly.utils.exception.createErrorMessage(
+                errorMsg="The times of a trajectory shall be increasing",
+                expected="[M] increasing array (M >= 2)",
+                current=f"shape: {times.shape}",
+            )
+            raise ValueError(msg)
+        states = np.asarray(states, dtype=np.float64)
+        derivatives = np.asarray(derivatives, dtype=np.float64)
+        if states.shape[0] != times.size or \
+                derivatives.shape != states.shape:
+            msg = dragonfly.utils.exception.createErrorMessage(
+                errorMsg="One state and one derivative per time are "
+                         "expected",
+                expected=f"{times.size} states and derivatives",
+                current=f"shapes: {states.shape}, {derivatives.shape}",
+            )
+            raise ValueError(msg)
+
+        self.__times = times
+        self.__states = states
+        self.__derivatives = derivatives
+        self.__corrections = corrections
+
+    def __len__(self) -> int:
+        """number of steps (times) of the trajectory"""
+        return self.__times.size
+
+    # --------------------- PROPERTIES
+    @property
+    def times(self) -> np.ndarray:
+        """times of the steps [M]"""
+        return self.__times
+
+    @property
+    def states(self) -> np.ndarray:
+        """states at the steps [M x ...]"""
+        return self.__states
+
+    @property
+    def derivatives(self) -> np.ndarray:
+        """derivatives of the states at the steps [M x ...]"""
+        return self.__derivatives
+
+    # --------------------- DENSE OUTPUT
+    def __call__(self, t) -> np.ndarray:
+        """Interpolate the states at any times of the trajectory
+
+        Args:
+            t (float | array_like): times between the first and the last
+                times of the trajectory
+
+        Returns:
+            np.ndarray: states [...] for a single time, [K x ...] for K
+                times
+        """
+        times = self.__times
+        t = np.asarray(t, dtype=np.float64)
+        tolerance = 1e-12 * max(abs(times[0]), abs(times[-1]), 1.)
+        if np.any(t < times[0] - tolerance) or \
+                np.any(t > times[-1] + tolerance):
+            msg = dragonfly.utils.exception.createErrorMessage(
+                errorMsg="The times shall be inside the trajectory",
+                expected=f"{times[0]} <= t <= {times[-1]}",
+                current=f"[{t.min()}, {t.max()}]",
+            )
+            raise ValueError(msg)
+
+        index = np.clip(np.searchsorted(times, t.ravel(), side="right") - 1,
+                        0, times.size - 2)
+        h = times[index + 1] - times[index]
+        shape = (-1,) + (1,) * (self.__states.ndim - 1)
+        s = ((t.ravel() - times[index]) / h).reshape(shape)
+        h = h.reshape(shape)
+
+        corrections = None if self.__corrections is None else \
+            self.__corrections[index]
+        states = _denseOutput(s, h, self.__states[index],
+                              self.__states[index + 1],
+                              self.__derivatives[index],
+                              self.__derivatives[index + 1], corrections)
+        return states.reshape(t.shape + self.__states.shape[1:])
+
+
+def _denseOutput(s, h, y0: np.ndarray, y1: np.ndarray, f0: np.ndarray,
+                 f1: np.ndarray, corrections: np.ndarray = None
+                 ) -> np.ndarray:
+    """PRIVATE FUNCTION - states at the fractions s of steps of size h
+    (see Trajectory)"""
+    dy = y1 - y0
+    inner = 2 * dy - h * (f0 + f1)
+    if corrections is not None:
+        inner += (1 - s) * corrections
+    return y0 + s * (dy + (1 - s) * (h * f0 - dy + s * inner))
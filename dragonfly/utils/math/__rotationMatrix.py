@@ -11,12 +11,14 @@ __all__ = [
     "rotz",
     "RotationMatrixError",
     "skew_matrix",
+    "skew_matrices",
+    "cross_product",
+    "double_cross_product",
 ]
 
 # IMPORT
 import numpy as np
 import dragonfly
-from scipy.spatial.transform import Rotation
 
 # Rotation Matrix exception
 
@@ -37,50 +39,67 @@ class RotationMatrixError(Exception):
         super().__init__(self.message)
 
 
-def rotx(theta: float) -> np.ndarray:
+def rotx(theta) -> np.ndarray:
     """provide the rotational matrix of an angle of theta along the x axis
 
     Args:
-        theta (float): angle of rotation defined in radians
+        theta (float | array_like): angle of rotation defined in radians
 
     Returns:
-        np.ndarray: rotational matrix [3x3]
+        np.ndarray: rotational matrix [3x3] (or [Nx3x3] for N angles)
     """
-    return __fundamentalRotation(np.array([1, 0, 0]), theta)
+    return __fundamentalRotation(0, theta)
 
 
-def roty(theta: float) -> np.ndarray:
+def roty(theta) -> np.ndarray:
     """provide the rotational matrix of an angle of theta along the y axis
 
     Args:
-        theta (float): angle of rotation defined in radians
+        theta (float | array_like): angle of rotation defined in radians
 
     Returns:
-        np.ndarray: rotational matrix [3x3]
+        np.ndarray: rotational matrix [3x3] (or [Nx3x3] for N angles)
     """
-    return __fundamentalRotation(np.array([0, 1, 0]), theta)
+    return __fundamentalRotation(1, theta)
 
 
-def rotz(theta: float) -> np.ndarray:
+def rotz(theta) -> np.ndarray:
     """provide the rotational matrix of an angle of theta along the z axis
 
     Args:
-        theta (float): angle of rotation defined in radians
+        theta (float | array_like): angle of rotation defined in radians
 
     Returns:
-        np.ndarray: rotational matrix [3x3]
+        np.ndarray: rotational matrix [3x3] (or [Nx3x3] for N angles)
     """
-    return __fundamentalRotation(np.array([0, 0, 1]), theta)
+    return __fundamentalRotation(2, theta)
 
 
-def __fundamentalRotation(axis: np.ndarray, theta) -> np.ndarray:
-    """PRIVATE FUNCTION - create rotation matrix based on angle and axis"""
+def __fundamentalRotation(axis: int, theta) -> np.ndarray:
+    """PRIVATE FUNCTION - create rotation matrix based on angle and axis
+    (closed form, the frame is rotated of theta around the axis)"""
     try:
-        theta = float(theta)
-        axis = dragonfly.utils.validation.input_check_3x1(axis)
-        return Rotation.from_rotvec(theta * axis.reshape((3,))).as_matrix().T
-    except BaseException as exc:
-        raise RotationMatrixError(axis, theta) from exc
+        angles = np.asarray(theta, dtype=np.float64)
+    except (TypeError, ValueError) as exc:
+        raise RotationMatrixError(np.eye(3)[axis], theta) from exc
+
+    # None (or objects) are converted to nan
+    if theta is None or not np.all(np.isfinite(angles)):
+        raise RotationMatrixError(np.eye(3)[axis], theta)
+    theta = angles
+
+    sinTheta = np.sin(theta)
+    cosTheta = np.cos(theta)
+    i = (axis + 1) % 3
+    j = (axis + 2) % 3
+
+    M = np.zeros(theta.shape + (3, 3), dtype=np.float64)
+    M[..., axis, axis] = 1.0
+    M[..., i, i] = cosTheta
+    M[..., j, j] = cosTheta
+    M[..., i, j] = sinTheta
+    M[..., j, i] = -sinTheta
+    return M
 
 
 def skew_matrix(vect: np.ndarray) -> np.ndarray:
@@ -101,3 +120,86 @@ def skew_matrix(vect: np.ndarray) -> np.ndarray:
                   [vect[2, 0], 0, -vect[0, 0]],
                   [-vect[1, 0], vect[0, 0], 0]])
     return M
+
+
+def skew_matrices(vectors) -> np.ndarray:
+    """provide the skew symetrical matrices of a set of vectors
+
+    Args:
+        vectors (array_like): vectors [Nx3]
+
+    Returns:
+        np.ndarray: skew symetrical matrices [Nx3x3]
+    """
+    data = dragonfly.utils.validation.validateVectorArray(vectors)
+    x = data[:, 0]
+    y = data[:, 1]
+    z = data[:, 2]
+
+    M = np.zeros((data.shape[0], 3, 3), dtype=np.float64)
+    M[:, 0, 1] = -z
+    M[:, 0, 2] = y
+    M[:, 1, 0] = z
+    M[:, 1, 2] = -x
+    M[:, 2, 0] = -y
+    M[:, 2, 1] = x
+    return M
+
+
+def cross_product(u, v) -> np.ndarray:
+    """provide the cross products u x v of two sets of vectors (i.e.
+    skew_matrix(u) @ v) without building the skew matrices. A single
+    vector is broadcasted against the other set
+
+    Args:
+        u (array_like): vectors [Nx3] (or [3])
+        v (array_like): vectors [Nx3] (or [3])
+
+    Returns:
+        np.ndarray: cross products [Nx3]
+    """
+    u = dragonfly.utils.validation.validateVectorArray(u)
+    v = dragonfly.utils.validation.validateVectorArray(v)
+    try:
+        res = np.empty(np.broadcast_shapes(u.shape, v.shape))
+    except ValueError as exc:
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg="The sets of vectors shall have the same size",
+            expected=f"[{u.shape[0]}x3] or [1x3] Numpy Array",
+            current=f"shape: {v.shape}",
+        )
+        raise ValueError(msg) from exc
+
+    res[:, 0] = u[:, 1] * v[:, 2] - u[:, 2] * v[:, 1]
+    res[:, 1] = u[:, 2] * v[:, 0] - u[:, 0] * v[:, 2]
+    res[:, 2] = u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]
+    return res
+
+
+def double_cross_product(u, v) -> np.ndarray:
+    """provide the double cross products u x (u x v) of two sets of vectors
+    (e.g. the centripetal term omega x (omega x r)) with the identity
+    u x (u x v) = u (u.v) - v (u.u). A single vector is broadcasted against
+    the other set
+
+    Args:
+        u (array_like): vectors [Nx3] (or [3])
+        v (array_like): vectors [Nx3] (or [3])
+
+    Returns:
+        np.ndarray: double cross products [Nx3]
+    """
+    u = dragonfly.utils.validation.validateVectorArray(u)
+    v = dragonfly.utils.validation.validateVectorArray(v)
+    try:
+        uv = np.sum(u * v, axis=1, keepdims=True)
+    except ValueError as exc:
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg="The sets of vectors shall have the same size",
+            expected=f"[{u.shape[0]}x3] or [1x3] Numpy Array",
+            current=f"shape: {v.shape}",
+        )
+        raise ValueError(msg) from exc
+
+    uu = np.sum(u * u, axis=1, keepdims=True)
+    return u * uv - v * uu
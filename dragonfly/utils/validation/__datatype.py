@@ -5,11 +5,13 @@
 # EXPORT
 __all__ = [
     "validateInstance",
+    "validateInteger",
     "validateListInstances",
     "validateTupleInstances",
 ]
 
 # IMPORT
+import operator
 import typing
 import dragonfly
 
@@ -60,6 +62,31 @@ def validateInstance(
     raise TypeError(msg)
 
 
+def validateInteger(data: typing.Any) -> int:
+    """validate if a data is an integer (Python or numpy integer, not a
+    boolean)
+
+    Args:
+        data (Any): data to assess
+
+    Returns:
+        int: data as a Python int
+    """
+    if not isinstance(data, bool):
+        try:
+            return operator.index(data)
+        except TypeError:
+            pass
+
+    # raise error
+    msg = dragonfly.utils.exception.createErrorMessage(
+        errorMsg="The input shall be an integer",
+        expected="int or numpy integer",
+        current=f"{data} ({type(data)})",
+    )
+    raise TypeError(msg)
+
+
 def validateListInstances(data: typing.Any, instance) -> list:
     """Check if data is a list of instance object
 
@@ -6,3 +6,4 @@
 from .__linalg import *
 from .__datatype import *
 from .__paths import *
+from .__parameters import *
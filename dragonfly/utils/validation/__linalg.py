@@ -8,6 +8,7 @@
 __all__ = [
     "input_check_3x1",
     "input_check_3x3",
+    "validateVectorArray",
 ]
 
 # IMPORT
@@ -67,3 +68,32 @@ def input_check_3x3(x_in: Any) -> np.ndarray:
         current=f"Values: {x_in} - Type: {type(x_in)}"
     )
     raise ValueError(msg)
+
+
+def validateVectorArray(data: Any, name: str = "vectors") -> np.ndarray:
+    """Check if a data ([Nx3] array, [3] array or PositionArray) is mutable
+    to a [Nx3] float64 numpy array and return it
+
+    Args:
+        data (Any): data to assess
+        name (str, optional): name of the data in the error message.
+            Defaults to "vectors".
+
+    Raises:
+        ValueError: exception raised if the data is not the appropriate shape
+
+    Returns:
+        np.ndarray: data as a [Nx3] float64 numpy array
+    """
+    array = np.asarray(data, dtype=np.float64)
+    if array.ndim == 1 and array.shape[0] == 3:
+        array = array.reshape((1, 3))
+
+    if array.ndim != 2 or array.shape[1] != 3:
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg=f"The {name} shall be mutable to a [Nx3] numpy array",
+            expected="[Nx3] Numpy Array",
+            current=f"shape: {array.shape}",
+        )
+        raise ValueError(msg)
+    return array
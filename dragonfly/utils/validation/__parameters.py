@@ -0,0 +1,74 @@
+"""
+#######################################################################
+##################### MODEL PARAMETERS VALIDATION #####################
+#######################################################################
+"""
+
+# EXPORT
+__all__ = [
+    "validateDegree",
+    "validateRotationSequence",
+]
+
+# IMPORT
+import dragonfly
+
+
+# PARAMETERS
+_ROTATION_SEQUENCES = (
+    # Tait-Bryan angles
+    "XYZ", "XZY", "YXZ", "YZX", "ZXY", "ZYX",
+    # proper Euler angles
+    "XYX", "XZX", "YXY", "YZY", "ZXZ", "ZYZ",
+)
+
+
+def validateDegree(degree: int, maxDegree: int) -> int:
+    """Check the degree of a gravity model (from 1, point mass only, to
+    maxDegree)
+
+    Args:
+        degree (int): degree to assess
+        maxDegree (int): highest degree of the model
+
+    Raises:
+        ValueError: exception raised if the degree is out of range
+
+    Returns:
+        int: same object as degree
+    """
+    degree = dragonfly.utils.validation.validateInstance(degree, int)
+    if not 1 <= degree <= maxDegree:
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg="The degree of the gravity model is out of range",
+            expected=f"1 <= degree <= {maxDegree}",
+            current=str(degree),
+        )
+        raise ValueError(msg)
+    return degree
+
+
+def validateRotationSequence(rotationSequence: str) -> str:
+    """Check a sequence of rotations of Euler angles (Tait-Bryan or proper
+    Euler angles)
+
+    Args:
+        rotationSequence (str): sequence to assess (e.g. 'ZYX', case
+            insensitive)
+
+    Raises:
+        ValueError: exception raised if the sequence is unknown
+
+    Returns:
+        str: upper case rotation sequence
+    """
+    rotationSequence = dragonfly.utils.validation.validateInstance(
+        rotationSequence, str).upper()
+    if rotationSequence not in _ROTATION_SEQUENCES:
+        msg = dragonfly.utils.exception.createErrorMessage(
+            errorMsg="Unknown rotation sequence",
+            expected=str(_ROTATION_SEQUENCES),
+            current=rotationSequence,
+        )
+        raise ValueError(msg)
+    return rotationSequence
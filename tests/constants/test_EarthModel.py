@@ -71,3 +71,16 @@ def test_EarthModel_error():
     with pytest.raises(AttributeError):
         e = EarthModel()
         e.model = 0
+
+
+def test_EarthModel_zonals():
+    """zonal harmonics J2 to J6 (J3 to J6 from JGM-3)"""
+    expected = (1.08263E-3, -2.53215306E-6, -1.61098761E-6, -2.2357866E-7,
+                5.4316985E-7)
+
+    earth = EarthModel("WGS84")
+    assert earth.zonals == expected
+    assert earth.maxDegree == 6
+    assert earth.j2 == earth.zonals[0]
+
+    assert EarthModel("SPHERICAL").zonals == (0.0,) * 5
@@ -3,7 +3,7 @@
 """
 
 # MODULE IMPORT
-from dragonfly.geography import Position
+from dragonfly.geography import Position, FrozenPosition
 import pytest
 import numpy as np
 import math
@@ -183,6 +183,25 @@ def test_norm():
                                     abs=ABSOLUTE_TOLERANCE,rel=RELATIVE_TOLERANCE)
 
 
+def test_norm_cache():
+    """the cached norm shall be updated when a coordinate is modified"""
+    pos = Position(3, 4, 0)
+    assert pos.norm == 5.0
+
+    pos.z = 12
+    assert pos.norm == pytest.approx(13.0, abs=ABSOLUTE_TOLERANCE,
+                                     rel=RELATIVE_TOLERANCE)
+
+
+def test_slots():
+    """Position shall not have an instance dictionary"""
+    pos = Position(1, 2, 3)
+
+    assert not hasattr(pos, "__dict__")
+    with pytest.raises(AttributeError):
+        pos.w = 4
+
+
 def test_toNumpy():
 
     np.testing.assert_allclose(Position(1,2,3).toNumpy(),np.reshape(np.array([1,2,3]),(3,-1)),
@@ -211,6 +230,32 @@ def test_equality():
         Position(0,0,0)==1
 
 
+def test_hash():
+    pos1 = Position.fromLLA(np.deg2rad(45), np.deg2rad(-45), 0)
+    pos2 = FrozenPosition.fromLLA(np.deg2rad(45), np.deg2rad(-45), 0)
+
+    # mutable positions are not hashable
+    with pytest.raises(TypeError):
+        hash(pos1)
+
+    frozen = pos1.freeze()
+    assert isinstance(frozen, FrozenPosition) and frozen == pos1
+    assert frozen.freeze() is frozen
+    assert hash(frozen) == hash(pos2)
+    assert len({frozen, pos2, FrozenPosition(0, 0, 0)}) == 2
+    assert FrozenPosition.fromList([[0, 0, 0], [1, 2, 3]])[1] == \
+        FrozenPosition(1, 2, 3)
+    assert frozen.toLLA() == pytest.approx(pos1.toLLA())
+    assert frozen.norm == pos1.norm
+
+    # frozen positions are immutable
+    with pytest.raises(AttributeError):
+        frozen.x = 0.0
+
+    with pytest.raises(AttributeError):
+        frozen._norm = 0.0
+
+
 def test_sub():
     pos1 = Position(1,2,3)
     pos2 = Position(1,1,1)
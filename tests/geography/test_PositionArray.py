@@ -0,0 +1,145 @@
+"""
+# ================== UNIT TEST FOR PositionArray Class ================== #
+"""
+
+# MODULE IMPORT
+from dragonfly.geography import Position, PositionArray
+import pytest
+import numpy as np
+
+# CONSTANTS
+ABSOLUTE_TOLERANCE = 1e-12
+RELATIVE_TOLERANCE = 1e-6
+
+NESTED_LIST = [[10, 20, 30], [20, 40, 60], [30, 60, 90], [-1, 2, -3]]
+
+
+@pytest.fixture
+def simple_positions():
+    return PositionArray.fromList(NESTED_LIST)
+
+
+def test_creation():
+    """PositionArray shall store the coordinates as a [Nx3] float array"""
+    data = np.array(NESTED_LIST, dtype=np.float64)
+    positions = PositionArray(data[:, 0], data[:, 1], data[:, 2])
+
+    assert len(positions) == 4
+    assert positions.toNumpy().shape == (4, 3)
+    assert positions.toNumpy().dtype == np.float64
+    assert positions.toNumpy().flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(positions.toNumpy(), data)
+
+    with pytest.raises(ValueError):
+        PositionArray([1, 2], [1, 2], [1, 2, 3])
+
+
+def test_fromList(simple_positions):
+    np.testing.assert_array_equal(simple_positions.toNumpy(),
+                                  np.array(NESTED_LIST))
+    np.testing.assert_array_equal(simple_positions.x, [10, 20, 30, -1])
+    np.testing.assert_array_equal(simple_positions.y, [20, 40, 60, 2])
+    np.testing.assert_array_equal(simple_positions.z, [30, 60, 90, -3])
+
+    # bad type
+    with pytest.raises(TypeError):
+        PositionArray.fromList("a")
+
+    # bad size
+    with pytest.raises(ValueError):
+        PositionArray.fromList([[1, 2, 3, 4]])
+
+    with pytest.raises(ValueError):
+        PositionArray.fromList([[1, 2, 3], [1, 2]])
+
+
+def test_fromNumpy():
+    """fromNumpy shall not copy a C-contiguous float64 array"""
+    data = np.array(NESTED_LIST, dtype=np.float64)
+    positions = PositionArray.fromNumpy(data)
+
+    assert positions.toNumpy() is data
+
+    # conversion of integer array
+    positions = PositionArray.fromNumpy(np.array(NESTED_LIST))
+    assert positions.toNumpy().dtype == np.float64
+
+    # single position
+    assert len(PositionArray.fromNumpy(np.array([1., 2., 3.]))) == 1
+
+    with pytest.raises(TypeError):
+        PositionArray.fromNumpy(NESTED_LIST)
+
+    with pytest.raises(ValueError):
+        PositionArray.fromNumpy(np.zeros((3, 4)))
+
+
+def test_position_conversion(simple_positions):
+    """integer indexing and iteration shall provide Position objects"""
+    pos = simple_positions[1]
+    assert isinstance(pos, Position)
+    assert pos == Position(20, 40, 60)
+    assert simple_positions[-1] == Position(-1, 2, -3)
+
+    for pos, expected in zip(simple_positions, NESTED_LIST):
+        assert pos == Position(*expected)
+
+    positions = PositionArray.fromPosition(
+        [Position(*data) for data in NESTED_LIST])
+    assert positions == simple_positions
+
+    assert len(PositionArray.fromPosition(Position(1, 2, 3))) == 1
+
+    with pytest.raises(TypeError):
+        PositionArray.fromPosition([1, 2, 3])
+
+
+def test_slicing(simple_positions):
+    """slices shall be views on the same storage"""
+    sub = simple_positions[1:3]
+
+    assert isinstance(sub, PositionArray)
+    assert len(sub) == 2
+    assert np.shares_memory(sub.toNumpy(), simple_positions.toNumpy())
+
+    # boolean mask
+    sub = simple_positions[simple_positions.x > 15]
+    np.testing.assert_array_equal(sub.x, [20, 30])
+
+    # rows with all the coordinates
+    sub = simple_positions[[0, 2], :]
+    assert len(sub) == 2
+    np.testing.assert_array_equal(sub.x, simple_positions.x[[0, 2]])
+
+    # coordinates are not positions
+    for index in [(slice(None), 0), (0, 1), (slice(None), slice(0, 2)),
+                  (0, slice(None))]:
+        with pytest.raises(IndexError):
+            simple_positions[index]
+
+
+def test_norm(simple_positions):
+    np.testing.assert_allclose(
+        simple_positions.norm,
+        [pos.norm for pos in simple_positions],
+        atol=ABSOLUTE_TOLERANCE, rtol=RELATIVE_TOLERANCE)
+
+
+def test_sub(simple_positions):
+    delta = simple_positions - Position(1, 1, 1)
+    np.testing.assert_array_equal(delta.toNumpy(),
+                                  np.array(NESTED_LIST) - 1)
+
+    delta = simple_positions - simple_positions
+    np.testing.assert_array_equal(delta.toNumpy(), np.zeros((4, 3)))
+
+    with pytest.raises(NotImplementedError):
+        simple_positions - 1
+
+    with pytest.raises(NotImplementedError):
+        simple_positions == 1
+
+
+def test_numpy_interface(simple_positions):
+    assert np.asarray(simple_positions) is simple_positions.toNumpy()
+    assert len(simple_positions.toList()) == 4
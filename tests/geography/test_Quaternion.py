@@ -0,0 +1,153 @@
+"""
+##########################  TEST QUATERNION CLASS  ###########################
+"""
+
+
+# Import Module
+from dragonfly.geography import Quaternion, angle2dcm, dcm2angle
+import pytest
+import numpy as np
+
+ABSOLUTE_TOLERANCE = 1e-12
+RELATIVE_TOLERANCE = 1e-6
+NB_OBJ = 500
+
+
+@pytest.fixture
+def randomAngles():
+    rng = np.random.default_rng(9)
+    yaw = rng.uniform(-np.pi, np.pi, NB_OBJ)
+    pitch = rng.uniform(-np.pi/2 + 0.01, np.pi/2 - 0.01, NB_OBJ)
+    roll = rng.uniform(-np.pi, np.pi, NB_OBJ)
+    return yaw, pitch, roll
+
+
+def test_init():
+    q = Quaternion(1, 0, 0, 0)
+    assert len(q) == 1
+    np.testing.assert_array_equal(q.toNumpy(), [[1, 0, 0, 0]])
+    assert q == Quaternion.identity()
+
+    q = Quaternion([1, 0], [0, 1], 0, 0)
+    assert len(q) == 2
+    np.testing.assert_array_equal(q.x, [0, 1])
+    np.testing.assert_array_equal(np.asarray(q[1]), [[0, 1, 0, 0]])
+
+    with pytest.raises(ValueError):
+        Quaternion([1, 0], [0, 1, 2], 0, 0)
+
+    with pytest.raises(TypeError):
+        Quaternion.fromNumpy([1, 0, 0, 0])
+
+    with pytest.raises(ValueError):
+        Quaternion.fromNumpy(np.zeros((3, 3)))
+
+
+def test_elementary():
+    """a rotation of the frame of 90 deg around z"""
+    q = Quaternion.fromAngles(np.pi/2, 0, 0)
+    np.testing.assert_allclose(q.toNumpy(),
+                               [[np.sqrt(2)/2, 0, 0, -np.sqrt(2)/2]],
+                               atol=ABSOLUTE_TOLERANCE)
+    np.testing.assert_allclose(q.rotate([1., 0., 0.]), [[0., -1., 0.]],
+                               atol=ABSOLUTE_TOLERANCE)
+
+
+@pytest.mark.parametrize("sequence", ["ZYX", "XYZ", "ZXZ", "YXY"])
+def test_fromAngles(sequence):
+    rng = np.random.default_rng(10)
+    angles = rng.uniform(0.1, 1.4, (3, NB_OBJ))
+
+    q = Quaternion.fromAngles(*angles, sequence)
+    np.testing.assert_allclose(q.norm, 1.)
+    np.testing.assert_allclose(q.toDcm(), angle2dcm(*angles, sequence),
+                               atol=ABSOLUTE_TOLERANCE)
+
+    for computed, expected in zip(q.toAngles(sequence), angles):
+        np.testing.assert_allclose(computed, expected, rtol=0, atol=1e-9)
+
+
+def test_fromDcm(randomAngles):
+    dcm = angle2dcm(*randomAngles)
+    q = Quaternion.fromDcm(dcm)
+
+    assert np.all(q.w >= 0)
+    np.testing.assert_allclose(q.toDcm(), dcm, atol=ABSOLUTE_TOLERANCE)
+
+    # rotations of 180 deg (w = 0)
+    for axis in np.eye(3):
+        dcm = 2 * np.outer(axis, axis) - np.eye(3)
+        np.testing.assert_allclose(Quaternion.fromDcm(dcm).toDcm()[0], dcm,
+                                   atol=ABSOLUTE_TOLERANCE)
+
+    with pytest.raises(ValueError):
+        Quaternion.fromDcm(np.zeros((3, 2)))
+
+
+def test_composition(randomAngles):
+    yaw, pitch, roll = randomAngles
+    q1 = Quaternion.fromAngles(yaw, pitch, roll)
+    q2 = Quaternion.fromAngles(roll, yaw, pitch / 2, "XZY")
+
+    np.testing.assert_allclose((q1 * q2).toDcm(), q1.toDcm() @ q2.toDcm(),
+                               atol=ABSOLUTE_TOLERANCE)
+
+    # broadcast of a single attitude
+    np.testing.assert_allclose((q1[3] * q2).toDcm(),
+                               q1.toDcm()[3] @ q2.toDcm(),
+                               atol=ABSOLUTE_TOLERANCE)
+
+    # inverse
+    np.testing.assert_allclose((q1 * q1.inverse()).toNumpy(),
+                               Quaternion.identity(NB_OBJ).toNumpy(),
+                               atol=ABSOLUTE_TOLERANCE)
+    np.testing.assert_allclose(q1.inverse().toDcm(),
+                               np.transpose(q1.toDcm(), (0, 2, 1)),
+                               atol=ABSOLUTE_TOLERANCE)
+
+    with pytest.raises(ValueError):
+        q1 * q2[:3]
+
+    with pytest.raises(NotImplementedError):
+        q1 * 2
+
+
+def test_rotate(randomAngles):
+    q = Quaternion.fromAngles(*randomAngles)
+    vectors = np.random.default_rng(12).normal(size=(NB_OBJ, 3))
+
+    np.testing.assert_allclose(q.rotate(vectors),
+                               np.einsum("nij,nj->ni", q.toDcm(), vectors),
+                               atol=ABSOLUTE_TOLERANCE)
+
+    np.testing.assert_allclose(q[0].rotate(vectors), vectors @ q.toDcm()[0].T,
+                               atol=ABSOLUTE_TOLERANCE)
+
+    # non unit quaternions: same rotation as the DCM
+    scaled = Quaternion(3 * q.w, 3 * q.x, 3 * q.y, 3 * q.z)
+    np.testing.assert_allclose(scaled.rotate(vectors),
+                               np.einsum("nij,nj->ni", scaled.toDcm(),
+                                         vectors),
+                               atol=ABSOLUTE_TOLERANCE)
+
+    with pytest.raises(ValueError):
+        q.rotate(np.zeros((NB_OBJ, 2)))
+
+
+def test_normalize(randomAngles):
+    """long chain of attitude updates"""
+    step = Quaternion.fromAngles(0.001, 0.002, -0.003)
+    q = Quaternion.fromAngles(*randomAngles)
+    for _ in range(1000):
+        q = step * q
+    q = q.normalize()
+
+    np.testing.assert_allclose(q.norm, 1., rtol=0, atol=1e-15)
+    expected = np.linalg.matrix_power(angle2dcm(0.001, 0.002, -0.003),
+                                      1000) @ angle2dcm(*randomAngles)
+    np.testing.assert_allclose(q.toDcm(), expected, atol=1e-10)
+
+    # the Euler angles of the result
+    for computed, angle in zip(q.toAngles(), dcm2angle(expected)):
+        np.testing.assert_allclose(np.sin(computed), np.sin(angle),
+                                   atol=1e-9)
@@ -0,0 +1,132 @@
+"""
+##########################  TEST CELL IDS  ###################################
+"""
+
+
+# Import Module
+from dragonfly.geography import (getCellId, getCellLevel, getCellParent,
+                                 getCellChildren, getCellNeighbours,
+                                 getCellBounds)
+import pytest
+import numpy as np
+
+ABSOLUTE_TOLERANCE = 1e-12
+RELATIVE_TOLERANCE = 1e-6
+NB_OBJ = 10000
+
+
+@pytest.fixture
+def randomPoints():
+    rng = np.random.default_rng(11)
+    lat = np.arcsin(rng.uniform(-1, 1, NB_OBJ))
+    lon = rng.uniform(-np.pi, np.pi, NB_OBJ)
+    return lat, lon
+
+
+def test_getCellId_root():
+    assert getCellId(0.0, -1.0, 0) == 2
+    assert getCellId(0.0, 1.0, 0) == 3
+    assert getCellId(np.pi/2, np.pi, 0) == 2    # wrapped in longitude
+
+    np.testing.assert_array_equal(
+        getCellId([-1.0, -1.0, 1.0, 1.0], [0.1, 2.0, 0.1, 2.0], 1),
+        [12, 13, 14, 15])
+
+
+@pytest.mark.parametrize("level", [0, 1, 5, 17, 30])
+def test_getCellId_bounds(randomPoints, level):
+    lat, lon = randomPoints
+    cellId = getCellId(lat, lon, level)
+
+    assert cellId.dtype == np.int64
+    np.testing.assert_array_equal(getCellLevel(cellId), level)
+
+    bounds = getCellBounds(cellId)
+    assert bounds.shape == (NB_OBJ, 4)
+    assert np.all((bounds[:, 0] <= lat) & (lat <= bounds[:, 1]))
+    assert np.all((bounds[:, 2] <= lon) & (lon <= bounds[:, 3]))
+    np.testing.assert_allclose(bounds[:, 1] - bounds[:, 0], np.pi / 2**level,
+                               rtol=RELATIVE_TOLERANCE)
+
+
+def test_getCellParent(randomPoints):
+    lat, lon = randomPoints
+    cellId = getCellId(lat, lon, 20)
+
+    np.testing.assert_array_equal(getCellParent(cellId),
+                                  getCellId(lat, lon, 19))
+    np.testing.assert_array_equal(getCellParent(cellId, 4),
+                                  getCellId(lat, lon, 4))
+    np.testing.assert_array_equal(getCellParent(cellId, 20), cellId)
+
+    with pytest.raises(ValueError):
+        getCellParent(getCellId(lat, lon, 0))
+
+
+def test_getCellChildren(randomPoints):
+    lat, lon = randomPoints
+    cellId = getCellId(lat, lon, 8)
+
+    children = getCellChildren(cellId)
+    assert children.shape == (NB_OBJ, 4)
+    np.testing.assert_array_equal(getCellParent(children),
+                                  np.repeat(cellId[:, None], 4, axis=1))
+
+    # the child containing the point
+    assert np.all(np.any(children == getCellId(lat, lon, 9)[:, None],
+                         axis=1))
+
+
+def test_getCellNeighbours():
+    level = 4
+    step = np.pi / 2**level
+    cellId = getCellId(0.5 * step, 0.5 * step, level)
+
+    neighbours = getCellNeighbours(cellId)
+    assert neighbours.shape == (8,)
+
+    bounds = getCellBounds(neighbours)
+    np.testing.assert_allclose(bounds[:, 0], np.array(
+        [-1, -1, -1, 0, 0, 1, 1, 1]) * step, atol=ABSOLUTE_TOLERANCE)
+    np.testing.assert_allclose(bounds[:, 2], np.array(
+        [-1, 0, 1, -1, 1, -1, 0, 1]) * step, atol=ABSOLUTE_TOLERANCE)
+
+
+def test_getCellNeighbours_wrap():
+    level = 3
+    cellId = getCellId(-np.pi/2, np.pi - 1e-9, level)
+    neighbours = getCellNeighbours(cellId)
+
+    # south pole
+    np.testing.assert_array_equal(neighbours[:3], -1)
+
+    # east neighbour across the anti-meridian
+    assert neighbours[4] == getCellId(-np.pi/2, -np.pi, level)
+    assert neighbours[7] == getCellId(-np.pi/2 + np.pi / 2**level, -np.pi,
+                                      level)
+
+
+def test_getCellId_numpyLevel():
+    cellId = getCellId(0.3, 1.2, np.int64(12))
+    assert cellId == getCellId(0.3, 1.2, 12)
+    assert getCellParent(cellId, np.int32(4)) == getCellParent(cellId, 4)
+
+
+def test_getCellId_error():
+    with pytest.raises(ValueError):
+        getCellId(0.0, 0.0, 31)
+
+    with pytest.raises(TypeError):
+        getCellId(0.0, 0.0, 1.0)
+
+    with pytest.raises(ValueError):
+        getCellId(2.0, 0.0, 1)
+
+    with pytest.raises(ValueError):
+        getCellLevel(4)     # no valid sentinel bit
+
+    with pytest.raises(TypeError):
+        getCellLevel(2.0)
+
+    with pytest.raises(ValueError):
+        getCellChildren(getCellId(0.0, 0.0, 30))
@@ -0,0 +1,188 @@
+"""
+##########################  TEST GEODESIC PROBLEMS  ##########################
+"""
+
+
+# Import Module
+from dragonfly.geography import (getInverseGeodesic, getDirectGeodesic,
+                                 getRange, getRanges, getRangeMatrix)
+import pytest
+import numpy as np
+
+ABSOLUTE_TOLERANCE = 1e-12
+RELATIVE_TOLERANCE = 1e-6
+NB_OBJ = 500
+
+# (lat1, lon1, lat2, lon2) in degrees, distance (m), azimuths (deg)
+# computed with GeographicLib 2.0 (WGS84)
+VALUE2TEST = [
+    [(-41.32, 174.81, 40.96, -5.50),
+     19959679.26735382, 161.06766998616015, 18.825195123247063],
+    [(0.0, 0.0, 0.5, 179.5),
+     19936288.578965314, 25.67187286829188, 154.3270854699416],
+    [(0.0, 0.0, 0.5, 179.7),
+     19944127.420750458, 15.556882793490544, 164.44251389085494],
+    [(-30.0, 0.0, 29.9, 179.8),
+     19989832.82760953, 161.89052473632697, 18.0907372457395],
+    [(0.0, 0.0, 0.0, 90.0),
+     10018754.171394622, 90.0, 90.0],
+    [(89.9, 0.0, -89.9, 180.0),
+     20003931.458625447, 0.0, 180.0],
+]
+
+# (lat1, lon1, azi1) in degrees, distance (m), (lat2, lon2, azi2) in degrees
+# computed with GeographicLib 2.0 (WGS84)
+DIRECT2TEST = [
+    [(-41.32, 174.81, 161.06766998616015), 19959679.26735382,
+     (40.96, -5.5, 18.825195123247056)],
+    [(10.0, 20.0, 45.0), 1e6,
+     (16.314078459262394, 26.604251127257527, 46.50715191377796)],
+    [(89.9, 0.0, 180.0), 10001965.729312724,
+     (-0.1010126237957861, 0.0, 180.0)],
+    [(0.0, 0.0, 90.0), -5e6,
+     (0.0, -44.915764205976075, 90.0)],
+]
+
+
+def test_getInverseGeodesic_reference():
+    data = np.deg2rad(np.array([sample[0] for sample in VALUE2TEST]))
+
+    distance, azimuth1, azimuth2 = getInverseGeodesic(
+        data[:, 0], data[:, 1], data[:, 2], data[:, 3])
+
+    for idx, sample in enumerate(VALUE2TEST):
+        msg = f"Test Case : {sample}"
+        assert distance[idx] == pytest.approx(sample[1], abs=1e-8), msg
+        assert np.rad2deg(azimuth1[idx]) == pytest.approx(
+            sample[2], abs=1e-9), msg
+        assert np.rad2deg(azimuth2[idx]) == pytest.approx(
+            sample[3], abs=1e-9), msg
+
+
+def test_getInverseGeodesic_vincenty():
+    """Karney's and Vincenty's methods shall agree when Vincenty
+    converges"""
+    rng = np.random.default_rng(1)
+    lat1 = rng.uniform(-np.pi/2, np.pi/2, NB_OBJ)
+    long1 = rng.uniform(-np.pi, np.pi, NB_OBJ)
+    lat2 = rng.uniform(-np.pi/2, np.pi/2, NB_OBJ)
+    long2 = rng.uniform(-np.pi, np.pi, NB_OBJ)
+
+    vincenty, notConverged = getRanges(lat1, long1, lat2, long2)
+    karney, _, _ = getInverseGeodesic(lat1, long1, lat2, long2)
+
+    np.testing.assert_allclose(karney[~notConverged],
+                               vincenty[~notConverged], rtol=0, atol=1e-3)
+
+
+def test_getInverseGeodesic_symmetry():
+    rng = np.random.default_rng(2)
+    lat1 = rng.uniform(-np.pi/2, np.pi/2, NB_OBJ)
+    long1 = rng.uniform(-np.pi, np.pi, NB_OBJ)
+    lat2 = rng.uniform(-np.pi/2, np.pi/2, NB_OBJ)
+    long2 = rng.uniform(-np.pi, np.pi, NB_OBJ)
+
+    distance12, _, _ = getInverseGeodesic(lat1, long1, lat2, long2)
+    distance21, _, _ = getInverseGeodesic(lat2, long2, lat1, long1)
+
+    np.testing.assert_allclose(distance12, distance21, rtol=0, atol=1e-8)
+
+
+def test_getInverseGeodesic_coincident():
+    distance, _, _ = getInverseGeodesic(0.1, 0.2, 0.1, 0.2)
+    assert distance == 0.0
+
+
+def test_getRange_karney():
+    """near antipodal points shall converge with the Karney method"""
+    lat1, long1, lat2, long2 = np.deg2rad(VALUE2TEST[2][0])
+
+    assert getRange(lat1, long1, lat2, long2) is None
+    assert getRange(lat1, long1, lat2, long2, method="karney") == \
+        pytest.approx(VALUE2TEST[2][1], abs=1e-3)
+
+    ranges, notConverged = getRanges(lat1, long1, lat2, long2,
+                                     method="Karney")
+    assert not np.any(notConverged)
+    assert ranges == pytest.approx(VALUE2TEST[2][1], abs=1e-3)
+
+    matrix = getRangeMatrix([[lat1, long1]], [[lat2, long2]],
+                            method="karney")
+    assert matrix[0, 0] == pytest.approx(VALUE2TEST[2][1], abs=1e-3)
+
+
+def test_getRange_method_error():
+    with pytest.raises(ValueError):
+        getRange(0.0, 0.0, 0.1, 0.1, method="toto")
+
+    with pytest.raises(TypeError):
+        getRanges(0.0, 0.0, 0.1, 0.1, method=1)
+
+
+def test_getInverseGeodesic_error():
+    with pytest.raises(ValueError):
+        getInverseGeodesic(2.0, 0.0, 0.0, 0.0)
+
+
+def test_getDirectGeodesic_reference():
+    start = np.deg2rad(np.array([sample[0] for sample in DIRECT2TEST]))
+    distance = np.array([sample[1] for sample in DIRECT2TEST])
+
+    lat2, long2, azimuth2 = getDirectGeodesic(
+        start[:, 0], start[:, 1], start[:, 2], distance)
+
+    for idx, sample in enumerate(DIRECT2TEST):
+        msg = f"Test Case : {sample}"
+        assert np.rad2deg(lat2[idx]) == pytest.approx(
+            sample[2][0], abs=1e-10), msg
+        assert np.rad2deg(long2[idx]) == pytest.approx(
+            sample[2][1], abs=1e-10), msg
+        assert np.rad2deg(azimuth2[idx]) == pytest.approx(
+            sample[2][2], abs=1e-10), msg
+
+
+def test_getDirectGeodesic_inverse():
+    """the direct problem shall be consistent with the inverse problem"""
+    rng = np.random.default_rng(3)
+    lat1 = rng.uniform(-np.pi/2, np.pi/2, NB_OBJ)
+    long1 = rng.uniform(-np.pi, np.pi, NB_OBJ)
+    azimuth1 = rng.uniform(-np.pi, np.pi, NB_OBJ)
+    distance = rng.uniform(0, 1e7, NB_OBJ)
+
+    lat2, long2, azimuth2 = getDirectGeodesic(lat1, long1, azimuth1,
+                                              distance)
+    assert np.all(np.abs(long2) <= np.pi)
+
+    s12, azi1, azi2 = getInverseGeodesic(lat1, long1, lat2, long2)
+    np.testing.assert_allclose(s12, distance, rtol=0, atol=1e-6)
+    np.testing.assert_allclose(np.sin(azi1), np.sin(azimuth1),
+                               rtol=0, atol=1e-9)
+    np.testing.assert_allclose(np.cos(azi2), np.cos(azimuth2),
+                               rtol=0, atol=1e-9)
+
+
+def test_getDirectGeodesic_broadcast():
+    """range rings: sites [Nx1] against azimuths [M]"""
+    sites = np.deg2rad([[10.0, 20.0], [-45.0, 170.0], [60.0, -3.0]])
+    azimuths = np.linspace(-np.pi, np.pi, 16, endpoint=False)
+
+    lat2, long2, _ = getDirectGeodesic(sites[:, :1], sites[:, 1:],
+                                       azimuths, 250e3)
+    assert lat2.shape == long2.shape == (3, 16)
+
+    ranges, _, _ = getInverseGeodesic(sites[:, :1], sites[:, 1:],
+                                      lat2, long2)
+    np.testing.assert_allclose(ranges, 250e3, rtol=0, atol=1e-6)
+
+    lat2, long2, azimuth2 = getDirectGeodesic(sites[0, 0], sites[0, 1],
+                                              0.0, 0.0)
+    assert lat2 == pytest.approx(sites[0, 0], abs=ABSOLUTE_TOLERANCE)
+    assert long2 == pytest.approx(sites[0, 1], abs=ABSOLUTE_TOLERANCE)
+
+
+def test_getDirectGeodesic_error():
+    with pytest.raises(ValueError):
+        getDirectGeodesic(2.0, 0.0, 0.0, 1.0)
+
+    with pytest.raises(ValueError):
+        getDirectGeodesic([0.0, 0.1], [0.0, 0.1, 0.2], 0.0, 1.0)
@@ -0,0 +1,114 @@
+"""
+# ============= UNIT TEST FOR BATCH GEODETIC CONVERSION TOOLS =========== #
+"""
+
+# MODULE IMPORT
+from dragonfly.geography import Position, PositionArray, ecef2lla, lla2ecef
+import pytest
+import numpy as np
+
+# CONSTANTS
+ABSOLUTE_TOLERANCE = 1e-12
+RELATIVE_TOLERANCE = 1e-6
+NB_OBJ = 500
+
+# from https://www.convertecef.com
+LLA4ECEF = [
+    {"ECEF": [5117118.21, -1087677.05, 3638574.7],  # meter,meter, meter
+     "LLA": [35, -12, 1234]},  # lat lon alt (deg,deg,m)
+    {"ECEF": [1193872.96, 1584322.93, -6064737.91],
+     "LLA": [-72, 53, 22135]}]
+
+
+@pytest.fixture
+def randomPositions():
+    rng = np.random.default_rng(42)
+    lat = rng.uniform(-np.pi/2, np.pi/2, NB_OBJ)
+    lon = rng.uniform(-np.pi, np.pi, NB_OBJ)
+    alt = rng.uniform(-1e4, 4e7, NB_OBJ)
+    return [Position.fromLLA(float(la), float(lo), float(al))
+            for la, lo, al in zip(lat, lon, alt)]
+
+
+def test_ecef2lla_reference():
+    ecef = np.array([pos["ECEF"] for pos in LLA4ECEF])
+    lat, lon, alt = ecef2lla(ecef)
+
+    for idx, pos in enumerate(LLA4ECEF):
+        assert np.rad2deg(lat[idx]) == pytest.approx(
+            pos["LLA"][0], abs=ABSOLUTE_TOLERANCE, rel=RELATIVE_TOLERANCE)
+        assert np.rad2deg(lon[idx]) == pytest.approx(
+            pos["LLA"][1], abs=ABSOLUTE_TOLERANCE, rel=RELATIVE_TOLERANCE)
+        assert alt[idx] == pytest.approx(
+            pos["LLA"][2], abs=ABSOLUTE_TOLERANCE, rel=RELATIVE_TOLERANCE)
+
+
+def test_ecef2lla_consistency(randomPositions):
+    """batch conversion shall be consistent with Position.toLLA"""
+    positions = PositionArray.fromPosition(randomPositions)
+    lat, lon, alt = positions.toLLA()
+
+    expected = np.array([pos.toLLA() for pos in randomPositions])
+
+    np.testing.assert_allclose(lat, expected[:, 0], rtol=0, atol=1e-14)
+    np.testing.assert_allclose(lon, expected[:, 1], rtol=0, atol=1e-14)
+    np.testing.assert_allclose(alt, expected[:, 2], rtol=0, atol=1e-6)
+
+
+def test_ecef2lla_single():
+    lat, lon, alt = ecef2lla(np.array(LLA4ECEF[0]["ECEF"]))
+    assert lat.shape == lon.shape == alt.shape == (1,)
+
+
+def test_ecef2lla_error():
+    with pytest.raises(ValueError):
+        ecef2lla(np.zeros((4, 2)))
+
+    with pytest.raises(ValueError):
+        ecef2lla(np.zeros((4, 3)), nbIter=0)
+
+    with pytest.raises(TypeError):
+        ecef2lla(np.zeros((4, 3)), nbIter=1.0)
+
+
+def test_lla2ecef_reference():
+    lla = np.array([pos["LLA"] for pos in LLA4ECEF], dtype=np.float64)
+    ecef = lla2ecef(np.deg2rad(lla[:, 0]), np.deg2rad(lla[:, 1]), lla[:, 2])
+
+    np.testing.assert_allclose(ecef, [pos["ECEF"] for pos in LLA4ECEF],
+                               atol=ABSOLUTE_TOLERANCE, rtol=RELATIVE_TOLERANCE)
+
+
+def test_lla2ecef_consistency(randomPositions):
+    """batch conversion shall be consistent with Position.fromLLA"""
+    lla = np.array([pos.toLLA() for pos in randomPositions])
+    positions = PositionArray.fromLLA(lla[:, 0], lla[:, 1], lla[:, 2])
+
+    expected = np.array([[pos.x, pos.y, pos.z] for pos in
+                         [Position.fromLLA(*data) for data in lla.tolist()]])
+
+    np.testing.assert_allclose(positions.toNumpy(), expected,
+                               rtol=0, atol=1e-8)
+
+    # round trip
+    lat, lon, alt = ecef2lla(positions)
+    np.testing.assert_allclose(lat, lla[:, 0], rtol=0, atol=1e-14)
+    np.testing.assert_allclose(alt, lla[:, 2], rtol=0, atol=1e-6)
+
+
+def test_lla2ecef_broadcast():
+    """scalar altitude shall be broadcasted against the arrays"""
+    lat = np.deg2rad([0., 90.])
+    ecef = lla2ecef(lat, 0.0)
+
+    assert ecef.shape == (2, 3)
+    np.testing.assert_allclose(ecef[0], [6378137.0, 0, 0])
+    np.testing.assert_allclose(ecef[1], [0, 0, 6356752.314245179], atol=1e-6)
+
+
+def test_lla2ecef_error():
+    with pytest.raises(ValueError):
+        lla2ecef([0, 1], [0, 1, 2])
+
+    with pytest.raises(ValueError):
+        lla2ecef("a", 0)
@@ -6,6 +6,8 @@ import pytest
 import numpy as np
 
 from dragonfly.geography import dcm_eci2ecef, dcm_ecef2ned, dcm_ecef2enu, angle2dcm, dcm2angle
+from dragonfly.geography import eci2ecef, ecef2eci
+from dragonfly.constants import EarthModel
 
 
 ABSOLUTE_TOLERANCE = 1e-12
@@ -27,6 +29,39 @@ def test_ECI2ECEF()->None:
 
     pass
 
+def test_ECI2ECEF_stack() -> None:
+    """stacked matrices and direct rotations over an array of times"""
+    times = np.linspace(0., 14 * 86400., NB_OBJ)
+    dcm = dcm_eci2ecef(times)
+    assert dcm.shape == (NB_OBJ, 3, 3)
+
+    # after a quarter of turn the ECI x-axis is the ECEF -y-axis
+    quarter = np.pi / 2 / EarthModel.earthRotationRate
+    np.testing.assert_allclose(dcm_eci2ecef(quarter) @ [1., 0., 0.],
+                               [0., -1., 0.], atol=ABSOLUTE_TOLERANCE)
+
+    for idx in range(0, NB_OBJ, 11):
+        np.testing.assert_allclose(dcm[idx], dcm_eci2ecef(times[idx]),
+                                   atol=ABSOLUTE_TOLERANCE)
+
+    positions = np.random.uniform(-4e7, 4e7, (NB_OBJ, 3))
+    ecef = eci2ecef(positions, times)
+    np.testing.assert_allclose(ecef, np.einsum("nij,nj->ni", dcm, positions),
+                               rtol=0, atol=1e-7)
+    np.testing.assert_allclose(ecef2eci(ecef, times), positions,
+                               rtol=0, atol=1e-7)
+
+    # single time for all the positions
+    np.testing.assert_allclose(eci2ecef(positions, times[3]),
+                               positions @ dcm[3].T, rtol=0, atol=1e-7)
+
+    with pytest.raises(ValueError):
+        eci2ecef(positions, times[:3])
+
+    with pytest.raises(ValueError):
+        ecef2eci(np.zeros((3, 2)), 0.)
+
+
 def test_ECEF2NED()->None:
     """Test Cases for the DCM_ECEF2NED
 
@@ -94,6 +129,40 @@ class TestECEF2ENU():
         np.testing.assert_allclose(dcm_ecef2enu(lat, lon), R_pred, atol=1e-6)  # Python test
         np.testing.assert_allclose(dcm_ecef2enu(lat, lon) @ test_vec, test_rot_vec, atol=1e-6) # checking rotations
    
+
+
+def test_ecef2enu_ned_stack():
+    """stacked matrices shall be equal to the matrices of each point"""
+    lat = np.random.uniform(-np.pi/2, np.pi/2, NB_OBJ)
+    lon = np.random.uniform(-np.pi, np.pi, NB_OBJ)
+
+    for function in (dcm_ecef2enu, dcm_ecef2ned):
+        dcm = function(lat, lon)
+        assert dcm.shape == (NB_OBJ, 3, 3)
+
+        for idx in range(NB_OBJ):
+            np.testing.assert_allclose(dcm[idx], function(lat[idx], lon[idx]),
+                                       atol=ABSOLUTE_TOLERANCE)
+
+        # orthonormal matrices
+        np.testing.assert_allclose(dcm @ np.transpose(dcm, (0, 2, 1)),
+                                   np.broadcast_to(np.eye(3), dcm.shape),
+                                   atol=ABSOLUTE_TOLERANCE)
+        np.testing.assert_allclose(np.linalg.det(dcm), 1.)
+
+    # NED is ENU with the axes swapped (N = E x U ...)
+    ned = dcm_ecef2ned(lat, lon)
+    enu = dcm_ecef2enu(lat, lon)
+    np.testing.assert_allclose(ned[:, 0], enu[:, 1], atol=ABSOLUTE_TOLERANCE)
+    np.testing.assert_allclose(ned[:, 1], enu[:, 0], atol=ABSOLUTE_TOLERANCE)
+    np.testing.assert_allclose(ned[:, 2], -enu[:, 2], atol=ABSOLUTE_TOLERANCE)
+
+    # broadcasting of a scalar longitude
+    assert dcm_ecef2enu(lat, 0.).shape == (NB_OBJ, 3, 3)
+
+    with pytest.raises(ValueError):
+        dcm_ecef2ned(lat, lon[:3])
+
     
 def test_angle2dcm_ZYX():
     """unit test for angle to dcm with ZYX order
@@ -124,9 +193,46 @@ def test_angle2dcm_ZYX():
         np.testing.assert_almost_equal(Rnav2body_expected, Rnav2body_computed, decimal=decimal)
 
 def test_angle2dcm_errorImplemented():
-    "test only ZYX feature is implemented"
-    with pytest.raises(NotImplementedError):
-        print(angle2dcm(0,0,0,"XYZ"))
+    "test only the 12 rotation sequences are implemented"
+    with pytest.raises(ValueError):
+        print(angle2dcm(0,0,0,"XXY"))
+
+    with pytest.raises(TypeError):
+        print(angle2dcm(0,0,0,123))
+
+    with pytest.raises(ValueError):
+        print(angle2dcm([0, 1],[0, 1, 2],0))
+
+
+@pytest.mark.parametrize("sequence", ["XYZ", "XZY", "YXZ", "YZX", "ZXY",
+                                      "ZYX", "XYX", "XZX", "YXY", "YZY",
+                                      "ZXZ", "ZYZ"])
+def test_angle2dcm_sequences(sequence):
+    """batch conversion for all the sequences (successive rotations of the
+    frame) and round trip with dcm2angle"""
+    angle1 = np.random.uniform(-np.pi, np.pi, NB_OBJ)
+    angle3 = np.random.uniform(-np.pi, np.pi, NB_OBJ)
+    if sequence[0] == sequence[2]:
+        angle2 = np.random.uniform(0.01, np.pi - 0.01, NB_OBJ)
+    else:
+        angle2 = np.random.uniform(-np.pi/2 + 0.01, np.pi/2 - 0.01, NB_OBJ)
+
+    dcm = angle2dcm(angle1, angle2, angle3, sequence.lower())
+    assert dcm.shape == (NB_OBJ, 3, 3)
+
+    elementary = {"X": lambda x: angle2dcm(0, 0, x, "ZYX"),
+                  "Y": lambda x: angle2dcm(0, x, 0, "ZYX"),
+                  "Z": lambda x: angle2dcm(x, 0, 0, "ZYX")}
+    for idx in range(0, NB_OBJ, 13):
+        expected = (elementary[sequence[2]](angle3[idx]) @
+                    elementary[sequence[1]](angle2[idx]) @
+                    elementary[sequence[0]](angle1[idx]))
+        np.testing.assert_allclose(dcm[idx], expected,
+                                   atol=ABSOLUTE_TOLERANCE)
+
+    angles = dcm2angle(dcm, sequence)
+    for computed, expected in zip(angles, (angle1, angle2, angle3)):
+        np.testing.assert_allclose(computed, expected, rtol=0, atol=1e-9)
             
 def test_dcm2angle_ZYX():
     """test dcm2angle with ZYX rotation
@@ -144,9 +250,12 @@ def test_dcm2angle_ZYX():
     np.testing.assert_almost_equal([yaw_C, pitch_C, roll_C], [yaw, pitch, roll], decimal=4)
 
 def test_angle2dcm_error():
-    "test only ZYX feature is implemented"
-    with pytest.raises(NotImplementedError):
-        print(dcm2angle(np.ndarray((3,3)),rotationSequence="XYZ"))
+    "test only the 12 rotation sequences are implemented"
+    with pytest.raises(ValueError):
+        print(dcm2angle(np.ndarray((3,3)),rotationSequence="XYW"))
+
+    with pytest.raises(ValueError):
+        print(dcm2angle(np.ndarray((3,2))))
 
 
 
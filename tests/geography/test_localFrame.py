@@ -0,0 +1,98 @@
+"""
+##########################  TEST LOCAL TANGENT PLANE  ########################
+"""
+
+
+# Import Module
+from dragonfly.geography import (Position, PositionArray, ecef2enu, enu2ecef,
+                                 ecef2ned, ned2ecef, dcm_ecef2enu,
+                                 dcm_ecef2ned)
+import pytest
+import numpy as np
+
+ABSOLUTE_TOLERANCE = 1e-12
+RELATIVE_TOLERANCE = 1e-6
+NB_OBJ = 200
+
+# radar station
+ORIGIN = (np.deg2rad(43.6), np.deg2rad(1.44), 150.0)
+
+
+@pytest.fixture
+def randomPositions():
+    rng = np.random.default_rng(5)
+    return PositionArray.fromLLA(
+        ORIGIN[0] + rng.uniform(-0.05, 0.05, NB_OBJ),
+        ORIGIN[1] + rng.uniform(-0.05, 0.05, NB_OBJ),
+        rng.uniform(0, 1.2e4, NB_OBJ))
+
+
+@pytest.mark.parametrize("convert, dcm", [(ecef2enu, dcm_ecef2enu),
+                                          (ecef2ned, dcm_ecef2ned)])
+def test_ecef2local(randomPositions, convert, dcm):
+    """shall be consistent with the point by point calculation"""
+    origin = Position.fromLLA(*ORIGIN)
+    expected = np.array([
+        (dcm(ORIGIN[0], ORIGIN[1]) @ (pos - origin).toNumpy()).ravel()
+        for pos in randomPositions])
+
+    local = convert(randomPositions, *ORIGIN)
+    assert local.shape == (NB_OBJ, 3)
+    np.testing.assert_allclose(local, expected, rtol=0, atol=1e-8)
+
+    # cached origin
+    np.testing.assert_array_equal(convert(randomPositions, *ORIGIN), local)
+
+
+def test_ecef2local_vertical():
+    above = PositionArray.fromLLA(ORIGIN[0], ORIGIN[1], ORIGIN[2] + 1000.)
+
+    np.testing.assert_allclose(ecef2enu(above, *ORIGIN), [[0, 0, 1000.]],
+                               atol=1e-8)
+    np.testing.assert_allclose(ecef2ned(above, *ORIGIN), [[0, 0, -1000.]],
+                               atol=1e-8)
+
+
+@pytest.mark.parametrize("convert, inverse", [(ecef2enu, enu2ecef),
+                                              (ecef2ned, ned2ecef)])
+def test_local_roundtrip(randomPositions, convert, inverse):
+    data = randomPositions.toNumpy()
+
+    local = convert(data, *ORIGIN)
+    np.testing.assert_allclose(inverse(local, *ORIGIN), data, rtol=0,
+                               atol=1e-8)
+
+    # vectors are only rotated
+    vectors = convert(data, *ORIGIN, isVector=True)
+    np.testing.assert_allclose(np.linalg.norm(vectors, axis=1),
+                               randomPositions.norm, rtol=1e-14)
+    np.testing.assert_allclose(inverse(vectors, *ORIGIN, isVector=True),
+                               data, rtol=0, atol=1e-8)
+
+
+@pytest.mark.parametrize("convert, inverse, dcm",
+                         [(ecef2enu, enu2ecef, dcm_ecef2enu),
+                          (ecef2ned, ned2ecef, dcm_ecef2ned)])
+def test_local_originPerPoint(randomPositions, convert, inverse, dcm):
+    rng = np.random.default_rng(6)
+    latitude = rng.uniform(-np.pi/2, np.pi/2, NB_OBJ)
+    longitude = rng.uniform(-np.pi, np.pi, NB_OBJ)
+
+    local = convert(randomPositions, latitude, longitude, 10.)
+    for idx in range(0, NB_OBJ, 17):
+        np.testing.assert_allclose(
+            local[idx], convert(randomPositions[idx:idx + 1], latitude[idx],
+                                longitude[idx], 10.)[0],
+            rtol=0, atol=1e-8)
+
+    np.testing.assert_allclose(
+        inverse(local, latitude, longitude, 10.), randomPositions.toNumpy(),
+        rtol=0, atol=1e-8)
+
+
+def test_local_error(randomPositions):
+    with pytest.raises(ValueError):
+        ecef2enu(np.zeros((4, 2)), *ORIGIN)
+
+    with pytest.raises(ValueError):
+        ecef2ned(randomPositions, [0.1, 0.2], [0.1, 0.2, 0.3])
@@ -0,0 +1,103 @@
+"""
+##########################  TEST POLYLINE DENSIFICATION  #####################
+"""
+
+
+# Import Module
+from dragonfly.geography import densifyPolyline, getInverseGeodesic
+import pytest
+import numpy as np
+
+ABSOLUTE_TOLERANCE = 1e-12
+RELATIVE_TOLERANCE = 1e-6
+
+# Paris, New York (twice), Tokyo, Sydney
+WAYPOINTS = np.deg2rad([[48.8, 2.3], [40.6, -73.8], [40.6, -73.8],
+                        [35.5, 139.7], [-33.9, 151.2]])
+
+
+def test_densifyPolyline_spacing():
+    chunks = list(densifyPolyline(WAYPOINTS, spacing=5e3, chunkSize=1000))
+    assert all(chunk.shape == (1000, 2) for chunk in chunks[:-1])
+    assert 0 < chunks[-1].shape[0] <= 1000
+
+    points = np.concatenate(chunks)
+    distance, _, _ = getInverseGeodesic(points[:-1, 0], points[:-1, 1],
+                                        points[1:, 0], points[1:, 1])
+    assert np.all(distance <= 5e3 + 1e-6)
+    assert np.all(distance > 0)
+
+    # the legs are split in equal segments
+    legs, _, _ = getInverseGeodesic(WAYPOINTS[:-1, 0], WAYPOINTS[:-1, 1],
+                                    WAYPOINTS[1:, 0], WAYPOINTS[1:, 1])
+    assert points.shape[0] == np.sum(np.ceil(legs / 5e3)) + 1
+    assert np.sum(distance) == pytest.approx(np.sum(legs), rel=1e-9)
+
+    # the waypoints are part of the path
+    np.testing.assert_array_equal(points[0], WAYPOINTS[0])
+    np.testing.assert_array_equal(points[-1], WAYPOINTS[-1])
+
+
+def test_densifyPolyline_streaming():
+    """waypoints read from a generator by blocks shall give the same
+    path"""
+    expected = np.concatenate(list(densifyPolyline(WAYPOINTS, spacing=2e4)))
+    points = np.concatenate(list(densifyPolyline(
+        (point for point in WAYPOINTS.tolist()), spacing=2e4, chunkSize=7)))
+
+    np.testing.assert_allclose(points, expected, rtol=0,
+                               atol=ABSOLUTE_TOLERANCE)
+
+
+def test_densifyPolyline_chordError():
+    points = np.concatenate(list(densifyPolyline(WAYPOINTS[:2],
+                                                 maxChordError=1.0)))
+    distance, _, _ = getInverseGeodesic(points[:-1, 0], points[:-1, 1],
+                                        points[1:, 0], points[1:, 1])
+
+    # sagitta with the mean radius of the Earth
+    assert np.max(distance**2 / (8 * 6371e3)) < 1.0
+
+    # the smallest step is used
+    coarse = np.concatenate(list(densifyPolyline(
+        WAYPOINTS[:2], spacing=1e6, maxChordError=1.0)))
+    assert coarse.shape == points.shape
+
+
+def test_densifyPolyline_single():
+    chunks = list(densifyPolyline(WAYPOINTS[:1], spacing=1.0))
+    assert len(chunks) == 1
+    np.testing.assert_array_equal(chunks[0], WAYPOINTS[:1])
+
+    assert list(densifyPolyline([], spacing=1.0)) == []
+
+
+def test_densifyPolyline_numpyScalars():
+    """numpy scalars are accepted as spacing, maxChordError and
+    chunkSize"""
+    expected = np.concatenate(list(densifyPolyline(
+        WAYPOINTS, spacing=2e4, maxChordError=10, chunkSize=100)))
+    points = np.concatenate(list(densifyPolyline(
+        WAYPOINTS, spacing=np.float64(2e4), maxChordError=np.int64(10),
+        chunkSize=np.int64(100))))
+    np.testing.assert_array_equal(points, expected)
+
+
+def test_densifyPolyline_error():
+    with pytest.raises(ValueError):
+        next(densifyPolyline(WAYPOINTS))
+
+    with pytest.raises(ValueError):
+        next(densifyPolyline(WAYPOINTS, spacing=-1.0))
+
+    with pytest.raises(TypeError):
+        next(densifyPolyline(WAYPOINTS, spacing=1.0, chunkSize=10.0))
+
+    with pytest.raises(TypeError):
+        next(densifyPolyline(WAYPOINTS, spacing="1.0"))
+
+    with pytest.raises(ValueError):
+        next(densifyPolyline(np.zeros((4, 3)), spacing=1.0))
+
+    with pytest.raises(ValueError):
+        next(densifyPolyline([[2.0, 0.0], [0.0, 0.0]], spacing=1.0))
@@ -0,0 +1,140 @@
+"""
+######################  TEST BATCH DISTANCE CALCULATOR  ######################
+"""
+
+
+# Import Module
+from dragonfly.geography import getRange, getRanges, getRangeMatrix
+import pytest
+import numpy as np
+
+ABSOLUTE_TOLERANCE = 1e-12
+RELATIVE_TOLERANCE = 1e-6
+NB_OBJ = 200
+
+VALUE2TEST = [
+    [(0.0, 0.0), (0.0, 0.0), 0],
+    [(0.0, 0.0), (0.0, 1.0), 111.319491*1000],
+    [(0.0, 0.0), (1.0, 0.0), 110.574389*1000],
+    [(0.0, 0.0), (0.5, 179.5), 19936.288579*1000]
+]
+
+
+def test_getRanges_reference():
+    data = np.deg2rad(np.array([[*p1, *p2] for p1, p2, _ in VALUE2TEST]))
+    expected = [sample[2] for sample in VALUE2TEST]
+
+    ranges, notConverged = getRanges(data[:, 0], data[:, 1],
+                                     data[:, 2], data[:, 3], nbIter=400)
+
+    assert not np.any(notConverged)
+    np.testing.assert_allclose(ranges, expected, rtol=RELATIVE_TOLERANCE,
+                               atol=ABSOLUTE_TOLERANCE)
+
+
+def test_getRanges_consistency():
+    """batch ranges shall be identical to the scalar getRange"""
+    rng = np.random.default_rng(0)
+    lat1 = rng.uniform(-np.pi/2, np.pi/2, NB_OBJ)
+    long1 = rng.uniform(-np.pi, np.pi, NB_OBJ)
+    lat2 = rng.uniform(-np.pi/2, np.pi/2, NB_OBJ)
+    long2 = rng.uniform(-np.pi, np.pi, NB_OBJ)
+
+    ranges, notConverged = getRanges(lat1, long1, lat2, long2)
+
+    for idx in range(NB_OBJ):
+        expected = getRange(lat1[idx], long1[idx], lat2[idx], long2[idx])
+        if expected is None:
+            assert notConverged[idx]
+            assert np.isnan(ranges[idx])
+        else:
+            assert not notConverged[idx]
+            assert ranges[idx] == pytest.approx(expected, abs=1e-3, rel=0)
+
+
+def test_getRanges_notConverged():
+    """near antipodal points shall be flagged as not converged"""
+    ranges, notConverged = getRanges(
+        np.array([0.0, 0.0]), 0.0,
+        np.array([0.5, np.deg2rad(0.5)]), np.array([1.0, np.pi - 1e-3]))
+
+    np.testing.assert_array_equal(notConverged, [False, True])
+    assert np.isnan(ranges[1])
+    assert ranges[0] > 0
+
+
+def test_getRanges_broadcast():
+    lat = np.deg2rad(np.array([0.0, 10.0, 20.0]))
+    ranges, notConverged = getRanges(lat[:, None], 0.0, lat[None, :], 0.0)
+
+    assert ranges.shape == notConverged.shape == (3, 3)
+    np.testing.assert_allclose(np.diag(ranges), 0.0)
+    np.testing.assert_allclose(ranges, ranges.T)
+
+
+def test_getRanges_error():
+    with pytest.raises(ValueError):
+        getRanges([0.0, 2.0], 0.0, 0.0, 0.0)
+
+
+# ------------------------------ RANGE MATRIX ------------------------------
+
+@pytest.fixture
+def stations():
+    rng = np.random.default_rng(3)
+    pointsA = np.column_stack([rng.uniform(-1.4, 1.4, 23),
+                               rng.uniform(-3, 3, 23)])
+    pointsB = np.column_stack([rng.uniform(-1.4, 1.4, 17),
+                               rng.uniform(-3, 3, 17)])
+    return pointsA, pointsB
+
+
+def test_getRangeMatrix(stations):
+    pointsA, pointsB = stations
+    expected, _ = getRanges(pointsA[:, 0:1], pointsA[:, 1:2],
+                            pointsB[:, 0], pointsB[:, 1])
+
+    matrix = getRangeMatrix(pointsA, pointsB, tileSize=5)
+
+    assert matrix.shape == (23, 17)
+    np.testing.assert_array_equal(matrix, expected)
+
+
+def test_getRangeMatrix_pool(stations):
+    pointsA, pointsB = stations
+    expected = getRangeMatrix(pointsA, pointsB)
+
+    matrix = getRangeMatrix(pointsA, pointsB, tileSize=4, nbWorkers=2)
+    np.testing.assert_array_equal(matrix, expected)
+
+
+def test_getRangeMatrix_output(stations, tmp_path):
+    pointsA, pointsB = stations
+    expected = getRangeMatrix(pointsA, pointsB)
+
+    # caller provided array
+    out = np.zeros((23, 17))
+    matrix = getRangeMatrix(pointsA, pointsB, tileSize=7, out=out)
+    assert matrix is out
+    np.testing.assert_array_equal(out, expected)
+
+    # memory mapped file
+    path = tmp_path / "ranges.npy"
+    getRangeMatrix(pointsA, pointsB, tileSize=7, outPath=path)
+    np.testing.assert_array_equal(np.load(path, mmap_mode="r"), expected)
+
+
+def test_getRangeMatrix_error(stations):
+    pointsA, pointsB = stations
+
+    with pytest.raises(ValueError):
+        getRangeMatrix(pointsA[:, 0], pointsB)
+
+    with pytest.raises(ValueError):
+        getRangeMatrix(pointsA, pointsB, out=np.zeros((2, 2)))
+
+    with pytest.raises(ValueError):
+        getRangeMatrix(pointsA, pointsB, tileSize=0)
+
+    with pytest.raises(ValueError):
+        getRangeMatrix([[2.0, 0.0]], pointsB)
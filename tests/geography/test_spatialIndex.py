@@ -0,0 +1,119 @@
+"""
+##########################  TEST SPATIAL INDEX  ##############################
+"""
+
+
+# Import Module
+from dragonfly.geography import (SpatialIndex, Position, PositionArray,
+                                 getInverseGeodesic)
+import pytest
+import numpy as np
+
+ABSOLUTE_TOLERANCE = 1e-12
+RELATIVE_TOLERANCE = 1e-6
+NB_OBJ = 5000
+
+
+@pytest.fixture
+def randomPoints():
+    rng = np.random.default_rng(7)
+    lat = np.arcsin(rng.uniform(-1, 1, NB_OBJ))
+    lon = rng.uniform(-np.pi, np.pi, NB_OBJ)
+    return lat, lon
+
+
+@pytest.mark.parametrize("point", [(0.7, 0.1), (-1.5, 3.1), (0.0, -np.pi),
+                                   (np.pi/2, 0.0)])
+@pytest.mark.parametrize("radius", [10e3, 500e3, 3000e3])
+def test_queryRadius(randomPoints, point, radius):
+    lat, lon = randomPoints
+    index = SpatialIndex(lat, lon)
+
+    ranges, _, _ = getInverseGeodesic(point[0], point[1], lat, lon)
+    expected = np.flatnonzero(ranges <= radius)
+
+    np.testing.assert_array_equal(index.queryRadius(*point, radius),
+                                  expected)
+
+    found, foundRanges = index.queryRadius(*point, radius,
+                                           returnRanges=True)
+    np.testing.assert_array_equal(np.sort(found), expected)
+    np.testing.assert_allclose(foundRanges, ranges[found],
+                               rtol=0, atol=ABSOLUTE_TOLERANCE)
+    assert np.all(np.diff(foundRanges) >= 0)
+
+
+def test_queryRadius_antipodal():
+    """radius above pi R: the chords of near antipodal positions exceed
+    2R and the exact ranges shall be checked"""
+    rng = np.random.default_rng(8)
+    lat = rng.uniform(-0.02, 0.02, NB_OBJ)
+    lon = np.pi + rng.uniform(-0.02, 0.02, NB_OBJ)
+    index = SpatialIndex(lat, lon)
+
+    ranges, _, _ = getInverseGeodesic(0.0, 0.0, lat, lon)
+    for radius in (19.95e6, 19.99e6, 20.1e6):
+        expected = np.flatnonzero(ranges <= radius)
+        np.testing.assert_array_equal(index.queryRadius(0.0, 0.0, radius),
+                                      expected)
+    assert 0 < np.sum(ranges <= 19.95e6) < NB_OBJ
+
+
+@pytest.mark.parametrize("point", [(0.7, 0.1), (-1.5, 3.1), (0.0, -np.pi)])
+@pytest.mark.parametrize("k", [1, 7, 50])
+def test_queryNearest(randomPoints, point, k):
+    lat, lon = randomPoints
+    index = SpatialIndex(lat, lon)
+
+    ranges, _, _ = getInverseGeodesic(point[0], point[1], lat, lon)
+
+    found, foundRanges = index.queryNearest(*point, k=k)
+    np.testing.assert_array_equal(found, np.argsort(ranges)[:k])
+    np.testing.assert_allclose(foundRanges, np.sort(ranges)[:k],
+                               rtol=0, atol=ABSOLUTE_TOLERANCE)
+
+
+def test_queryNearest_all():
+    index = SpatialIndex([0.0, 0.1], [0.0, 0.1])
+    found, ranges = index.queryNearest(0.0, 0.0, k=10)
+    np.testing.assert_array_equal(found, [0, 1])
+    assert ranges[0] == 0.0
+
+
+def test_fromPositions(randomPoints):
+    lat, lon = randomPoints
+    positions = PositionArray.fromLLA(lat[:100], lon[:100], 1e4)
+
+    index = SpatialIndex.fromPositions(positions)
+    assert len(index) == 100
+    np.testing.assert_allclose(index.latitudes, lat[:100], rtol=0,
+                               atol=1e-14)
+
+    index = SpatialIndex.fromPositions(
+        [Position.fromLLA(float(la), float(lo), 0.)
+         for la, lo in zip(lat[:10], lon[:10])])
+    assert len(index) == 10
+    np.testing.assert_allclose(index.longitudes, lon[:10], rtol=0,
+                               atol=1e-14)
+
+
+def test_SpatialIndex_error():
+    with pytest.raises(ValueError):
+        SpatialIndex([0.0, 0.1], [0.0])
+
+    with pytest.raises(ValueError):
+        SpatialIndex([2.0], [0.0])
+
+    index = SpatialIndex([0.0], [0.0])
+    with pytest.raises(ValueError):
+        index.queryRadius(2.0, 0.0, 1.0)
+
+    with pytest.raises(ValueError):
+        index.queryNearest(0.0, 0.0, k=0)
+
+    with pytest.raises(TypeError):
+        index.queryNearest(0.0, 0.0, k=1.0)
+
+    # numpy integers are accepted
+    nearest, _ = index.queryNearest(0.0, 0.0, k=np.int64(1))
+    np.testing.assert_array_equal(nearest, [0])
@@ -0,0 +1,89 @@
+"""
+##########################  TEST GRAVITY GRID  ###############################
+"""
+
+
+# Import Module
+from dragonfly.gravity import GravityGrid, SphericalHarmonicModel, getGravity
+import functools
+import pytest
+import numpy as np
+
+ABSOLUTE_TOLERANCE = 1e-12
+RELATIVE_TOLERANCE = 1e-6
+NB_OBJ = 5000
+
+RADIUS_BOUNDS = (6.35e6, 6.45e6)
+
+
+@pytest.fixture
+def randomPositions():
+    rng = np.random.default_rng(31)
+    lat = np.arcsin(rng.uniform(-1, 1, NB_OBJ))
+    lon = rng.uniform(-np.pi, np.pi, NB_OBJ)
+    r = rng.uniform(*RADIUS_BOUNDS, NB_OBJ)
+    return np.stack((r * np.cos(lat) * np.cos(lon),
+                     r * np.cos(lat) * np.sin(lon),
+                     r * np.sin(lat)), axis=-1)
+
+
+@pytest.fixture(scope="module")
+def zonalGrid():
+    return GravityGrid.fromModel(RADIUS_BOUNDS, (91, 180, 3),
+                                 model=functools.partial(getGravity,
+                                                         degree=6))
+
+
+def test_fromModel(zonalGrid, randomPositions):
+    assert zonalGrid.shape == (91, 180, 3)
+    assert 0 < zonalGrid.maxError < 1e-4
+
+    error = zonalGrid.getGravity(randomPositions) - \
+        getGravity(randomPositions, degree=6)
+    # upper bound of the error, not too pessimistic
+    error = np.max(np.linalg.norm(error, axis=1))
+    assert 0.5 * zonalGrid.maxError < error <= zonalGrid.maxError
+
+
+def test_nodes():
+    """exact at the nodes, including the poles and the anti-meridian"""
+    model = SphericalHarmonicModel.fromEarthModel()
+    grid = GravityGrid.fromModel(RADIUS_BOUNDS, (5, 8, 2),
+                                 model=model.getGravity)
+
+    lat, lon, r = np.meshgrid(np.linspace(-np.pi/2, np.pi/2, 5),
+                              np.linspace(-np.pi, np.pi, 9), RADIUS_BOUNDS,
+                              indexing="ij")
+    lat, lon, r = lat.ravel(), lon.ravel(), r.ravel()
+    positions = np.stack((r * np.cos(lat) * np.cos(lon),
+                          r * np.cos(lat) * np.sin(lon),
+                          r * np.sin(lat)), axis=-1)
+    np.testing.assert_allclose(grid.getGravity(positions),
+                               model.getGravity(positions), rtol=0,
+                               atol=1e-12)
+
+
+def test_save(zonalGrid, randomPositions, tmp_path):
+    filepath = str(tmp_path / "grid.npz")
+    zonalGrid.save(filepath)
+    grid = GravityGrid.fromFile(filepath)
+
+    assert grid.shape == zonalGrid.shape
+    assert grid.maxError == zonalGrid.maxError
+    assert grid.radiusBounds == RADIUS_BOUNDS
+    np.testing.assert_array_equal(grid.getGravity(randomPositions),
+                                  zonalGrid.getGravity(randomPositions))
+
+
+def test_error(zonalGrid):
+    with pytest.raises(ValueError):
+        zonalGrid.getGravity([[7e6, 0., 0.]])
+
+    with pytest.raises(ValueError):
+        GravityGrid.fromModel((6.45e6, 6.35e6))
+
+    with pytest.raises(TypeError):
+        GravityGrid.fromModel(RADIUS_BOUNDS, model="WGS84")
+
+    with pytest.raises(ValueError):
+        GravityGrid(np.zeros((1, 4, 2, 3)), (-1, 1), RADIUS_BOUNDS)
@@ -0,0 +1,153 @@
+"""
+##################  TEST SPHERICAL HARMONIC GRAVITY MODEL  ###################
+"""
+
+
+# Import Module
+from dragonfly.gravity import SphericalHarmonicModel, getGravity
+from dragonfly.constants import EarthModel
+from scipy.special import lpmv, gammaln
+import pytest
+import numpy as np
+import mmap
+
+ABSOLUTE_TOLERANCE = 1e-12
+RELATIVE_TOLERANCE = 1e-6
+NB_OBJ = 200
+DEGREE = 8
+
+
+@pytest.fixture
+def randomPositions():
+    rng = np.random.default_rng(21)
+    positions = rng.normal(size=(NB_OBJ, 3))
+    positions *= (rng.uniform(6.4e6, 4.2e7, NB_OBJ)
+                  / np.linalg.norm(positions, axis=1))[:, np.newaxis]
+    return positions
+
+
+@pytest.fixture
+def randomModel():
+    rng = np.random.default_rng(22)
+    coefficients = 1e-6 * rng.normal(size=(2, DEGREE + 1, DEGREE + 1))
+    coefficients = np.tril(coefficients)
+    coefficients[:, :2] = 0.
+    coefficients[1, :, 0] = 0.
+    coefficients[0, 0, 0] = 1.
+    return SphericalHarmonicModel(coefficients)
+
+
+def _potential(model, position):
+    """reference potential with scipy associated Legendre functions"""
+    r = np.linalg.norm(position)
+    u = position[2] / r
+    longitude = np.arctan2(position[1], position[0])
+    C, S = model.coefficients
+
+    total = 0.
+    for n in range(model.maxDegree + 1):
+        for m in range(n + 1):
+            norm = np.sqrt((2 - (m == 0)) * (2 * n + 1)
+                           * np.exp(gammaln(n - m + 1) - gammaln(n + m + 1)))
+            legendre = (-1)**m * norm * lpmv(m, n, u)
+            total += (model.radius / r)**n * legendre * (
+                C[n, m] * np.cos(m * longitude) +
+                S[n, m] * np.sin(m * longitude))
+    return model.mu / r * total
+
+
+def test_fromEarthModel(randomPositions):
+    """shall be consistent with the zonal model"""
+    model = SphericalHarmonicModel.fromEarthModel()
+    assert model.maxDegree == EarthModel().maxDegree
+
+    for degree in range(1, model.maxDegree + 1):
+        np.testing.assert_allclose(
+            model.getGravity(randomPositions, degree),
+            getGravity(randomPositions, degree=degree),
+            rtol=0, atol=ABSOLUTE_TOLERANCE)
+
+    # point mass
+    r = np.linalg.norm(randomPositions, axis=1)[:, np.newaxis]
+    np.testing.assert_allclose(model.getGravity(randomPositions, 0),
+                               -model.mu / r**3 * randomPositions,
+                               rtol=1e-14)
+
+
+def test_getGravity_tesseral(randomModel, randomPositions):
+    """the gravity shall be the gradient of the potential"""
+    gravity = randomModel.getGravity(randomPositions)
+    assert gravity.shape == (NB_OBJ, 3)
+
+    for idx in range(0, NB_OBJ, 20):
+        position = randomPositions[idx]
+        gradient = [(_potential(randomModel, position + delta) -
+                     _potential(randomModel, position - delta)) / 2
+                    for delta in np.eye(3)]
+        np.testing.assert_allclose(gravity[idx], gradient, rtol=0,
+                                   atol=1e-7)
+
+
+def test_getGravity_truncation(randomModel, randomPositions):
+    coefficients = randomModel.coefficients.copy()
+    coefficients[:, 6:] = 0.
+    coefficients[:, :, 3:] = 0.
+    truncated = SphericalHarmonicModel(coefficients)
+
+    np.testing.assert_allclose(randomModel.getGravity(randomPositions, 5, 2),
+                               truncated.getGravity(randomPositions),
+                               rtol=0, atol=ABSOLUTE_TOLERANCE)
+
+    # independent of the chunks
+    np.testing.assert_array_equal(
+        randomModel.getGravity(randomPositions, chunkSize=7),
+        randomModel.getGravity(randomPositions))
+    np.testing.assert_array_equal(
+        randomModel.getGravity(randomPositions, chunkSize=np.int64(7)),
+        randomModel.getGravity(randomPositions, chunkSize=7))
+
+    for chunkSize in (0, -1):
+        with pytest.raises(ValueError):
+            randomModel.getGravity(randomPositions, chunkSize=chunkSize)
+
+    with pytest.raises(ValueError):
+        randomModel.getGravity(randomPositions, DEGREE + 1)
+
+    with pytest.raises(ValueError):
+        randomModel.getGravity(randomPositions, 4, 5)
+
+    with pytest.raises(TypeError):
+        randomModel.getGravity(randomPositions, 4.)
+
+
+def test_files(randomModel, randomPositions, tmp_path):
+    filepath = str(tmp_path / "model.npy")
+    randomModel.save(filepath)
+
+    model = SphericalHarmonicModel.fromFile(filepath, randomModel.mu,
+                                            randomModel.radius)
+    base = model.coefficients
+    while isinstance(base, np.ndarray):
+        base = base.base
+    assert isinstance(base, mmap.mmap)      # not loaded in memory
+    np.testing.assert_array_equal(model.getGravity(randomPositions),
+                                  randomModel.getGravity(randomPositions))
+
+    # text table (ICGEM like)
+    C, S = randomModel.coefficients
+    textpath = tmp_path / "model.gfc"
+    with open(textpath, "w", encoding="utf-8") as file:
+        file.write("key L M C S sigmaC sigmaS\nend_of_head\n")
+        for n in range(DEGREE + 1):
+            for m in range(n + 1):
+                file.write(f"gfc {n} {m} {C[n, m]:.17e} {S[n, m]:.17e} "
+                           "0.0 0.0\n".replace("e", "D"))
+
+    model = SphericalHarmonicModel.fromText(str(textpath), maxDegree=4)
+    assert model.maxDegree == 4
+    np.testing.assert_allclose(model.getGravity(randomPositions),
+                               randomModel.getGravity(randomPositions, 4),
+                               rtol=0, atol=ABSOLUTE_TOLERANCE)
+
+    with pytest.raises(ValueError):
+        SphericalHarmonicModel(np.zeros((2, 3, 4)))
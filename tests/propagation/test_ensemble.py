@@ -0,0 +1,103 @@
+"""
+########################  TEST ENSEMBLE PROPAGATION  #########################
+"""
+
+
+# Import Module
+from dragonfly.propagation import (PointMassDynamics, propagateEnsemble,
+                                   propagateRK4)
+import pytest
+import numpy as np
+
+ABSOLUTE_TOLERANCE = 1e-12
+RELATIVE_TOLERANCE = 1e-6
+NB_OBJ = 300
+
+RADIUS = 6.4e6
+
+
+def _belowRadius(t, states):
+    return np.linalg.norm(states[:, :3], axis=1) < RADIUS
+
+
+@pytest.fixture
+def randomStates():
+    """dispersed launches from 100 km, most of them fall back"""
+    rng = np.random.default_rng(51)
+    states = np.zeros((NB_OBJ, 6))
+    states[:, 0] = RADIUS + 1e5
+    states[:, 4] = rng.uniform(2e3, 8e3, NB_OBJ)
+    states[:, 5] = rng.uniform(-5e2, 5e2, NB_OBJ)
+    return states
+
+
+def test_lockstep(randomStates):
+    """without termination: same as the propagation of the whole array"""
+    dynamics = PointMassDynamics(degree=6)
+    ensemble = propagateEnsemble(dynamics, randomStates, 0., 600., 7.)
+    expected = propagateRK4(dynamics, randomStates, 0., 600., 7.)
+
+    assert len(ensemble) == NB_OBJ
+    assert not np.any(ensemble.terminated)
+    np.testing.assert_array_equal(ensemble.times, expected.times)
+    np.testing.assert_allclose(ensemble.states, expected.states,
+                               rtol=1e-14)
+    np.testing.assert_allclose(ensemble.finalStates, expected.states[-1],
+                               rtol=1e-14)
+
+
+def test_termination(randomStates):
+    dynamics = PointMassDynamics()
+    ensemble = propagateEnsemble(dynamics, randomStates, 0., 3000., 5.,
+                                 terminate=_belowRadius)
+    terminated = ensemble.terminated
+    assert 0 < np.sum(terminated) < NB_OBJ
+
+    # on the surface at the termination time
+    np.testing.assert_allclose(
+        np.linalg.norm(ensemble.finalStates[terminated, :3], axis=1),
+        RADIUS, rtol=0, atol=1e-2)
+
+    # nan after the termination
+    for idx in np.flatnonzero(terminated)[:10]:
+        after = ensemble.times > ensemble.terminationTimes[idx]
+        assert np.all(np.isnan(ensemble.states[after, idx]))
+        assert not np.any(np.isnan(ensemble.states[~after, idx]))
+
+    # independent of the other members
+    for idx in (0, 1, NB_OBJ - 1):
+        single = propagateEnsemble(dynamics, randomStates[idx:idx + 1], 0.,
+                                   3000., 5., terminate=_belowRadius)
+        np.testing.assert_allclose(single.finalStates[0],
+                                   ensemble.finalStates[idx], rtol=1e-12)
+        np.testing.assert_equal(single.terminationTimes[0],
+                                ensemble.terminationTimes[idx])
+
+    # without storage of the steps
+    light = propagateEnsemble(dynamics, randomStates, 0., 3000., 5.,
+                              terminate=_belowRadius, storeSteps=False)
+    assert light.states is None
+    np.testing.assert_array_equal(light.finalStates, ensemble.finalStates)
+
+
+def test_terminatedAtStart(randomStates):
+    randomStates[:10, 0] = RADIUS - 1.
+    ensemble = propagateEnsemble(PointMassDynamics(), randomStates, 0.,
+                                 100., 10., terminate=_belowRadius)
+
+    np.testing.assert_array_equal(ensemble.terminationTimes[:10], 0.)
+    np.testing.assert_array_equal(ensemble.finalStates[:10],
+                                  randomStates[:10])
+
+
+def test_error(randomStates):
+    with pytest.raises(ValueError):
+        propagateEnsemble(PointMassDynamics(), randomStates[0], 0., 10., 1.)
+
+    with pytest.raises(ValueError):
+        propagateEnsemble(PointMassDynamics(), randomStates, 0., 10., 0.)
+
+    for timeTolerance in (0., -1e-6, np.nan):
+        with pytest.raises(ValueError):
+            propagateEnsemble(PointMassDynamics(), randomStates, 0., 10., 1.,
+                              timeTolerance=timeTolerance)
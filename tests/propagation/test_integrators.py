@@ -0,0 +1,122 @@
+"""
+########################  TEST RUNGE-KUTTA INTEGRATORS  ######################
+"""
+
+
+# Import Module
+from dragonfly.propagation import (PointMassDynamics, Trajectory,
+                                   propagateRK4, propagateDOPRI5)
+from dragonfly.constants import EarthModel
+from dragonfly.geography import eci2ecef
+import pytest
+import numpy as np
+
+ABSOLUTE_TOLERANCE = 1e-12
+RELATIVE_TOLERANCE = 1e-6
+NB_OBJ = 50
+
+# circular orbit of 7000 km (inclination 0.5 rad)
+RADIUS = 7e6
+SPEED = np.sqrt(EarthModel.mu / RADIUS)
+PERIOD = 2 * np.pi * np.sqrt(RADIUS**3 / EarthModel.mu)
+STATE = np.array([RADIUS, 0., 0., 0., SPEED * np.cos(0.5),
+                  SPEED * np.sin(0.5)])
+
+
+def _circularOrbit(t):
+    """analytic position of the circular orbit"""
+    angle = 2 * np.pi * np.asarray(t) / PERIOD
+    return RADIUS * np.stack((np.cos(angle), np.sin(angle) * np.cos(0.5),
+                              np.sin(angle) * np.sin(0.5)), axis=-1)
+
+
+@pytest.mark.parametrize("propagate, options, tolerance",
+                         [(propagateRK4, {"step": 10.}, 5e-2),
+                          (propagateDOPRI5, {}, 1e-2)])
+def test_keplerOrbit(propagate, options, tolerance):
+    trajectory = propagate(PointMassDynamics(degree=1), STATE, 0., PERIOD,
+                           **options)
+    assert isinstance(trajectory, Trajectory)
+    assert trajectory.times[0] == 0. and trajectory.times[-1] == PERIOD
+
+    np.testing.assert_allclose(trajectory.states[:, :3],
+                               _circularOrbit(trajectory.times), rtol=0,
+                               atol=tolerance)
+
+    # dense output
+    times = np.linspace(0., PERIOD, 777)
+    np.testing.assert_allclose(trajectory(times)[:, :3],
+                               _circularOrbit(times), rtol=0,
+                               atol=tolerance)
+    np.testing.assert_array_equal(trajectory(trajectory.times),
+                                  trajectory.states)
+
+
+def test_frames():
+    """the same J2 trajectory propagated in the ECI and in the ECEF
+    frames"""
+    omega = EarthModel.earthRotationRate
+    stateECEF = STATE.copy()
+    stateECEF[3:] -= np.cross([0., 0., omega], STATE[:3])
+
+    duration = 3 * PERIOD
+    inertial = propagateDOPRI5(PointMassDynamics("ECI"), STATE, 0.,
+                               duration)
+    fixed = propagateDOPRI5(PointMassDynamics("ECEF"), stateECEF, 0.,
+                            duration)
+
+    times = np.linspace(0., duration, 50)
+    np.testing.assert_allclose(eci2ecef(inertial(times)[:, :3], times),
+                               fixed(times)[:, :3], rtol=0, atol=0.1)
+
+    # the J2 perturbation is visible
+    assert np.max(np.abs(inertial(times)[:, :3] - _circularOrbit(times))) \
+        > 1e3
+
+
+def test_ensemble():
+    rng = np.random.default_rng(41)
+    states = STATE + rng.normal(0., [1e3] * 3 + [1.] * 3, (NB_OBJ, 6))
+    dynamics = PointMassDynamics(degree=6)
+
+    ensemble = propagateRK4(dynamics, states, 0., 1000., 20.)
+    assert ensemble.states.shape == (51, NB_OBJ, 6)
+    for idx in (0, 17, NB_OBJ - 1):
+        single = propagateRK4(dynamics, states[idx], 0., 1000., 20.)
+        np.testing.assert_allclose(ensemble.states[:, idx], single.states,
+                                   rtol=1e-14)
+
+
+def test_error():
+    dynamics = PointMassDynamics()
+    with pytest.raises(ValueError):
+        propagateRK4(dynamics, STATE, 10., 0., 1.)
+
+    with pytest.raises(ValueError):
+        propagateRK4(dynamics, STATE, 0., 10., -1.)
+
+    with pytest.raises(ValueError):
+        dynamics(0., np.zeros(4))
+
+    with pytest.raises(ValueError):
+        PointMassDynamics("NED")
+
+    with pytest.raises(ValueError):
+        PointMassDynamics(degree=9)
+
+    for options in ({"firstStep": 0.}, {"firstStep": -10.},
+                    {"maxStep": 0.}, {"rtol": 0., "atol": 0.},
+                    {"atol": -1.}, {"rtol": np.nan}):
+        with pytest.raises(ValueError):
+            propagateDOPRI5(dynamics, STATE, 0., PERIOD, **options)
+
+    with pytest.raises(RuntimeError):
+        propagateDOPRI5(dynamics, STATE, 0., PERIOD, maxSteps=10)
+
+    # non finite derivatives (nan error estimation)
+    with pytest.raises(RuntimeError):
+        propagateDOPRI5(lambda t, y: y * np.nan, STATE, 0., PERIOD)
+
+    trajectory = propagateRK4(dynamics, STATE, 0., 100., 10.)
+    with pytest.raises(ValueError):
+        trajectory(101.)
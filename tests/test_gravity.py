@@ -3,8 +3,11 @@
 
 # MODULE IMPORT
 from dragonfly.geography import Position
-from dragonfly.gravity import Gravity
+from dragonfly.gravity import Gravity, getGravity, getGravityGradient
+from dragonfly.constants import EarthModel
+from dragonfly.geography import PositionArray
 import numpy as np
+import pytest
 
 
 
@@ -50,3 +53,128 @@ def test_NorthPole_WGS84():
 
     g_np = Gravity.fromLLA(np.deg2rad(90),0,0).toNumpy()
     np.testing.assert_array_almost_equal(g_np,g_expected_np )
+
+
+
+def test_getGravity_batch():
+    """batch evaluation shall match the J2 formula for each position"""
+    rng = np.random.default_rng(3)
+    positions = PositionArray.fromLLA(rng.uniform(-np.pi/2, np.pi/2, 200),
+                                      rng.uniform(-np.pi, np.pi, 200),
+                                      rng.uniform(-1e3, 4e7, 200))
+    g = getGravity(positions)
+    assert g.shape == (200, 3)
+
+    earth = EarthModel()
+    for idx, (x, y, z) in enumerate(positions.toNumpy()):
+        r = np.sqrt(x**2 + y**2 + z**2)
+        k = 3/2*earth.j2*(earth.a/r)**2
+        expected = [
+            -earth.mu/r**2*(1+k*(1-5*(z/r)**2))*x/r,
+            -earth.mu/r**2*(1+k*(1-5*(z/r)**2))*y/r,
+            -earth.mu/r**2*(1+k*(3-5*(z/r)**2))*z/r,
+        ]
+        np.testing.assert_allclose(g[idx], expected, rtol=1e-13, atol=0)
+        np.testing.assert_allclose(Gravity(x, y, z).toList(), g[idx],
+                                   rtol=1e-14, atol=0)
+
+    np.testing.assert_allclose(getGravity(np.array([6378137.0, 0, 0])),
+                               [[-9.814197355899799, 0, 0]],
+                               atol=ABSOLUTE_TOLERANCE, rtol=RELATIVE_TOLERANCE)
+
+    with pytest.raises(ValueError):
+        getGravity(np.zeros((3, 2)))
+
+
+@pytest.mark.parametrize("degree", [1, 2, 3, 4, 6])
+def test_getGravity_zonals(degree):
+    """the gravity shall be the gradient of the zonal potential
+    U = mu/r (1 - sum(Jn (a/r)^n Pn(z/r)))"""
+    earth = EarthModel()
+
+    def potential(position):
+        r = np.linalg.norm(position)
+        coefficients = np.zeros(degree + 1)
+        for n in range(2, degree + 1):
+            coefficients[n] = earth.zonals[n - 2] * (earth.a / r)**n
+        return earth.mu / r * (1 - np.polynomial.legendre.legval(
+            position[2] / r, coefficients))
+
+    rng = np.random.default_rng(degree)
+    for _ in range(10):
+        position = rng.normal(size=3)
+        position *= rng.uniform(6.4e6, 4.2e7) / np.linalg.norm(position)
+
+        gradient = [(potential(position + delta) -
+                     potential(position - delta)) / 2
+                    for delta in np.eye(3)]
+        np.testing.assert_allclose(getGravity(position, degree=degree)[0],
+                                   gradient, rtol=0, atol=1e-7)
+
+    assert Gravity(7e6, 0, 1e6, degree=degree).toList() == \
+        getGravity([7e6, 0, 1e6], degree=degree)[0].tolist()
+
+
+def test_getGravity_degree():
+    position = np.array([[4e6, 3e6, 4e6]])
+
+    # point mass
+    r = np.linalg.norm(position)
+    np.testing.assert_allclose(getGravity(position, degree=1),
+                               -EarthModel.mu / r**3 * position)
+
+    # higher degree terms are small corrections of J2
+    g2 = getGravity(position)
+    g6 = getGravity(position, degree=6)
+    assert 0 < np.linalg.norm(g6 - g2) < 1e-2 * np.linalg.norm(
+        g2 - getGravity(position, degree=1))
+
+    assert len(EarthModel().zonals) == EarthModel().maxDegree - 1
+    np.testing.assert_array_equal(getGravity(position, "SPHERICAL", 6),
+                                  getGravity(position, degree=1))
+
+    with pytest.raises(ValueError):
+        getGravity(position, degree=7)
+
+    with pytest.raises(ValueError):
+        getGravity(position, degree=0)
+
+    with pytest.raises(TypeError):
+        getGravity(position, degree=2.0)
+
+
+@pytest.mark.parametrize("degree", [1, 2, 6])
+def test_getGravityGradient(degree):
+    """shall be the (symmetric, traceless) Jacobian of the gravity"""
+    rng = np.random.default_rng(23)
+    positions = rng.normal(size=(100, 3))
+    positions *= (rng.uniform(6.4e6, 4.2e7, 100)
+                  / np.linalg.norm(positions, axis=1))[:, np.newaxis]
+
+    gradient = getGravityGradient(positions, degree=degree)
+    assert gradient.shape == (100, 3, 3)
+
+    step = 10.
+    expected = np.stack(
+        [(getGravity(positions + step * delta, degree=degree) -
+          getGravity(positions - step * delta, degree=degree)) / (2 * step)
+         for delta in np.eye(3)], axis=-1)
+    np.testing.assert_allclose(gradient, expected, rtol=0,
+                               atol=1e-9 * np.abs(gradient).max())
+
+    np.testing.assert_allclose(gradient, np.transpose(gradient, (0, 2, 1)),
+                               rtol=0, atol=1e-20)
+    np.testing.assert_allclose(np.trace(gradient, axis1=1, axis2=2), 0,
+                               atol=1e-20)
+
+    np.testing.assert_array_equal(
+        Gravity(*positions[0], degree=degree).toGradient(), gradient[0])
+
+    # point mass: mu/r^3 (3 rr^T/r^2 - I)
+    r = np.linalg.norm(positions[0])
+    unit = positions[0] / r
+    if degree == 1:
+        np.testing.assert_allclose(
+            gradient[0], EarthModel.mu / r**3 * (3 * np.outer(unit, unit) -
+                                                 np.eye(3)),
+            rtol=1e-14, atol=1e-20)
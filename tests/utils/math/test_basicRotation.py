@@ -28,7 +28,11 @@ def test_rotx_error():
     with pytest.raises(RotationMatrixError):
         rotx("a")
     with pytest.raises(RotationMatrixError):
-        rotx([1,2])
+        rotx([[1,2],[3]])
+    with pytest.raises(RotationMatrixError):
+        rotx(None)
+    with pytest.raises(RotationMatrixError):
+        rotx([0.1, None])
 
 def test_rotx_determinant(randomAngleArray):
     """The function rotx shall have a determinant equal to 1
@@ -89,7 +93,7 @@ def test_roty_error():
         roty("a")
         
     with pytest.raises(RotationMatrixError):
-        roty([1,2])
+        roty([[1,2],[3]])
 
 def test_rotz_determinant(randomAngleArray):
     """The function roty shall have a determinant equal to 1
@@ -123,7 +127,20 @@ def test_rotz_error():
     with pytest.raises(RotationMatrixError):
         rotz("a")
     with pytest.raises(RotationMatrixError):
-        rotz([1,2])
+        rotz([[1,2],[3]])
+
+def test_rot_stack(randomAngleArray):
+    """an array of angles shall provide a stack of rotation matrices"""
+    for function in (rotx, roty, rotz):
+        M = function(randomAngleArray)
+        assert M.shape == (NB_OBJ, 3, 3)
+
+        for idx, angle in enumerate(randomAngleArray):
+            np.testing.assert_allclose(M[idx], function(angle),
+                                       atol=ABSOLUTE_TOLERANCE)
+
+        np.testing.assert_allclose(np.linalg.det(M), 1.0)
+        assert function([1, 2]).shape == (2, 3, 3)
 
 #---------------- TOOLS ----------------
 def compare_column_vector(X,X_expected,nb_digit= NB_DECIMAL):
@@ -5,6 +5,7 @@
 import dragonfly
 
 import numpy as np
+import pytest
 
 
 ABSOLUTE_TOLERANCE = 1e-12
@@ -27,3 +28,57 @@ def test_skew_matrix():
     np.testing.assert_allclose(res, expected_res,
                                atol=ABSOLUTE_TOLERANCE,
                                rtol=RELATIVE_TOLERANCE)
+
+
+def test_skew_matrices():
+    """stacked skew matrices shall be equal to the matrix of each vector"""
+    vectors = np.random.uniform(-10, 10, (100, 3))
+    M = dragonfly.utils.math.skew_matrices(vectors)
+    assert M.shape == (100, 3, 3)
+
+    for idx, vector in enumerate(vectors):
+        np.testing.assert_allclose(M[idx],
+                                   dragonfly.utils.math.skew_matrix(vector),
+                                   atol=ABSOLUTE_TOLERANCE)
+
+    assert dragonfly.utils.math.skew_matrices([1, 2, 3]).shape == (1, 3, 3)
+
+    with pytest.raises(ValueError):
+        dragonfly.utils.math.skew_matrices(np.zeros((4, 2)))
+
+
+def test_cross_product():
+    u = np.random.uniform(-10, 10, (100, 3))
+    v = np.random.uniform(-10, 10, (100, 3))
+
+    np.testing.assert_allclose(dragonfly.utils.math.cross_product(u, v),
+                               np.cross(u, v), atol=ABSOLUTE_TOLERANCE)
+    np.testing.assert_allclose(
+        dragonfly.utils.math.cross_product(u, v),
+        np.einsum("nij,nj->ni", dragonfly.utils.math.skew_matrices(u), v),
+        atol=ABSOLUTE_TOLERANCE)
+
+    # broadcast of a single vector
+    np.testing.assert_allclose(
+        dragonfly.utils.math.cross_product([0, 0, 1], v),
+        np.cross([0, 0, 1], v), atol=ABSOLUTE_TOLERANCE)
+
+    with pytest.raises(ValueError):
+        dragonfly.utils.math.cross_product(u, v[:3])
+
+
+def test_double_cross_product():
+    omega = np.array([0, 0, 7.292115e-5])
+    r = np.random.uniform(-7e6, 7e6, (100, 3))
+
+    np.testing.assert_allclose(
+        dragonfly.utils.math.double_cross_product(omega, r),
+        np.cross(omega, np.cross(omega, r)), rtol=1e-12, atol=1e-15)
+
+    u = np.random.uniform(-10, 10, (100, 3))
+    np.testing.assert_allclose(
+        dragonfly.utils.math.double_cross_product(u, r),
+        np.cross(u, np.cross(u, r)), rtol=1e-9, atol=1e-6)
+
+    with pytest.raises(ValueError):
+        dragonfly.utils.math.double_cross_product(u[:3], r)
@@ -94,6 +94,17 @@ def test__validateInstance() -> None:
     
     pass
 
+def test_validateInteger():
+    # good value (Python and numpy integers)
+    for value in (0, 7, -3, np.int64(7), np.uint8(7), np.int32(-3)):
+        valOut = dgf.utils.validation.validateInteger(value)
+        assert valOut == value and type(valOut) is int
+
+    # wrong data type
+    for value in (7.0, np.float64(7), True, np.bool_(True), "7", None):
+        with pytest.raises(TypeError):
+            dgf.utils.validation.validateInteger(value)
+
 def test_validateTupleInstances():
     
     #bad params
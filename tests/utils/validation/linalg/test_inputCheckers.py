@@ -1,6 +1,7 @@
 """ UNIT TESTS FOR INPUT CHECKERS"""
 
-from dragonfly.utils.validation import input_check_3x1, input_check_3x3
+from dragonfly.utils.validation import (input_check_3x1, input_check_3x3,
+                                        validateVectorArray)
 
 import pytest
 import numpy as np
@@ -77,7 +78,24 @@ def test_input_check_3x3():
 
 
     pass
-    
+
+
+def test_validateVectorArray():
+    """ Check behavior of validateVectorArray"""
+
+    # bad value
+    for value in ([1, 2], np.zeros((2, 4)), np.zeros((2, 3, 3)), "a"):
+        with pytest.raises(ValueError):
+            validateVectorArray(value)
+
+    # good value: single vector and stack of vectors
+    value = validateVectorArray([1, 2, 3])
+    assert value.shape == (1, 3) and value.dtype == np.float64
+    assess_NP_object(value, np.array([[1., 2., 3.]]))
+
+    value = np.arange(12.).reshape((4, 3))
+    assess_NP_object(validateVectorArray(value), value)
+
 # ==================================  TOOLS  ==================================  
 def assess_NP_object(X,X_expected):
     np.testing.assert_allclose(X,X_expected,atol=ABSOLUTE_TOLERANCE,rtol=RELATIVE_TOLERANCE)
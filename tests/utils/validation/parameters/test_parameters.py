@@ -0,0 +1,37 @@
+""" UNIT TESTS FOR MODEL PARAMETERS VALIDATION"""
+
+from dragonfly.utils.validation import (validateDegree,
+                                        validateRotationSequence)
+
+import pytest
+
+
+def test_validateDegree():
+    # wrong data type
+    for value in (2., "2", None):
+        with pytest.raises(TypeError):
+            validateDegree(value, 6)
+
+    # out of range
+    for value in (0, -1, 7):
+        with pytest.raises(ValueError):
+            validateDegree(value, 6)
+
+    # good value
+    for value in (1, 2, 6):
+        assert validateDegree(value, 6) == value
+
+
+def test_validateRotationSequence():
+    # wrong data type
+    with pytest.raises(TypeError):
+        validateRotationSequence(None)
+
+    # unknown sequences
+    for value in ("XXY", "XY", "ABC"):
+        with pytest.raises(ValueError):
+            validateRotationSequence(value)
+
+    # good value (case insensitive)
+    assert validateRotationSequence("zyx") == "ZYX"
+    assert validateRotationSequence("ZXZ") == "ZXZ"